@@ -0,0 +1,67 @@
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process import Process, Workload
+from scheduler import Scheduler
+
+
+class DictProcess:
+    def __init__(self, pid, arrival, burst, priority=0):
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.remaining = burst
+        self.priority = priority
+        self.waiting_time = 0
+        self.turnaround_time = 0
+        self.completion_time = 0
+        self.start_time = -1
+        self.response_time = -1
+
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    obj = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return obj, size
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rnd = random.Random(42)
+    pids = [f"P{i:07}" for i in range(n)]
+    arrivals = sorted(rnd.randint(0, n * 4) for _ in range(n))
+    bursts = [rnd.randint(1, 1000) for _ in range(n)]
+    priorities = [rnd.randint(1, 3) for _ in range(n)]
+
+    rows = []
+
+    _, size = measure(lambda: [DictProcess(*row) for row in zip(pids, arrivals, bursts, priorities)])
+    rows.append(('Process (__dict__, önceki)', size))
+
+    _, size = measure(lambda: [Process(*row) for row in zip(pids, arrivals, bursts, priorities)])
+    rows.append(('Process (__slots__)', size))
+
+    workload, size = measure(lambda: Workload(pids, arrivals, bursts, priorities))
+    rows.append(('Workload (sütunlar)', size))
+
+    scheduler = Scheduler()
+    _, size = measure(lambda: scheduler.fcfs(workload)['processes'])
+    rows.append(('ProcessResults (çalıştırma başına)', size))
+
+    print(f"{n} süreç için süreç başına bellek:")
+    print("-" * 60)
+    for name, size in rows:
+        print(f"{name:40} {size / n:8.1f} bayt")
+    print("-" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheduler import Scheduler
+from timeline import discard
+from workload_generator import BURST_DISTRIBUTIONS, PRIORITY_DISTRIBUTIONS, generate_workload
+
+ALGORITHMS = [
+    ('fcfs', ()),
+    ('sjf_nonpreemptive', ()),
+    ('sjf_preemptive', ()),
+    ('round_robin', (4,)),
+    ('priority_nonpreemptive', ()),
+    ('priority_preemptive', ()),
+    ('mlfq', ()),
+    ('cfs', ())
+]
+
+
+def run_once(scheduler, method_name, workload, args):
+    start = time.perf_counter()
+    results = getattr(scheduler, method_name)(workload, *args)
+    return time.perf_counter() - start, len(results['time_table'])
+
+
+def peak_memory(scheduler, method_name, workload, args):
+    tracemalloc.start()
+    try:
+        getattr(scheduler, method_name)(workload, *args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(sizes, algorithms, seed, repeat, measure_memory, workload_options):
+    scheduler = Scheduler(timeline=discard())
+    records = []
+
+    for size in sizes:
+        workload = generate_workload(size, seed=seed, **workload_options)
+
+        for method_name, args in algorithms:
+            wall_time, events = min(run_once(scheduler, method_name, workload, args) for _ in range(repeat))
+            record = {
+                'algorithm': method_name,
+                'size': size,
+                'wall_time': wall_time,
+                'events': events,
+                'events_per_sec': events / wall_time if wall_time > 0 else 0,
+                'peak_memory': peak_memory(scheduler, method_name, workload, args) if measure_memory else None
+            }
+            records.append(record)
+            print(f"{method_name:24} n={size:<10} {wall_time:9.4f}s "
+                  f"{record['events_per_sec']:14,.0f} olay/s")
+
+    return records
+
+
+def find_regressions(records, baseline, tolerance):
+    reference = {(r['algorithm'], r['size']): r['wall_time'] for r in baseline['results']}
+    regressions = []
+    for record in records:
+        base = reference.get((record['algorithm'], record['size']))
+        if base and record['wall_time'] > base * (1 + tolerance):
+            regressions.append({
+                'algorithm': record['algorithm'],
+                'size': record['size'],
+                'baseline': base,
+                'current': record['wall_time'],
+                'slowdown': record['wall_time'] / base
+            })
+    return regressions
+
+
+def parse_sizes(value):
+    return [int(float(size)) for size in value.split(',')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zamanlama algoritmaları için performans ölçümü")
+    parser.add_argument('--sizes', type=parse_sizes, default=[100, 1000, 10000, 100000],
+                        help="virgülle ayrılmış süreç sayıları (örn. 1e2,1e4,1e6)")
+    parser.add_argument('--algorithms', default=','.join(name for name, _ in ALGORITHMS),
+                        help="virgülle ayrılmış algoritma adları")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--load', type=float, default=0.9)
+    parser.add_argument('--mean-burst', type=float, default=10)
+    parser.add_argument('--burst-distribution', choices=BURST_DISTRIBUTIONS, default='pareto')
+    parser.add_argument('--pareto-alpha', type=float, default=1.5)
+    parser.add_argument('--priority-distribution', choices=PRIORITY_DISTRIBUTIONS, default='uniform')
+    parser.add_argument('--priority-levels', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help="tepe bellek ölçümünü atla")
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', help="karşılaştırılacak önceki JSON sonuç dosyası")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="izin verilen göreli yavaşlama (varsayılan: 0.2)")
+    args = parser.parse_args()
+
+    selected = set(args.algorithms.split(','))
+    algorithms = [(name, extra) for name, extra in ALGORITHMS if name in selected]
+    workload_options = {
+        'load': args.load,
+        'mean_burst': args.mean_burst,
+        'burst_distribution': args.burst_distribution,
+        'pareto_alpha': args.pareto_alpha,
+        'priority_distribution': args.priority_distribution,
+        'priority_levels': args.priority_levels
+    }
+
+    records = run_benchmarks(args.sizes, algorithms, args.seed, args.repeat,
+                             not args.no_memory, workload_options)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'workload': workload_options
+        },
+        'results': records
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = find_regressions(records, json.load(f), args.tolerance)
+        report['regressions'] = regressions
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Sonuçlar kaydedildi: {args.output}")
+
+    for r in regressions:
+        print(f"YAVAŞLAMA: {r['algorithm']} n={r['size']}: "
+              f"{r['baseline']:.4f}s -> {r['current']:.4f}s ({r['slowdown']:.2f}x)")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import os
+import random
+import sys
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process import Workload
+
+BURST_DISTRIBUTIONS = ('pareto', 'exponential', 'uniform')
+PRIORITY_DISTRIBUTIONS = ('uniform', 'zipf', 'bimodal')
+
+
+def _priority_weights(distribution, levels):
+    if distribution == 'uniform':
+        return [1] * levels
+    if distribution == 'zipf':
+        return [1 / k for k in range(1, levels + 1)]
+    if distribution == 'bimodal':
+        weights = [0.05] * levels
+        weights[0] = weights[-1] = 1
+        return weights
+    raise ValueError(f"Bilinmeyen öncelik dağılımı: {distribution}")
+
+
+def _bursts(rnd, n, distribution, mean_burst, pareto_alpha, max_burst):
+    if distribution == 'pareto':
+        scale = mean_burst * (pareto_alpha - 1) / pareto_alpha
+        draw = lambda: scale * rnd.paretovariate(pareto_alpha)
+    elif distribution == 'exponential':
+        draw = lambda: rnd.expovariate(1 / mean_burst)
+    elif distribution == 'uniform':
+        draw = lambda: rnd.uniform(1, 2 * mean_burst - 1)
+    else:
+        raise ValueError(f"Bilinmeyen burst dağılımı: {distribution}")
+
+    bursts = array('q')
+    for _ in range(n):
+        bursts.append(min(max(1, round(draw())), max_burst))
+    return bursts
+
+
+def generate_workload(n, seed=0, load=0.9, mean_burst=10, burst_distribution='pareto',
+                      pareto_alpha=1.5, max_burst=None, priority_distribution='uniform',
+                      priority_levels=3):
+    rnd = random.Random(seed)
+    max_burst = max_burst or 1000 * mean_burst
+
+    bursts = _bursts(rnd, n, burst_distribution, mean_burst, pareto_alpha, max_burst)
+
+    arrival_rate = load / mean_burst
+    arrivals = array('q')
+    clock = 0.0
+    for _ in range(n):
+        clock += rnd.expovariate(arrival_rate)
+        arrivals.append(int(clock))
+
+    weights = _priority_weights(priority_distribution, priority_levels)
+    priorities = array('q', rnd.choices(range(1, priority_levels + 1), weights, k=n))
+
+    pids = [f"P{i:07}" for i in range(n)]
+    return Workload(pids, arrivals, bursts, priorities, presorted=True)
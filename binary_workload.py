@@ -0,0 +1,152 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from process import Workload
+from utils import load_workload
+
+MAGIC = b'CPUWL001'
+HEADER = struct.Struct('<8sQQQ')
+RECORD_FIELDS = 4
+RECORD_SIZE = RECORD_FIELDS * 8
+CHUNK_RECORDS = 65536
+
+
+class InternedPids:
+    __slots__ = ('offsets', 'blob', 'ids')
+
+    def __init__(self, offsets, blob, ids):
+        self.offsets = offsets
+        self.blob = blob
+        self.ids = ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        pid_id = self.ids[i]
+        return str(self.blob[self.offsets[pid_id]:self.offsets[pid_id + 1]], 'utf-8')
+
+    def __iter__(self):
+        for i in range(len(self.ids)):
+            yield self[i]
+
+
+class MappedWorkload(Workload):
+    __slots__ = ('path',)
+
+    def __init__(self, path, pids, arrivals, bursts, priorities):
+        super().__init__(pids, arrivals, bursts, priorities, presorted=True)
+        self.path = path
+
+    def __reduce__(self):
+        return (load_binary, (self.path,))
+
+
+def write_workload(workload, path):
+    table = {}
+    blob = bytearray()
+    offsets = array('Q', [0])
+    n = len(workload)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, n, 0, 0))
+
+        for chunk_start in range(0, n, CHUNK_RECORDS):
+            records = array('q')
+            for i in range(chunk_start, min(chunk_start + CHUNK_RECORDS, n)):
+                pid = workload.pids[i]
+                pid_id = table.get(pid)
+                if pid_id is None:
+                    pid_id = table[pid] = len(table)
+                    blob += str(pid).encode('utf-8')
+                    offsets.append(len(blob))
+                records.extend((workload.arrivals[i], workload.bursts[i], workload.priorities[i], pid_id))
+            if sys.byteorder != 'little':
+                records.byteswap()
+            f.write(records.tobytes())
+
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        f.write(offsets.tobytes())
+        f.write(blob)
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, n, len(table), 0))
+
+    return path
+
+
+def convert_csv(csv_path, bin_path):
+    workload = load_workload(csv_path)
+    if workload is None:
+        return None
+    return write_workload(workload, bin_path)
+
+
+def _sections(view, source):
+    if sys.byteorder != 'little':
+        raise ValueError("İkili iş yükü formatı yalnızca little-endian sistemlerde eşlenebilir")
+
+    if len(view) < HEADER.size:
+        raise ValueError(f"{source} geçerli bir iş yükü dosyası değil")
+    magic, n, n_pids, _ = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError(f"{source} geçerli bir iş yükü dosyası değil")
+
+    records_end = HEADER.size + n * RECORD_SIZE
+    offsets_end = records_end + (n_pids + 1) * 8
+    if len(view) < offsets_end:
+        raise ValueError(f"{source} eksik veya bozuk")
+
+    records = view[HEADER.size:records_end].cast('q')
+    offsets = view[records_end:offsets_end].cast('Q')
+    blob = view[offsets_end:]
+    if offsets[n_pids] > len(blob):
+        raise ValueError(f"{source} eksik veya bozuk")
+    return records, offsets, blob
+
+
+def decode_workload(data, source="ikili veri"):
+    records, offsets, blob = _sections(memoryview(data), source)
+    pid_ids = records[3::RECORD_FIELDS]
+    if any(pid_id >= len(offsets) - 1 for pid_id in pid_ids) or any(pid_id < 0 for pid_id in pid_ids):
+        raise ValueError(f"{source} eksik veya bozuk")
+
+    arrivals = array('q', records[0::RECORD_FIELDS])
+    bursts = array('q', records[1::RECORD_FIELDS])
+    if any(burst <= 0 for burst in bursts) or any(arrival < 0 for arrival in arrivals):
+        raise ValueError("Varış zamanları negatif, çalışma süreleri sıfır veya negatif olamaz")
+
+    return Workload(
+        list(InternedPids(offsets, blob, pid_ids)),
+        arrivals,
+        bursts,
+        array('q', records[2::RECORD_FIELDS])
+    )
+
+
+def load_binary(path):
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    records, offsets, blob = _sections(memoryview(mapped), path)
+
+    return MappedWorkload(
+        os.path.abspath(path),
+        InternedPids(offsets, blob, records[3::RECORD_FIELDS]),
+        records[0::RECORD_FIELDS],
+        records[1::RECORD_FIELDS],
+        records[2::RECORD_FIELDS]
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Kullanım: python binary_workload.py <girdi.csv> <çıktı.bin>")
+        sys.exit(1)
+
+    if convert_csv(sys.argv[1], sys.argv[2]) is None:
+        sys.exit(1)
+    print(f"İkili iş yükü kaydedildi: {sys.argv[2]}")
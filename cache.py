@@ -0,0 +1,147 @@
+import functools
+import hashlib
+import json
+import os
+import pickle
+import zlib
+from array import array
+import instrumentation
+import process
+import scheduler
+import sketch
+import timeline
+from process import ProcessResults
+
+FORMAT_VERSION = 1
+SKIPPED_FIELDS = ('processes', 'time_table', 'checkpoints', 'instrumentation', 'cache_key')
+
+
+def _int_column(values):
+    try:
+        return array('q', values)
+    except (TypeError, OverflowError):
+        return list(values)
+
+
+@functools.lru_cache(maxsize=None)
+def code_version():
+    digest = hashlib.sha256()
+    for module in (process, scheduler, timeline, sketch, instrumentation):
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def workload_digest(workload):
+    digest = hashlib.sha256(str(len(workload)).encode())
+    for column in (workload.arrivals, workload.bursts, workload.priorities):
+        packed = _int_column(list(column))
+        digest.update(packed.tobytes() if isinstance(packed, array) else repr(packed).encode())
+    digest.update('\0'.join(map(str, workload.pids)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def result_key(digest, algorithm, params):
+    payload = json.dumps([FORMAT_VERSION, code_version(), digest, algorithm, params], default=repr)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CachedTimeTable:
+    __slots__ = ('pids', 'starts', 'pid_ids', 'durations')
+
+    def __init__(self, pids, starts, pid_ids, durations):
+        self.pids = pids
+        self.starts = starts
+        self.pid_ids = pid_ids
+        self.durations = durations
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        pids = self.pids
+        for start, pid_id, duration in zip(self.starts, self.pid_ids, self.durations):
+            yield (start, pids[pid_id] if pid_id >= 0 else "IDLE", duration)
+
+
+def _encode(results):
+    processes = results['processes']
+    pid_ids = {pid: i for i, pid in enumerate(processes.workload.pids)}
+    time_table = list(results['time_table'])
+
+    return {
+        'fields': {name: value for name, value in results.items() if name not in SKIPPED_FIELDS},
+        'processes': (
+            _int_column(list(processes.start_times)),
+            _int_column(list(processes.completion_times)),
+            _int_column(list(processes.response_times))
+        ),
+        'time_table': (
+            _int_column([entry[0] for entry in time_table]),
+            _int_column([pid_ids.get(entry[1], -1) for entry in time_table]),
+            _int_column([entry[2] for entry in time_table])
+        )
+    }
+
+
+def _decode(payload, workload):
+    results = dict(payload['fields'])
+    results['processes'] = ProcessResults(workload, *payload['processes'])
+    results['time_table'] = CachedTimeTable(workload.pids, *payload['time_table'])
+    return results
+
+
+class ResultCache:
+    def __init__(self, directory=".cache/results", max_bytes=256 << 20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def get(self, key, workload):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError):
+            os.remove(path)
+            return None
+
+        os.utime(path)
+        results = _decode(payload, workload)
+        results['cache_key'] = key
+        return results
+
+    def put(self, key, results):
+        data = zlib.compress(pickle.dumps(_encode(results), pickle.HIGHEST_PROTOCOL))
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        results['cache_key'] = key
+        self.evict()
+
+    def evict(self):
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith('.bin'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
@@ -0,0 +1,254 @@
+import heapq
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from process import Process, Workload
+from sketch import QuantileSketch
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Sütunlu arka uç için numpy gereklidir: pip install numpy")
+
+
+def _column(values):
+    array = np.asarray(values)
+    if array.dtype.kind in 'iub':
+        return array.astype(np.int64, copy=False)
+    return array.astype(np.float64, copy=False)
+
+
+def _sketch_of(values):
+    sketch = QuantileSketch()
+    if not len(values):
+        return sketch
+    low = values.min().item()
+    if low < 0:
+        raise ValueError(f"Eskize negatif değer eklenemez: {low}")
+    positive = values[values > 0]
+    if len(positive):
+        indexes = np.ceil(np.log(positive) / sketch.log_gamma).astype(np.int64)
+        offset = indexes.min().item()
+        counts = np.bincount(indexes - offset)
+        filled = np.flatnonzero(counts)
+        sketch.buckets = dict(zip((filled + offset).tolist(), counts[filled].tolist()))
+    sketch.zero_count = len(values) - len(positive)
+    sketch.count = len(values)
+    sketch.total = values.sum().item()
+    sketch.min = low
+    sketch.max = values.max().item()
+    return sketch
+
+
+class ColumnarWorkload:
+    def __init__(self, pids, arrival, burst, priority=None):
+        _require_numpy()
+        arrival = _column(arrival)
+        burst = _column(burst)
+        if priority is None:
+            priority = np.zeros(len(arrival), dtype=np.int64)
+        priority = _column(priority)
+        pids = np.asarray(pids, dtype=object)
+
+        if len(arrival) > 1 and not np.all(arrival[1:] >= arrival[:-1]):
+            order = np.argsort(arrival, kind='stable')
+            pids, arrival, burst, priority = pids[order], arrival[order], burst[order], priority[order]
+
+        self.pids = pids
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority
+
+    @classmethod
+    def from_processes(cls, processes):
+        if isinstance(processes, Workload):
+            return cls(processes.pids, processes.arrivals, processes.bursts, processes.priorities)
+        return cls(
+            [p.pid for p in processes],
+            [p.arrival for p in processes],
+            [p.burst for p in processes],
+            [p.priority for p in processes]
+        )
+
+    def __len__(self):
+        return len(self.arrival)
+
+
+class ColumnarResult:
+    def __init__(self, workload):
+        n = len(workload)
+        time_dtype = np.result_type(workload.arrival, workload.burst)
+        self.workload = workload
+        self.remaining = workload.burst.copy()
+        self.start_time = np.full(n, -1, dtype=time_dtype)
+        self.completion_time = np.zeros(n, dtype=time_dtype)
+        self.turnaround_time = np.zeros(n, dtype=time_dtype)
+        self.waiting_time = np.zeros(n, dtype=time_dtype)
+        self.response_time = np.full(n, -1, dtype=time_dtype)
+        self.order = np.arange(n)
+
+    def __len__(self):
+        return len(self.workload)
+
+    def __iter__(self):
+        w = self.workload
+        for i in range(len(w)):
+            process = Process(w.pids[i], w.arrival[i].item(), w.burst[i].item(), w.priority[i].item())
+            process.remaining = self.remaining[i].item()
+            process.start_time = self.start_time[i].item()
+            process.completion_time = self.completion_time[i].item()
+            process.turnaround_time = self.turnaround_time[i].item()
+            process.waiting_time = self.waiting_time[i].item()
+            process.response_time = self.response_time[i].item()
+            yield process
+
+
+class ColumnarTimeTable:
+    def __init__(self, result):
+        self.result = result
+
+    def __iter__(self):
+        result = self.result
+        pids = result.workload.pids
+        order = result.order.tolist()
+        starts = result.start_time[result.order].tolist()
+        completions = result.completion_time[result.order].tolist()
+        bursts = result.workload.burst[result.order].tolist()
+        current_time = 0
+        for k, idx in enumerate(order):
+            if starts[k] > current_time:
+                yield (current_time, "IDLE", starts[k] - current_time)
+            yield (starts[k], pids[idx], bursts[k])
+            current_time = completions[k]
+
+    def __len__(self):
+        result = self.result
+        if not len(result):
+            return 0
+        completions = result.completion_time[result.order]
+        starts = result.start_time[result.order]
+        idle = np.count_nonzero(starts[1:] > completions[:-1]) + int(starts[0] > 0)
+        return len(result) + idle
+
+
+class ColumnarScheduler:
+    def __init__(self, context_switch_time=0.001):
+        _require_numpy()
+        self.context_switch_time = context_switch_time
+
+    def metric_sketches(self, result):
+        wait = _sketch_of(result.waiting_time)
+        return {
+            'wait': wait,
+            'turnaround': _sketch_of(result.turnaround_time),
+            'response': QuantileSketch(wait.relative_accuracy).merge(wait)
+        }
+
+    def calculate_metrics(self, result, sketches=None):
+        if sketches is None:
+            sketches = self.metric_sketches(result)
+        n = len(result)
+        if not n:
+            metrics = {
+                'avg_wait': 0,
+                'avg_turnaround': 0,
+                'max_wait': 0,
+                'max_turnaround': 0,
+                'total_wait': 0,
+                'total_turnaround': 0
+            }
+        else:
+            total_wait = result.waiting_time.sum().item()
+            total_turnaround = result.turnaround_time.sum().item()
+            metrics = {
+                'avg_wait': total_wait / n,
+                'avg_turnaround': total_turnaround / n,
+                'max_wait': result.waiting_time.max().item(),
+                'max_turnaround': result.turnaround_time.max().item(),
+                'total_wait': total_wait,
+                'total_turnaround': total_turnaround
+            }
+        metrics['avg_response'] = sketches['response'].mean()
+        metrics['percentiles'] = {name: sketch.percentiles() for name, sketch in sketches.items()}
+        metrics['percentile_error'] = sketches['wait'].relative_accuracy
+        return metrics
+
+    def calculate_throughput(self, result, time_points):
+        completions = np.sort(result.completion_time)
+        counts = np.searchsorted(completions, np.asarray(time_points), side='right')
+        return dict(zip(time_points, counts.tolist()))
+
+    def calculate_cpu_efficiency(self, result, total_time, context_switches):
+        total_burst = result.workload.burst.sum().item()
+        total_context_time = context_switches * self.context_switch_time
+        efficiency = total_burst / (total_time + total_context_time) if total_time > 0 else 0
+        return efficiency * 100
+
+    def _apply_order(self, result, order):
+        w = result.workload
+        if order is None:
+            order = np.arange(len(w))
+            arrival, burst, slots = w.arrival, w.burst, slice(None)
+        else:
+            arrival, burst, slots = w.arrival[order], w.burst[order], order
+        finished = np.cumsum(burst)
+        before = finished - burst
+        start = np.maximum.accumulate(np.maximum(arrival - before, 0)) + before
+        completion = start + burst
+
+        result.order = order
+        result.start_time[slots] = start
+        result.completion_time[slots] = completion
+        result.turnaround_time[slots] = completion - arrival
+        result.waiting_time[slots] = start - arrival
+        result.remaining[:] = 0
+
+        total_time = completion[-1].item() if len(order) else 0
+        context_switches = len(order)
+
+        sketches = self.metric_sketches(result)
+        return {
+            'processes': result,
+            'time_table': ColumnarTimeTable(result),
+            'metrics': self.calculate_metrics(result, sketches),
+            'sketches': sketches,
+            'total_time': total_time,
+            'context_switches': context_switches
+        }
+
+    def _select_order(self, workload, key):
+        arrival = workload.arrival.tolist()
+        burst = workload.burst.tolist()
+        key = key.tolist()
+        n = len(arrival)
+        order = []
+        ready = []
+        current_time = 0
+        cursor = 0
+
+        while len(order) != n:
+            if not ready and arrival[cursor] > current_time:
+                current_time = arrival[cursor]
+            while cursor < n and arrival[cursor] <= current_time:
+                heapq.heappush(ready, (key[cursor], cursor))
+                cursor += 1
+            _, idx = heapq.heappop(ready)
+            order.append(idx)
+            current_time += burst[idx]
+
+        return np.asarray(order, dtype=np.int64)
+
+    def fcfs(self, workload, out=None):
+        result = out if out is not None else ColumnarResult(workload)
+        return self._apply_order(result, None)
+
+    def sjf_nonpreemptive(self, workload, out=None):
+        result = out if out is not None else ColumnarResult(workload)
+        return self._apply_order(result, self._select_order(workload, workload.burst))
+
+    def priority_nonpreemptive(self, workload, out=None):
+        result = out if out is not None else ColumnarResult(workload)
+        return self._apply_order(result, self._select_order(workload, workload.priority))
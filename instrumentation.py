@@ -0,0 +1,62 @@
+import cProfile
+import functools
+import io
+import pstats
+import threading
+import tracemalloc
+
+PROFILERS = ('cprofile', 'tracemalloc')
+
+_profile_lock = threading.RLock()
+
+
+def _run_cprofile(func, args, kwargs, top):
+    profiler = cProfile.Profile()
+    results = profiler.runcall(func, *args, **kwargs)
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(top)
+    return results, {'type': 'cprofile', 'stats': stream.getvalue()}
+
+
+def _run_tracemalloc(func, args, kwargs, top):
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    elif hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    else:
+        limit = tracemalloc.get_traceback_limit()
+        tracemalloc.stop()
+        tracemalloc.start(limit)
+    before = tracemalloc.take_snapshot()
+    try:
+        results = func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+        stats = tracemalloc.take_snapshot().compare_to(before, 'lineno')[:top]
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return results, {'type': 'tracemalloc', 'peak_bytes': peak, 'top': [str(stat) for stat in stats]}
+
+
+def profile_call(mode, func, *args, top=25, **kwargs):
+    if mode not in PROFILERS:
+        raise ValueError(f"Bilinmeyen profil modu: {mode} (seçenekler: {', '.join(PROFILERS)})")
+
+    with _profile_lock:
+        if mode == 'cprofile':
+            results, report = _run_cprofile(func, args, kwargs, top)
+        else:
+            results, report = _run_tracemalloc(func, args, kwargs, top)
+
+    results.setdefault('instrumentation', {})['profile'] = report
+    return results
+
+
+def profiled(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.profile is None:
+            return method(self, *args, **kwargs)
+        return profile_call(self.profile, method, self, *args, **kwargs)
+    return wrapper
@@ -1,39 +1,200 @@
+import atexit
 import json
+import multiprocessing
+import os
+import queue
+import random
+import sys
+import threading
+import time
 from datetime import datetime
 
-class Logger:
-    def __init__(self):
-        self.logs = []
-        self.start_time = datetime.now()
+LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40}
+
+STATUS_LEVELS = {
+    'START': 'INFO',
+    'SUCCESS': 'INFO',
+    'INFO': 'INFO',
+    'ERROR': 'ERROR'
+}
+
+STATUS_COLORS = {
+    'START': '\033[94m',
+    'SUCCESS': '\033[92m',
+    'ERROR': '\033[91m',
+    'INFO': '\033[93m'
+}
+
+RESET_COLOR = '\033[0m'
+
+BATCH_SIZE = 1024
+
+_STOP = None
+
+def _format_timestamp(created):
+    stamp = datetime.fromtimestamp(created)
+    return f"{stamp:%Y-%m-%d %H:%M:%S}.{stamp.microsecond // 1000:03d}"
+
+class _Emitter:
+    def __init__(self, level='INFO', sample_rate=1.0):
+        if level not in LEVELS:
+            raise ValueError(f"Bilinmeyen log seviyesi: {level} (seçenekler: {', '.join(LEVELS)})")
+        if not 0 < sample_rate <= 1:
+            raise ValueError("Örnekleme oranı 0 ile 1 arasında olmalıdır")
+        self.level = level
+        self.threshold = LEVELS[level]
+        self.sample_rate = sample_rate
     
-    def log(self, algorithm, case, status, message=""):
-        log_entry = {
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'algorithm': algorithm,
-            'case': case,
-            'status': status,
-            'message': message
-        }
-        
-        self.logs.append(log_entry)
+    def _put(self, record):
+        raise NotImplementedError
+    
+    def _sampled_out(self):
+        pass
+    
+    def log(self, algorithm, case, status, message="", data=None, level=None):
+        level = level or STATUS_LEVELS.get(status, 'INFO')
+        severity = LEVELS[level]
+        if severity < self.threshold:
+            return
+        if severity < LEVELS['WARNING'] and self.sample_rate < 1 and random.random() >= self.sample_rate:
+            self._sampled_out()
+            return
         
-        status_color = {
-            'START': '\033[94m',
-            'SUCCESS': '\033[92m',
-            'ERROR': '\033[91m',
-            'INFO': '\033[93m'
-        }.get(status, '\033[0m')
+        self._put((time.time(), level, algorithm, case, status, message, data,
+                   os.getpid(), threading.current_thread().name))
+
+class WorkerLogger(_Emitter):
+    def __init__(self, records, level='INFO', sample_rate=1.0):
+        super().__init__(level, sample_rate)
+        self.records = records
+        self.dropped = 0
+    
+    def _sampled_out(self):
+        self.dropped += 1
+    
+    def _put(self, record):
+        self.flush()
+        self.records.put(record)
+    
+    def flush(self):
+        if self.dropped:
+            self.records.put(self.dropped)
+            self.dropped = 0
+
+class Logger(_Emitter):
+    def __init__(self, filename="execution_log.jsonl", level='INFO', sample_rate=1.0, console=True):
+        super().__init__(level, sample_rate)
+        self.filename = filename
+        self.console = console
+        self.start_time = datetime.now()
+        self.records = queue.SimpleQueue()
+        self.written = 0
+        self.dropped = 0
+        self.drop_lock = threading.Lock()
+        self.process_records = None
+        self.relay = None
+        self.closed = False
+        self.owner = os.getpid()
         
-        reset_color = '\033[0m'
-        print(f"{status_color}[{status}] {algorithm} - {case}: {message}{reset_color}")
-    
-    def save_logs(self, filename="execution_log.json"):
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump({
-                'start_time': self.start_time.strftime("%Y-%m-%d %H:%M:%S"),
-                'end_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                'duration': str(datetime.now() - self.start_time),
-                'logs': self.logs
-            }, f, indent=2, ensure_ascii=False)
+        self.file = open(filename, 'w', encoding='utf-8')
+        self.writer = threading.Thread(target=self._write_loop, name="logger-writer", daemon=True)
+        self.writer.start()
+        atexit.register(self.close)
+    
+    def _put(self, record):
+        self.records.put(record)
+    
+    def _sampled_out(self, count=1):
+        with self.drop_lock:
+            self.dropped += count
+    
+    def worker_logger(self):
+        if self.process_records is None:
+            self.process_records = multiprocessing.Queue()
+            self.relay = threading.Thread(target=self._relay_loop, name="logger-relay", daemon=True)
+            self.relay.start()
+        return WorkerLogger(self.process_records, self.level, self.sample_rate)
+    
+    def _relay_loop(self):
+        while True:
+            record = self.process_records.get()
+            if record is _STOP:
+                return
+            if isinstance(record, int):
+                self._sampled_out(record)
+            else:
+                self.records.put(record)
+    
+    def _write_loop(self):
+        records = self.records
+        while True:
+            batch = [records.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(records.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = _STOP in batch
+            lines = []
+            console = []
+            for record in batch:
+                if record is _STOP:
+                    continue
+                created, level, algorithm, case, status, message, data, pid, thread = record
+                entry = {
+                    'timestamp': _format_timestamp(created),
+                    'level': level,
+                    'algorithm': algorithm,
+                    'case': case,
+                    'status': status,
+                    'message': message,
+                    'pid': pid,
+                    'thread': thread
+                }
+                if data is not None:
+                    entry['data'] = data
+                lines.append(json.dumps(entry, ensure_ascii=False, default=str) + '\n')
+                if self.console:
+                    color = STATUS_COLORS.get(status, RESET_COLOR)
+                    console.append(f"{color}[{status}] {algorithm} - {case}: {message}{RESET_COLOR}\n")
+            
+            if lines:
+                self.file.write(''.join(lines))
+                self.file.flush()
+                self.written += len(lines)
+            if console:
+                sys.stdout.write(''.join(console))
+                sys.stdout.flush()
+            if stop:
+                return
+    
+    def _stop_relay(self):
+        if self.relay is not None:
+            self.process_records.put(_STOP)
+            self.relay.join()
+            self.process_records.close()
+            self.relay = None
+    
+    def close(self):
+        if self.closed or os.getpid() != self.owner:
+            return
+        self.closed = True
+        self._stop_relay()
+        self.records.put(_STOP)
+        self.writer.join()
+        self.file.close()
+        atexit.unregister(self.close)
+    
+    def save_logs(self):
+        self._stop_relay()
+        end_time = datetime.now()
+        self._put((end_time.timestamp(), 'INFO', "LOGGER", "-", "INFO", "Log özeti", {
+            'start_time': self.start_time.strftime("%Y-%m-%d %H:%M:%S"),
+            'end_time': end_time.strftime("%Y-%m-%d %H:%M:%S"),
+            'duration': str(end_time - self.start_time),
+            'sampled_out': self.dropped
+        }, os.getpid(), threading.current_thread().name))
+        self.close()
         
-        print(f"Loglar kaydedildi: {filename}")
\ No newline at end of file
+        print(f"Loglar kaydedildi: {self.filename} ({self.written} kayıt)")
@@ -1,24 +1,64 @@
+import argparse
 import sys
 import os
-from process import Process
-from scheduler import Scheduler
-from utils import read_csv, create_output_dir, save_results
-from logger import Logger
+from scheduler import DEFAULT_TIME_POINTS, Scheduler
+from instrumentation import PROFILERS
+from utils import load_workload, create_output_dir, save_results
+from binary_workload import load_binary
+from logger import LEVELS, Logger
 from thread_runner import ThreadRunner
+from pool_runner import ALGORITHMS, PoolRunner
+from cache import ResultCache, result_key, workload_digest
+from result_writer import EXPORT_FORMATS
+from sweep import parse_values
 
-def create_process_objects(process_data):
-    processes = []
-    for data in process_data:
-        process = Process(
-            pid=data['pid'],
-            arrival=data['arrival'],
-            burst=data['burst'],
-            priority=data['priority']
-        )
-        processes.append(process)
-    return processes
+def load_case(case_name):
+    csv_file = f"data/{case_name}.csv"
+    bin_file = f"data/{case_name}.bin"
+    
+    if os.path.exists(bin_file) and (not os.path.exists(csv_file) or
+                                     os.path.getmtime(bin_file) >= os.path.getmtime(csv_file)):
+        return load_binary(bin_file)
+    
+    return load_workload(csv_file)
+
+def log_instrumentation(logger, alg_name, case_name, results):
+    if 'instrumentation' in results:
+        logger.log(alg_name, case_name, "INFO", "Ölçüm sayaçları", data=results['instrumentation'])
+
+THROUGHPUT_DEFAULTS = {'time_points': DEFAULT_TIME_POINTS, 'throughput_window': None}
+
+def cache_key(digest, method_name, args, context_switch_time, throughput_options=THROUGHPUT_DEFAULTS):
+    params = [list(args), context_switch_time, list(throughput_options['time_points'])]
+    if throughput_options['throughput_window']:
+        params.append(throughput_options['throughput_window'])
+    return result_key(digest, method_name, params)
+
+def cached_outcomes(cache, digest, workload, context_switch_time, throughput_options=THROUGHPUT_DEFAULTS):
+    if cache is None:
+        return None
+    
+    outcomes = {}
+    for alg_name, method_name, args in ALGORITHMS:
+        results = cache.get(cache_key(digest, method_name, args, context_switch_time, throughput_options), workload)
+        if results is None:
+            return None
+        results.setdefault('execution_time', 0.0)
+        outcomes[alg_name] = {'algorithm': alg_name, 'results': results, 'success': True}
+    return outcomes
+
+def store_outcomes(cache, digest, outcomes, context_switch_time, throughput_options=THROUGHPUT_DEFAULTS):
+    if cache is None:
+        return
+    
+    for alg_name, method_name, args in ALGORITHMS:
+        outcome = outcomes.get(alg_name)
+        if outcome and outcome['success']:
+            cache.put(cache_key(digest, method_name, args, context_switch_time, throughput_options),
+                      outcome['results'])
 
-def run_sequential(scheduler, processes, case_name, output_dir):
+def run_sequential(scheduler, processes, case_name, output_dir, logger, cache=None, digest=None, export=(),
+                   throughput_options=THROUGHPUT_DEFAULTS):
     algorithms = [
         ('fcfs', scheduler.fcfs, [processes]),
         ('sjf_nonpreemptive', scheduler.sjf_nonpreemptive, [processes]),
@@ -35,21 +75,31 @@ def run_sequential(scheduler, processes, case_name, output_dir):
         print(f"{alg_name.upper()} çalıştırılıyor...")
         print(f"{'='*60}")
         
-        scheduler.context_switches = 0
-        
         try:
-            alg_result = alg_func(*args)
-            
-            time_points = [50, 100, 150, 200]
-            alg_result['throughput'] = scheduler.calculate_throughput(
-                alg_result['processes'], time_points
-            )
+            key = cache_key(digest, alg_name, args[1:], scheduler.context_switch_time,
+                            throughput_options) if cache else None
+            alg_result = cache.get(key, processes) if cache else None
             
-            alg_result['cpu_efficiency'] = scheduler.calculate_cpu_efficiency(
-                alg_result['processes'], alg_result['total_time']
-            )
+            if alg_result is None:
+                alg_result = alg_func(*args)
+                
+                alg_result.update(scheduler.throughput_report(
+                    alg_result['processes'], throughput_options['time_points'],
+                    throughput_options['throughput_window']
+                ))
+                
+                alg_result['cpu_efficiency'] = scheduler.calculate_cpu_efficiency(
+                    alg_result['processes'], alg_result['total_time'],
+                    alg_result['context_switches']
+                )
+                
+                if cache:
+                    cache.put(key, alg_result)
+            else:
+                print("Sonuç önbellekten alındı")
             
-            save_results(alg_result, alg_name, case_name, output_dir)
+            save_results(alg_result, alg_name, case_name, output_dir, export)
+            log_instrumentation(logger, alg_name, case_name, alg_result)
             results[alg_name] = alg_result
             
             print(f"✓ {alg_name} başarıyla tamamlandı")
@@ -59,29 +109,84 @@ def run_sequential(scheduler, processes, case_name, output_dir):
     
     return results
 
-def run_concurrent(scheduler, processes, case_name, output_dir, logger):
+def run_concurrent(scheduler, processes, case_name, output_dir, logger, cache=None, digest=None, export=(),
+                   throughput_options=THROUGHPUT_DEFAULTS):
     print(f"\n{'='*60}")
     print(f"EŞ ZAMANLI ÇALIŞTIRMA (BONUS) - {case_name.upper()}")
     print(f"{'='*60}")
     
-    runner = ThreadRunner(scheduler, processes, case_name, output_dir)
+    all_results = cached_outcomes(cache, digest, processes, scheduler.context_switch_time, throughput_options)
     
-    logger.log("THREAD_RUNNER", case_name, "START", "Tüm algoritmalar eş zamanlı başlatılıyor...")
-    
-    all_results = runner.run_all_algorithms()
+    if all_results is None:
+        runner = ThreadRunner(scheduler, processes, case_name, output_dir, **throughput_options)
+        
+        logger.log("THREAD_RUNNER", case_name, "START", "Tüm algoritmalar eş zamanlı başlatılıyor...")
+        
+        all_results = runner.run_all_algorithms()
+        store_outcomes(cache, digest, all_results, scheduler.context_switch_time, throughput_options)
+    else:
+        logger.log("THREAD_RUNNER", case_name, "INFO", "Tüm sonuçlar önbellekten alındı")
     
     for alg_name, result_data in all_results.items():
         if result_data['success']:
             file_name = alg_name.lower().replace(' ', '_')
-            save_results(result_data['results'], file_name, case_name, output_dir)
+            save_results(result_data['results'], file_name, case_name, output_dir, export)
             logger.log(alg_name, case_name, "SUCCESS", 
                       f"Tamamlandı (süre: {result_data['results']['execution_time']:.3f}s)")
+            log_instrumentation(logger, alg_name, case_name, result_data['results'])
         else:
             logger.log(alg_name, case_name, "ERROR", result_data['error'])
     
     return all_results
 
-def generate_report(results, case_name, concurrent_mode=False):
+def run_parallel(workloads, output_dirs, workers, logger, cache=None, export=(),
+                 throughput_options=THROUGHPUT_DEFAULTS, **scheduler_options):
+    print(f"\n{'='*60}")
+    print(f"PARALEL ÇALIŞTIRMA - {', '.join(name.upper() for name in workloads)}")
+    print(f"{'='*60}")
+    
+    context_switch_time = Scheduler(**scheduler_options).context_switch_time
+    digests = {}
+    cached = {}
+    pending = {}
+    for case_name, workload in workloads.items():
+        digests[case_name] = workload_digest(workload) if cache else None
+        outcomes = cached_outcomes(cache, digests[case_name], workload, context_switch_time, throughput_options)
+        if outcomes is None:
+            pending[case_name] = workload
+        else:
+            cached[case_name] = outcomes
+            logger.log("POOL_RUNNER", case_name, "INFO", "Tüm sonuçlar önbellekten alındı")
+    
+    if pending:
+        runner = PoolRunner(pending, workers, logger=logger.worker_logger(), **throughput_options,
+                            **scheduler_options)
+        
+        for case_name in pending:
+            logger.log("POOL_RUNNER", case_name, "START",
+                      f"Tüm algoritmalar {runner.workers} işçi süreçte başlatılıyor...")
+        
+        cached.update(runner.run_all_cases())
+        for case_name in pending:
+            store_outcomes(cache, digests[case_name], cached[case_name], context_switch_time, throughput_options)
+    
+    all_results = {case_name: cached[case_name] for case_name in workloads}
+    
+    for case_name, case_results in all_results.items():
+        for alg_name, result_data in case_results.items():
+            if result_data['success']:
+                file_name = alg_name.lower().replace(' ', '_')
+                save_results(result_data['results'], file_name, case_name, output_dirs[case_name], export)
+                logger.log(alg_name, case_name, "SUCCESS", 
+                          f"Tamamlandı (süre: {result_data['results']['execution_time']:.3f}s)")
+                log_instrumentation(logger, alg_name, case_name, result_data['results'])
+            else:
+                logger.log(alg_name, case_name, "ERROR", result_data['error'])
+    
+    return all_results
+
+def generate_report(results, case_name, concurrent_mode=False, time_points=DEFAULT_TIME_POINTS):
+    report_point = time_points[(len(time_points) - 1) // 2]
     report_file = f"docs/{case_name}_report.txt"
     
     os.makedirs("docs", exist_ok=True)
@@ -94,10 +199,13 @@ def generate_report(results, case_name, concurrent_mode=False):
         
         f.write("ALGORİTMA KARŞILAŞTIRMASI\n")
         f.write("-"*80 + "\n")
-        f.write("Algoritma | Ort. Bekleme | Ort. Tamamlanma | Throughput(T=100) | CPU Verim. | Bağlam Değiş.\n")
+        f.write(f"Algoritma | Ort. Bekleme | Ort. Tamamlanma | {f'Throughput(T={report_point})':17} | "
+                "CPU Verim. | Bağlam Değiş.\n")
         f.write("-"*80 + "\n")
         
         for alg_name, result in results.items():
+            if isinstance(result, dict) and not result.get('success', True):
+                continue
             if isinstance(result, dict) and 'results' in result:
                 alg_data = result['results']
             else:
@@ -111,7 +219,7 @@ def generate_report(results, case_name, concurrent_mode=False):
             f.write(f"{alg_name[:15]:15} | "
                    f"{metrics['avg_wait']:12.2f} | "
                    f"{metrics['avg_turnaround']:15.2f} | "
-                   f"{throughput.get(100, 0):17} | "
+                   f"{throughput.get(report_point, 0):17} | "
                    f"{efficiency:10.2f}% | "
                    f"{context_switches:13}\n")
         
@@ -138,9 +246,10 @@ def generate_report(results, case_name, concurrent_mode=False):
     
     print(f"\nRapor oluşturuldu: {report_file}")
     
-    generate_html_report(results, case_name, concurrent_mode)
+    generate_html_report(results, case_name, concurrent_mode, time_points)
 
-def generate_html_report(results, case_name, concurrent_mode=False):
+def generate_html_report(results, case_name, concurrent_mode=False, time_points=DEFAULT_TIME_POINTS):
+    report_point = time_points[(len(time_points) - 1) // 2]
     html_file = f"docs/{case_name}_report.html"
     
     with open(html_file, 'w', encoding='utf-8') as f:
@@ -182,7 +291,7 @@ def generate_html_report(results, case_name, concurrent_mode=False):
                     <th>Algoritma</th>
                     <th>Ort. Bekleme Süresi</th>
                     <th>Ort. Tamamlanma Süresi</th>
-                    <th>Throughput (T=100)</th>
+                    <th>Throughput (T=""" + str(report_point) + """)</th>
                     <th>CPU Verimliliği</th>
                     <th>Bağlam Değiştirme</th>
                 </tr>
@@ -190,6 +299,8 @@ def generate_html_report(results, case_name, concurrent_mode=False):
             <tbody>""")
         
         for alg_name, result in results.items():
+            if isinstance(result, dict) and not result.get('success', True):
+                continue
             if isinstance(result, dict) and 'results' in result:
                 alg_data = result['results']
             else:
@@ -205,7 +316,7 @@ def generate_html_report(results, case_name, concurrent_mode=False):
                     <td><strong>{alg_name}</strong></td>
                     <td>{metrics['avg_wait']:.2f}</td>
                     <td>{metrics['avg_turnaround']:.2f}</td>
-                    <td>{throughput.get(100, 0)}</td>
+                    <td>{throughput.get(report_point, 0)}</td>
                     <td>{efficiency:.2f}%</td>
                     <td>{context_switches}</td>
                 </tr>""")
@@ -228,6 +339,8 @@ def generate_html_report(results, case_name, concurrent_mode=False):
         <h2>DETAYLI SONUÇLAR</h2>""")
         
         for alg_name, result in results.items():
+            if isinstance(result, dict) and not result.get('success', True):
+                continue
             if isinstance(result, dict) and 'results' in result:
                 alg_data = result['results']
                 exec_time = alg_data.get('execution_time', 0)
@@ -235,15 +348,14 @@ def generate_html_report(results, case_name, concurrent_mode=False):
                 alg_data = result
                 exec_time = 0
             
+            throughput_rows = "".join(f"""
+            <p><strong>Throughput (T={T}):</strong> {alg_data['throughput'].get(T, 0)} süreç</p>"""
+                                      for T in time_points)
             f.write(f"""
         <div class="algorithm">
             <h3>{alg_name.upper()}</h3>
             <p><strong>Çalışma Süresi:</strong> {exec_time:.3f} saniye</p>
-            <p><strong>Toplam Süre:</strong> {alg_data['total_time']} birim</p>
-            <p><strong>Throughput (T=50):</strong> {alg_data['throughput'].get(50, 0)} süreç</p>
-            <p><strong>Throughput (T=100):</strong> {alg_data['throughput'].get(100, 0)} süreç</p>
-            <p><strong>Throughput (T=150):</strong> {alg_data['throughput'].get(150, 0)} süreç</p>
-            <p><strong>Throughput (T=200):</strong> {alg_data['throughput'].get(200, 0)} süreç</p>
+            <p><strong>Toplam Süre:</strong> {alg_data['total_time']} birim</p>{throughput_rows}
         </div>""")
         
         f.write("""
@@ -258,50 +370,138 @@ def generate_html_report(results, case_name, concurrent_mode=False):
     
     print(f"HTML rapor oluşturuldu: {html_file}")
 
+def positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError("İşçi sayısı pozitif bir tam sayı olmalıdır!")
+    return number
+
+def export_formats(value):
+    formats = [fmt.strip().lower() for fmt in value.split(',') if fmt.strip()]
+    unknown = [fmt for fmt in formats if fmt not in EXPORT_FORMATS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"Bilinmeyen dışa aktarma biçimi: {', '.join(unknown)} (seçenekler: {', '.join(EXPORT_FORMATS)})"
+        )
+    return tuple(dict.fromkeys(formats))
+
+def time_point_list(value):
+    try:
+        points = parse_values(value, float)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz zaman noktaları: {value}")
+    return tuple(int(point) if point.is_integer() else point for point in points)
+
+def positive_number(value):
+    try:
+        number = float(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError("Throughput penceresi pozitif bir sayı olmalıdır!")
+    return int(number) if number.is_integer() else number
+
+def sample_rate(value):
+    try:
+        rate = float(value)
+    except ValueError:
+        rate = 0
+    if not 0 < rate <= 1:
+        raise argparse.ArgumentTypeError("Örnekleme oranı 0 ile 1 arasında olmalıdır!")
+    return rate
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="CPU Zamanlama Simülasyonu")
+    parser.add_argument('mode', type=str.lower, choices=['sequential', 'concurrent', 'parallel'],
+                        help="çalıştırma modu")
+    parser.add_argument('workers', nargs='?', type=positive_int,
+                        help="parallel modunda işçi süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--instrument', action='store_true',
+                        help="sayaçları ve faz sürelerini sonuçlara ve loglara ekle")
+    parser.add_argument('--profile', choices=PROFILERS,
+                        help="her algoritmayı cProfile veya tracemalloc altında çalıştır")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="sonuç önbelleğini kullanma, tüm algoritmaları yeniden çalıştır")
+    parser.add_argument('--cache-dir', default=".cache/results",
+                        help="sonuç önbelleği dizini (varsayılan: .cache/results)")
+    parser.add_argument('--cache-size', type=positive_int, default=256,
+                        help="önbelleğin MB cinsinden üst sınırı (varsayılan: 256)")
+    parser.add_argument('--time-points', type=time_point_list, default=DEFAULT_TIME_POINTS,
+                        help="throughput zaman noktaları: başlangıç:bitiş[:adım] veya virgülle ayrılmış liste "
+                             "(varsayılan: 50,100,150,200)")
+    parser.add_argument('--throughput-window', type=positive_number,
+                        help="verilen genişlikte pencerelerle zamana bağlı throughput oranlarını da hesapla")
+    parser.add_argument('--log-file', default="execution_log.jsonl",
+                        help="JSON Lines log dosyası (varsayılan: execution_log.jsonl)")
+    parser.add_argument('--log-level', type=str.upper, choices=list(LEVELS), default='INFO',
+                        help="bu seviyenin altındaki kayıtları atla (varsayılan: INFO)")
+    parser.add_argument('--log-sample', type=sample_rate, default=1.0,
+                        help="WARNING altındaki kayıtların tutulma oranı (varsayılan: 1.0)")
+    parser.add_argument('--export', type=export_formats, default=(),
+                        help="sonuçları ayrıca sütunlu biçimde dışa aktar: csv, npy, npz (virgülle ayrılmış)")
+    return parser.parse_args(argv)
+
 def main():
-    if len(sys.argv) < 2:
-        print("Kullanım: python main.py [sequential|concurrent]")
-        print("Örnek: python main.py concurrent")
-        sys.exit(1)
+    args = parse_args(sys.argv[1:])
+    mode = args.mode
+    workers = args.workers
+    scheduler_options = {'instrument': args.instrument, 'profile': args.profile}
+    throughput_options = {'time_points': args.time_points, 'throughput_window': args.throughput_window}
     
-    mode = sys.argv[1].lower()
-    if mode not in ['sequential', 'concurrent']:
-        print("Hata: Mod 'sequential' veya 'concurrent' olmalıdır!")
-        sys.exit(1)
+    cache = None
+    if not (args.no_cache or args.instrument or args.profile):
+        cache = ResultCache(args.cache_dir, args.cache_size << 20)
     
-    concurrent_mode = (mode == 'concurrent')
+    concurrent_mode = (mode != 'sequential')
     
-    logger = Logger()
+    logger = Logger(args.log_file, args.log_level, args.log_sample)
     
     case_files = ['case1', 'case2']
+    workloads = {}
+    output_dirs = {}
     
     for case_name in case_files:
         print(f"\n{'='*80}")
         print(f"{case_name.upper()} İŞLENİYOR...")
         print(f"{'='*80}")
         
-        csv_file = f"data/{case_name}.csv"
-        process_data = read_csv(csv_file)
+        workload = load_case(case_name)
         
-        if not process_data:
+        if not workload:
             print(f"{case_name} için veri bulunamadı!")
             continue
         
-        processes = create_process_objects(process_data)
         output_dir = create_output_dir(case_name)
         
-        print(f"\n{case_name} için {len(processes)} süreç yüklendi:")
-        for p in processes:
+        print(f"\n{case_name} için {len(workload)} süreç yüklendi:")
+        for p in workload:
             print(f"  {p}")
         
-        scheduler = Scheduler()
+        scheduler = Scheduler(**scheduler_options)
+        
+        if mode == 'parallel':
+            workloads[case_name] = workload
+            output_dirs[case_name] = output_dir
+            continue
         
+        digest = workload_digest(workload) if cache else None
         if concurrent_mode:
-            results = run_concurrent(scheduler, processes, case_name, output_dir, logger)
+            results = run_concurrent(scheduler, workload, case_name, output_dir, logger, cache, digest,
+                                     args.export, throughput_options)
         else:
-            results = run_sequential(scheduler, processes, case_name, output_dir)
+            results = run_sequential(scheduler, workload, case_name, output_dir, logger, cache, digest,
+                                     args.export, throughput_options)
         
-        generate_report(results, case_name, concurrent_mode)
+        generate_report(results, case_name, concurrent_mode, args.time_points)
+    
+    if workloads:
+        all_results = run_parallel(workloads, output_dirs, workers, logger, cache, args.export,
+                                   throughput_options, **scheduler_options)
+        for case_name, results in all_results.items():
+            generate_report(results, case_name, concurrent_mode, args.time_points)
     
     logger.save_logs()
     
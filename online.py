@@ -0,0 +1,209 @@
+import heapq
+from collections import deque
+from process import ProcessResult
+from sketch import QuantileSketch
+
+ALGORITHMS = ('fcfs', 'sjf_nonpreemptive', 'sjf_preemptive', 'round_robin',
+              'priority_nonpreemptive', 'priority_preemptive')
+
+
+class _Job:
+    __slots__ = ('seq', 'pid', 'arrival', 'burst', 'priority', 'remaining', 'start_time', 'response_time')
+
+    def __init__(self, seq, process):
+        self.seq = seq
+        self.pid = process.pid
+        self.arrival = process.arrival
+        self.burst = process.burst
+        self.priority = process.priority
+        self.remaining = process.burst
+        self.start_time = -1
+        self.response_time = -1
+
+
+class OnlineScheduler:
+    def __init__(self, algorithm='fcfs', quantum=4, timeline=None):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Bilinmeyen algoritma: {algorithm}")
+        if algorithm == 'round_robin' and quantum <= 0:
+            raise ValueError("Zaman dilimi pozitif olmalıdır")
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.timeline = timeline
+        self.round_robin = algorithm == 'round_robin'
+        self.preemptive = algorithm in ('sjf_preemptive', 'priority_preemptive')
+        self.records_start = algorithm in ('fcfs', 'sjf_nonpreemptive', 'priority_nonpreemptive')
+
+        self.current_time = 0
+        self.pending = deque()
+        self.ready = deque() if self.round_robin else []
+        self.running = None
+        self.slice_start = 0
+        self.slice_end = 0
+        self.requeue = None
+        self.prev = -1
+        self.submitted = 0
+
+        self.completed = 0
+        self.context_switches = 0
+        self.busy_time = 0
+        self.total_wait = 0
+        self.total_turnaround = 0
+        self.max_wait = 0
+        self.max_turnaround = 0
+        self.sketches = {'wait': QuantileSketch(), 'turnaround': QuantileSketch(), 'response': QuantileSketch()}
+
+    def _key(self, job):
+        if self.algorithm == 'fcfs':
+            return job.seq
+        if self.algorithm == 'sjf_nonpreemptive':
+            return job.burst
+        if self.algorithm == 'sjf_preemptive':
+            return job.remaining
+        return job.priority
+
+    def _push(self, job):
+        if self.round_robin:
+            self.ready.append(job)
+        else:
+            heapq.heappush(self.ready, (self._key(job), job.seq, job))
+
+    def _pop(self):
+        if self.round_robin:
+            return self.ready.popleft()
+        return heapq.heappop(self.ready)[2]
+
+    def _record(self, start, pid, duration):
+        if self.timeline is not None and duration > 0:
+            self.timeline.append((start, pid, duration))
+
+    def submit(self, process):
+        last_arrival = self.pending[-1].arrival if self.pending else self.current_time
+        if process.arrival < last_arrival:
+            raise ValueError(f"{process.pid} geç geldi: varış zamanı {process.arrival} < {last_arrival}")
+        self.pending.append(_Job(self.submitted, process))
+        self.submitted += 1
+
+    def _admit(self):
+        pending = self.pending
+        while pending and pending[0].arrival <= self.current_time:
+            self._push(pending.popleft())
+        if self.requeue is not None:
+            self._push(self.requeue)
+            self.requeue = None
+
+    def _dispatch(self):
+        job = self._pop()
+        now = self.current_time
+        if self.records_start:
+            job.start_time = now
+        elif job.response_time == -1:
+            job.response_time = now - job.arrival
+        if self.round_robin or self.prev != job.seq:
+            self.context_switches += 1
+        self.prev = job.seq
+
+        self.running = job
+        self.slice_start = now
+        self.slice_end = now + (min(self.quantum, job.remaining) if self.round_robin else job.remaining)
+
+    def _stop(self):
+        job = self.running
+        duration = self.current_time - self.slice_start
+        self._record(self.slice_start, job.pid, duration)
+        job.remaining -= duration
+        self.busy_time += duration
+        self.running = None
+        return job
+
+    def _complete(self, job):
+        result = ProcessResult(job.pid, job.arrival, job.burst, job.priority,
+                               job.start_time, self.current_time, job.response_time)
+        self.completed += 1
+        self.total_wait += result.waiting_time
+        self.total_turnaround += result.turnaround_time
+        self.max_wait = max(self.max_wait, result.waiting_time)
+        self.max_turnaround = max(self.max_turnaround, result.turnaround_time)
+        self.sketches['wait'].add(result.waiting_time)
+        self.sketches['turnaround'].add(result.turnaround_time)
+        self.sketches['response'].add(job.response_time if job.response_time != -1 else job.start_time - job.arrival)
+        return result
+
+    def _preempts(self):
+        if not self.ready:
+            return False
+        job = self.running
+        remaining = job.remaining - (self.current_time - self.slice_start)
+        running_key = remaining if self.algorithm == 'sjf_preemptive' else job.priority
+        return self.ready[0][0] < running_key
+
+    def advance(self, until):
+        if until < self.current_time:
+            raise ValueError(f"Zaman geri alınamaz: {until} < {self.current_time}")
+
+        completions = []
+        while self.current_time < until:
+            self._admit()
+
+            if self.running is None:
+                if not self.ready:
+                    if not self.pending and until == float('inf'):
+                        break
+                    next_time = min(self.pending[0].arrival, until) if self.pending else until
+                    self._record(self.current_time, "IDLE", next_time - self.current_time)
+                    self.current_time = next_time
+                    continue
+                self._dispatch()
+            elif self.preemptive and self._preempts():
+                job = self._stop()
+                self._push(job)
+                self._dispatch()
+
+            stop = min(self.slice_end, until)
+            if self.preemptive and self.pending and self.pending[0].arrival < stop:
+                stop = self.pending[0].arrival
+            self.current_time = stop
+
+            if stop == self.slice_end:
+                job = self._stop()
+                if job.remaining == 0:
+                    completions.append(self._complete(job))
+                else:
+                    self.requeue = job
+
+        if self.running is not None and self.current_time > self.slice_start:
+            job = self.running
+            self._record(self.slice_start, job.pid, self.current_time - self.slice_start)
+            self.busy_time += self.current_time - self.slice_start
+            job.remaining -= self.current_time - self.slice_start
+            self.slice_start = self.current_time
+
+        return completions
+
+    def drain(self):
+        return self.advance(float('inf'))
+
+    def metrics(self):
+        completed = self.completed
+        return {
+            'completed': completed,
+            'avg_wait': self.total_wait / completed if completed else 0,
+            'avg_turnaround': self.total_turnaround / completed if completed else 0,
+            'max_wait': self.max_wait,
+            'max_turnaround': self.max_turnaround,
+            'avg_response': self.sketches['response'].mean(),
+            'percentiles': {name: sketch.percentiles() for name, sketch in self.sketches.items()},
+            'total_wait': self.total_wait,
+            'total_turnaround': self.total_turnaround,
+            'context_switches': self.context_switches,
+            'busy_time': self.busy_time,
+            'current_time': self.current_time
+        }
+
+
+def stream(source, algorithm='fcfs', quantum=4, timeline=None):
+    scheduler = OnlineScheduler(algorithm, quantum, timeline)
+    for process in source:
+        yield from scheduler.advance(process.arrival)
+        scheduler.submit(process)
+    yield from scheduler.drain()
@@ -0,0 +1,107 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from process import ProcessResults
+from scheduler import DEFAULT_TIME_POINTS, Scheduler
+
+ALGORITHMS = [
+    ('FCFS', 'fcfs', ()),
+    ('SJF Non-Preemptive', 'sjf_nonpreemptive', ()),
+    ('SJF Preemptive', 'sjf_preemptive', ()),
+    ('Round Robin', 'round_robin', (4,)),
+    ('Priority Non-Preemptive', 'priority_nonpreemptive', ()),
+    ('Priority Preemptive', 'priority_preemptive', ())
+]
+
+_worker_workloads = {}
+_worker_scheduler_options = {}
+_worker_throughput = (DEFAULT_TIME_POINTS, None)
+_worker_logger = None
+
+
+def _init_worker(workloads, scheduler_options, throughput, logger):
+    global _worker_workloads, _worker_scheduler_options, _worker_throughput, _worker_logger
+    _worker_workloads = workloads
+    _worker_scheduler_options = scheduler_options
+    _worker_throughput = throughput
+    _worker_logger = logger
+
+
+def _run_task(case_name, algorithm_name, method_name, args):
+    try:
+        scheduler = Scheduler(**_worker_scheduler_options)
+        workload = _worker_workloads[case_name]
+        if _worker_logger is not None:
+            _worker_logger.log(algorithm_name, case_name, "START", "İşçi süreçte başlatıldı", level='DEBUG')
+
+        start_time = time.perf_counter()
+        results = getattr(scheduler, method_name)(workload, *args)
+        end_time = time.perf_counter()
+
+        results.update(scheduler.throughput_report(results['processes'], *_worker_throughput))
+
+        results['cpu_efficiency'] = scheduler.calculate_cpu_efficiency(
+            results['processes'], results['total_time'],
+            results['context_switches']
+        )
+
+        results['execution_time'] = end_time - start_time
+        if _worker_logger is not None:
+            _worker_logger.log(algorithm_name, case_name, "SUCCESS",
+                               f"İşçi süreçte tamamlandı (süre: {results['execution_time']:.3f}s)", level='DEBUG')
+
+        processes = results['processes']
+        results['processes'] = (processes.start_times, processes.completion_times, processes.response_times)
+
+        return {
+            'algorithm': algorithm_name,
+            'results': results,
+            'success': True
+        }
+
+    except Exception as e:
+        return {
+            'algorithm': algorithm_name,
+            'error': str(e),
+            'success': False
+        }
+    finally:
+        if _worker_logger is not None:
+            _worker_logger.flush()
+
+
+class PoolRunner:
+    def __init__(self, workloads, workers=None, algorithms=None, time_points=DEFAULT_TIME_POINTS,
+                 throughput_window=None, logger=None, **scheduler_options):
+        self.workloads = workloads
+        self.workers = workers or os.cpu_count() or 1
+        self.algorithms = algorithms or ALGORITHMS
+        self.time_points = time_points
+        self.throughput_window = throughput_window
+        self.logger = logger
+        self.scheduler_options = scheduler_options
+
+    def run_all_cases(self):
+        tasks = [
+            (case_name, alg_name, method_name, args)
+            for case_name in self.workloads
+            for alg_name, method_name, args in self.algorithms
+        ]
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(tasks)) or 1,
+            initializer=_init_worker,
+            initargs=(self.workloads, self.scheduler_options, (self.time_points, self.throughput_window),
+                      self.logger)
+        ) as executor:
+            futures = [executor.submit(_run_task, *task) for task in tasks]
+            outcomes = [future.result() for future in futures]
+
+        all_results = {case_name: {} for case_name in self.workloads}
+        for (case_name, alg_name, _, _), outcome in zip(tasks, outcomes):
+            if outcome['success']:
+                results = outcome['results']
+                results['processes'] = ProcessResults(self.workloads[case_name], *results['processes'])
+            all_results[case_name][alg_name] = outcome
+
+        return all_results
@@ -1,4 +1,10 @@
+from itertools import islice
+
+
 class Process:
+    __slots__ = ('pid', 'arrival', 'burst', 'remaining', 'priority', 'waiting_time',
+                 'turnaround_time', 'completion_time', 'start_time', 'response_time')
+
     def __init__(self, pid, arrival, burst, priority=0):
         self.pid = pid
         self.arrival = arrival
@@ -10,6 +16,97 @@ class Process:
         self.completion_time = 0
         self.start_time = -1
         self.response_time = -1
-    
+
     def __repr__(self):
-        return f"Process({self.pid}, arrival={self.arrival}, burst={self.burst})"
\ No newline at end of file
+        return f"Process({self.pid}, arrival={self.arrival}, burst={self.burst})"
+
+
+def _freeze(column):
+    return tuple(column) if isinstance(column, list) else column
+
+
+class Workload:
+    __slots__ = ('pids', 'arrivals', 'bursts', 'priorities')
+
+    def __init__(self, pids, arrivals, bursts, priorities, presorted=False):
+        if presorted or all(a <= b for a, b in zip(arrivals, islice(arrivals, 1, None))):
+            self.pids = _freeze(pids)
+            self.arrivals = _freeze(arrivals)
+            self.bursts = _freeze(bursts)
+            self.priorities = _freeze(priorities)
+            return
+
+        order = sorted(range(len(arrivals)), key=arrivals.__getitem__)
+        self.pids = tuple(pids[i] for i in order)
+        self.arrivals = tuple(arrivals[i] for i in order)
+        self.bursts = tuple(bursts[i] for i in order)
+        self.priorities = tuple(priorities[i] for i in order)
+
+    @classmethod
+    def from_processes(cls, processes):
+        if isinstance(processes, cls):
+            return processes
+        processes = list(processes)
+        return cls(
+            [p.pid for p in processes],
+            [p.arrival for p in processes],
+            [p.burst for p in processes],
+            [p.priority for p in processes]
+        )
+
+    def __len__(self):
+        return len(self.arrivals)
+
+    def __getitem__(self, i):
+        return Process(self.pids[i], self.arrivals[i], self.bursts[i], self.priorities[i])
+
+    def __iter__(self):
+        for i in range(len(self.arrivals)):
+            yield self[i]
+
+
+class ProcessResult:
+    __slots__ = ('pid', 'arrival', 'burst', 'priority', 'start_time', 'completion_time',
+                 'turnaround_time', 'waiting_time', 'response_time')
+
+    def __init__(self, pid, arrival, burst, priority, start_time, completion_time, response_time):
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority
+        self.start_time = start_time
+        self.completion_time = completion_time
+        self.turnaround_time = completion_time - arrival
+        self.waiting_time = self.turnaround_time - burst
+        self.response_time = response_time
+
+    def __repr__(self):
+        return f"ProcessResult({self.pid}, completion={self.completion_time}, waiting={self.waiting_time})"
+
+
+class ProcessResults:
+    __slots__ = ('workload', 'start_times', 'completion_times', 'response_times')
+
+    def __init__(self, workload, start_times, completion_times, response_times):
+        self.workload = workload
+        self.start_times = start_times
+        self.completion_times = completion_times
+        self.response_times = response_times
+
+    def __len__(self):
+        return len(self.workload)
+
+    def __getitem__(self, i):
+        w = self.workload
+        return ProcessResult(w.pids[i], w.arrivals[i], w.bursts[i], w.priorities[i],
+                             self.start_times[i], self.completion_times[i], self.response_times[i])
+
+    def __iter__(self):
+        for i in range(len(self.workload)):
+            yield self[i]
+
+    def turnaround_times(self):
+        return [c - a for c, a in zip(self.completion_times, self.workload.arrivals)]
+
+    def waiting_times(self):
+        return [c - a - b for c, a, b in zip(self.completion_times, self.workload.arrivals, self.workload.bursts)]
@@ -0,0 +1,267 @@
+import csv
+import os
+import struct
+import sys
+import zipfile
+from array import array
+from itertools import chain, islice
+from process import ProcessResults
+from scheduler import DEFAULT_TIME_POINTS, Scheduler
+
+CHUNK_ROWS = 8192
+BUFFER_SIZE = 1 << 20
+EXPORT_FORMATS = ('csv', 'npy', 'npz')
+
+PROCESS_FIELDS = ('pid', 'arrival', 'burst', 'priority', 'start_time', 'completion_time',
+                  'turnaround_time', 'waiting_time', 'response_time')
+TIME_TABLE_FIELDS = ('start', 'pid', 'duration')
+
+NPY_MAGIC = b'\x93NUMPY\x01\x00'
+
+
+def pid_sort_key(pid):
+    pid = str(pid)
+    stem = pid.rstrip('0123456789')
+    digits = pid[len(stem):]
+    return (stem, int(digits) if digits else -1, pid)
+
+
+def process_columns(processes):
+    if isinstance(processes, ProcessResults):
+        workload = processes.workload
+        turnarounds = processes.turnaround_times()
+        return {
+            'pid': workload.pids,
+            'arrival': workload.arrivals,
+            'burst': workload.bursts,
+            'priority': workload.priorities,
+            'start_time': processes.start_times,
+            'completion_time': processes.completion_times,
+            'turnaround_time': turnarounds,
+            'waiting_time': [t - b for t, b in zip(turnarounds, workload.bursts)],
+            'response_time': processes.response_times
+        }
+    processes = list(processes)
+    return {field: [getattr(p, field) for p in processes] for field in PROCESS_FIELDS}
+
+
+def time_table_columns(time_table):
+    starts = []
+    pids = []
+    durations = []
+    for start, pid, duration in time_table:
+        starts.append(start)
+        pids.append(pid)
+        durations.append(duration)
+    return {'start': starts, 'pid': pids, 'duration': durations}
+
+
+def _write_rows(f, template, rows):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, CHUNK_ROWS))
+        if not chunk:
+            return
+        f.write((template * len(chunk)).format(*chain.from_iterable(chunk)))
+
+
+def write_text(results, algorithm_name, case_name, file_path):
+    processes = results['processes']
+    calculator = None
+
+    throughput = results.get('throughput')
+    if not throughput:
+        calculator = Scheduler()
+        throughput = calculator.calculate_throughput(processes, DEFAULT_TIME_POINTS)
+
+    efficiency = results.get('cpu_efficiency')
+    if efficiency is None:
+        calculator = calculator or Scheduler()
+        efficiency = calculator.calculate_cpu_efficiency(
+            processes, results['total_time'], results['context_switches']
+        )
+
+    columns = process_columns(processes)
+    pids = columns['pid']
+    keys = list(map(pid_sort_key, pids))
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+
+    with open(file_path, 'w', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+        f.write(f"=== {algorithm_name.upper()} - {case_name.upper()} ===\n\n")
+
+        f.write("Zaman Tablosu:\n")
+        f.write("-" * 50 + "\n")
+        _write_rows(f, "[{:3}] --- {:6} --- [{:3}]\n",
+                    ((start, pid, start + duration) for start, pid, duration in results['time_table']))
+        f.write("-" * 50 + "\n\n")
+
+        metrics = results['metrics']
+        f.write("METRİKLER:\n")
+        f.write("-" * 50 + "\n")
+        f.write(f"Ortalama Bekleme Süresi: {metrics['avg_wait']:.2f}\n")
+        f.write(f"Maksimum Bekleme Süresi: {metrics['max_wait']:.2f}\n")
+        f.write(f"Ortalama Tamamlanma Süresi: {metrics['avg_turnaround']:.2f}\n")
+        f.write(f"Maksimum Tamamlanma Süresi: {metrics['max_turnaround']:.2f}\n")
+        f.write(f"Toplam Bekleme Süresi: {metrics['total_wait']:.2f}\n")
+        f.write(f"Toplam Tamamlanma Süresi: {metrics['total_turnaround']:.2f}\n")
+        f.write("-" * 50 + "\n\n")
+
+        percentiles = metrics.get('percentiles')
+        if percentiles:
+            f.write(f"YÜZDELİKLER (göreli hata ≤ %{metrics['percentile_error'] * 100:g}):\n")
+            f.write("-" * 60 + "\n")
+            f.write("Metrik     |        p50 |        p95 |        p99 |      p99.9\n")
+            f.write("-" * 60 + "\n")
+            for label, name in (('Bekleme', 'wait'), ('Tamamlanma', 'turnaround'), ('Yanıt', 'response')):
+                values = percentiles[name]
+                f.write(f"{label:10} | {values['p50']:10.2f} | {values['p95']:10.2f} | "
+                        f"{values['p99']:10.2f} | {values['p99.9']:10.2f}\n")
+            f.write("-" * 60 + "\n\n")
+
+        f.write("THROUGHPUT:\n")
+        f.write("-" * 50 + "\n")
+        _write_rows(f, "T={}: {} süreç tamamlandı\n", throughput.items())
+        f.write("-" * 50 + "\n\n")
+
+        rates = results.get('throughput_rates')
+        if rates:
+            f.write(f"THROUGHPUT ORANLARI (pencere={results['throughput_window']}):\n")
+            f.write("-" * 50 + "\n")
+            _write_rows(f, "[{:>8}] {:.4f} süreç/birim\n", rates)
+            f.write("-" * 50 + "\n\n")
+
+        f.write("CPU VERİMLİLİĞİ:\n")
+        f.write("-" * 50 + "\n")
+        f.write(f"Ortalama CPU Verimliliği: {efficiency:.2f}%\n")
+        f.write(f"Toplam Bağlam Değiştirme Sayısı: {results['context_switches']}\n")
+        f.write("-" * 50 + "\n\n")
+
+        f.write("SÜREÇ DETAYLARI:\n")
+        f.write("-" * 80 + "\n")
+        f.write("PID | Arrival | Burst | Priority | Start | Completion | Turnaround | Waiting\n")
+        f.write("-" * 80 + "\n")
+
+        arrivals, bursts, priorities = columns['arrival'], columns['burst'], columns['priority']
+        starts, completions = columns['start_time'], columns['completion_time']
+        turnarounds, waits = columns['turnaround_time'], columns['waiting_time']
+        _write_rows(f, "{:3} | {:7} | {:5} | {:8} | {:5} | {:10} | {:10} | {:7}\n", (
+            (pids[i], arrivals[i], bursts[i], priorities[i],
+             starts[i] if starts[i] != -1 else 'N/A', completions[i], turnarounds[i], waits[i])
+            for i in order
+        ))
+        f.write("-" * 80 + "\n")
+
+        starvation = results.get('starvation')
+        if starvation:
+            longest_waits = starvation['longest_wait']
+            boosts = starvation['priority_boost']
+            f.write("\nAÇLIK İSTATİSTİKLERİ:\n")
+            f.write("-" * 50 + "\n")
+            f.write(f"Yaşlandırma Aralığı: {results['aging_interval']}\n")
+            f.write(f"Önceliği Yükseltilen Süreç Sayısı: {starvation['aged_processes']}\n")
+            f.write(f"En Uzun Kesintisiz Bekleme: {max(longest_waits, default=0)}\n")
+            f.write("-" * 50 + "\n")
+            f.write("PID | En Uzun Bekleme | Öncelik Artışı\n")
+            f.write("-" * 50 + "\n")
+            _write_rows(f, "{:3} | {:15} | {:14.2f}\n",
+                        ((pids[i], longest_waits[i], boosts[i]) for i in order))
+            f.write("-" * 50 + "\n")
+
+    return file_path
+
+
+def write_csv(columns, fields, file_path):
+    with open(file_path, 'w', newline='', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        rows = zip(*(columns[field] for field in fields))
+        while True:
+            chunk = list(islice(rows, CHUNK_ROWS))
+            if not chunk:
+                break
+            writer.writerows(chunk)
+    return file_path
+
+
+def _npy_column(values):
+    values = values if isinstance(values, (list, tuple, array)) else list(values)
+    if values and isinstance(values[0], str):
+        width = max(map(len, values)) or 1
+
+        def chunks():
+            for lo in range(0, len(values), CHUNK_ROWS):
+                chunk = values[lo:lo + CHUNK_ROWS]
+                yield ''.join(value.ljust(width, '\0') for value in chunk).encode('utf-32-le')
+        return f'<U{width}', len(values), chunks()
+
+    try:
+        data = array('q', values)
+        descr = '<i8'
+    except (TypeError, OverflowError):
+        data = array('d', values)
+        descr = '<f8'
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return descr, len(data), (data,)
+
+
+def _npy_header(descr, length):
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({length},), }}"
+    padding = -(len(NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header = header + ' ' * padding + '\n'
+    return NPY_MAGIC + struct.pack('<H', len(header)) + header.encode('latin-1')
+
+
+def _write_npy(f, values):
+    descr, length, chunks = _npy_column(values)
+    f.write(_npy_header(descr, length))
+    for chunk in chunks:
+        f.write(chunk)
+
+
+def _export_columns(results):
+    return [('process', process_columns(results['processes']), PROCESS_FIELDS),
+            ('time_table', time_table_columns(results['time_table']), TIME_TABLE_FIELDS)]
+
+
+def export_paths(output_dir, algorithm_name, formats):
+    paths = []
+    for fmt in formats:
+        if fmt == 'csv':
+            paths.append(f"{output_dir}/{algorithm_name}_processes.csv")
+            paths.append(f"{output_dir}/{algorithm_name}_time_table.csv")
+        elif fmt == 'npy':
+            paths.extend(f"{output_dir}/{algorithm_name}/{prefix}_{field}.npy"
+                         for prefix, fields in (('process', PROCESS_FIELDS), ('time_table', TIME_TABLE_FIELDS))
+                         for field in fields)
+        elif fmt == 'npz':
+            paths.append(f"{output_dir}/{algorithm_name}.npz")
+        else:
+            raise ValueError(f"Bilinmeyen dışa aktarma biçimi: {fmt} (seçenekler: {', '.join(EXPORT_FORMATS)})")
+    return paths
+
+
+def export_results(results, output_dir, algorithm_name, formats):
+    paths = export_paths(output_dir, algorithm_name, formats)
+    if not formats:
+        return paths
+    tables = _export_columns(results)
+
+    for fmt in formats:
+        if fmt == 'csv':
+            for (prefix, columns, fields), suffix in zip(tables, ('processes', 'time_table')):
+                write_csv(columns, fields, f"{output_dir}/{algorithm_name}_{suffix}.csv")
+        elif fmt == 'npy':
+            os.makedirs(f"{output_dir}/{algorithm_name}", exist_ok=True)
+            for prefix, columns, fields in tables:
+                for field in fields:
+                    path = f"{output_dir}/{algorithm_name}/{prefix}_{field}.npy"
+                    with open(path, 'wb', buffering=BUFFER_SIZE) as f:
+                        _write_npy(f, columns[field])
+        else:
+            with zipfile.ZipFile(f"{output_dir}/{algorithm_name}.npz", 'w', zipfile.ZIP_STORED) as archive:
+                for prefix, columns, fields in tables:
+                    for field in fields:
+                        with archive.open(f"{prefix}_{field}.npy", 'w', force_zip64=True) as f:
+                            _write_npy(f, columns[field])
+    return paths
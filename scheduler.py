@@ -1,409 +1,942 @@
-import copy
+import heapq
+import time
+from array import array
+from bisect import bisect_right
 from collections import deque
+from itertools import islice
+from process import Workload, ProcessResults
+from timeline import Timeline
+from instrumentation import profiled
+from sketch import QuantileSketch
+
+NICE_0_WEIGHT = 1024
+DEFAULT_TIME_POINTS = (50, 100, 150, 200)
+COMPARE_CHUNK = 4096
+
+def cfs_weight(priority):
+    nice = max(-20, min(19, (priority - 2) * 5))
+    return NICE_0_WEIGHT / 1.25 ** nice
+
+class Checkpoint:
+    __slots__ = ('key', 'time', 'horizon', 'cursor', 'state', 'pending', 'timeline_length', 'last_entry')
+    
+    def __init__(self, key, time, horizon, cursor, state, pending, timeline_length, last_entry):
+        self.key = key
+        self.time = time
+        self.horizon = horizon
+        self.cursor = cursor
+        self.state = state
+        self.pending = pending
+        self.timeline_length = timeline_length
+        self.last_entry = last_entry
+
+def _column_chunks(column, other, length):
+    if type(column) is type(other) and isinstance(column, (tuple, list, array)):
+        return (column[lo:min(lo + COMPARE_CHUNK, length)] for lo in range(0, length, COMPARE_CHUNK))
+    column = iter(column)
+    return (list(islice(column, min(COMPARE_CHUNK, length - lo))) for lo in range(0, length, COMPARE_CHUNK))
+
+def _first_difference(old, new):
+    changed = min(len(old), len(new))
+    for name in ('arrivals', 'bursts', 'priorities', 'pids'):
+        old_column, new_column = getattr(old, name), getattr(new, name)
+        chunks = zip(_column_chunks(old_column, new_column, changed), _column_chunks(new_column, old_column, changed))
+        for lo, (old_chunk, new_chunk) in zip(range(0, changed, COMPARE_CHUNK), chunks):
+            if old_chunk != new_chunk:
+                changed = lo + next(i for i, (a, b) in enumerate(zip(old_chunk, new_chunk)) if a != b)
+                break
+    return changed
+
+def _find_checkpoint(previous, workload, key):
+    checkpoints = previous.get('checkpoints') if previous else None
+    if not checkpoints:
+        return None, 0
+    
+    changed = _first_difference(previous['processes'].workload, workload)
+    n = len(workload)
+    for position in range(len(checkpoints) - 1, -1, -1):
+        checkpoint = checkpoints[position]
+        if checkpoint.key != key or checkpoint.cursor > changed:
+            continue
+        if checkpoint.cursor == n or workload.arrivals[checkpoint.cursor] > checkpoint.horizon:
+            return checkpoint, position
+    return None, 0
+
+class RunContext:
+    __slots__ = ('workload', 'time_table', 'start_times', 'completion_times', 'response_times',
+                 'context_switches', 'total_time', 'instrumentation', 'phase_started',
+                 'key', 'checkpoint_interval', 'checkpoints', 'next_checkpoint', 'resumed', 'sketches')
+    
+    def __init__(self, processes, time_table=None, instrument=False, key=None, checkpoint_interval=None):
+        started = time.perf_counter_ns() if instrument else 0
+        self.workload = Workload.from_processes(processes)
+        n = len(self.workload)
+        self.time_table = time_table if time_table is not None else []
+        self.start_times = [-1] * n
+        self.completion_times = [0] * n
+        self.response_times = [-1] * n
+        self.context_switches = 0
+        self.total_time = 0
+        self.instrumentation = None
+        self.key = key
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints = [] if checkpoint_interval is not None else None
+        self.next_checkpoint = 0 if checkpoint_interval is not None else float('inf')
+        self.resumed = None
+        self.sketches = None
+        
+        if instrument:
+            self.instrumentation = {'counters': {}, 'phases_ns': {}}
+            self.phase_started = started
+            self.end_phase('setup')
+    
+    def resume(self, previous, checkpoint, position, prefix):
+        old = previous['processes']
+        cursor = checkpoint.cursor
+        self.start_times[:cursor] = old.start_times[:cursor]
+        self.completion_times[:cursor] = old.completion_times[:cursor]
+        self.response_times[:cursor] = old.response_times[:cursor]
+        for idx, response_time in checkpoint.pending.items():
+            self.start_times[idx] = -1
+            self.completion_times[idx] = 0
+            self.response_times[idx] = response_time
+        
+        if checkpoint.timeline_length:
+            self.time_table.extend(prefix)
+            self.time_table.append(checkpoint.last_entry)
+        
+        if self.checkpoints is not None:
+            self.checkpoints.extend(previous['checkpoints'][:position + 1])
+            self.next_checkpoint = checkpoint.time + self.checkpoint_interval
+        self.resumed = checkpoint
+    
+    def save_checkpoint(self, time, horizon, cursor, pending, state):
+        time_table = self.time_table
+        timeline_length = len(time_table)
+        if not timeline_length:
+            last_entry = None
+        elif isinstance(time_table, Timeline):
+            last_entry = time_table.pending
+        else:
+            last_entry = time_table[-1]
+        
+        response_times = self.response_times
+        self.checkpoints.append(Checkpoint(
+            self.key, time, horizon, cursor, state,
+            {idx: response_times[idx] for idx in pending},
+            timeline_length, last_entry
+        ))
+        return time + self.checkpoint_interval
+    
+    def end_phase(self, name):
+        now = time.perf_counter_ns()
+        self.instrumentation['phases_ns'][name] = now - self.phase_started
+        self.phase_started = now
+    
+    def count(self, **counters):
+        if self.instrumentation is not None:
+            self.instrumentation['counters'].update(counters)
+    
+    def process_results(self):
+        return ProcessResults(self.workload, self.start_times, self.completion_times, self.response_times)
+
+class CompletionCurve:
+    __slots__ = ('times',)
+    
+    def __init__(self, completion_times):
+        self.times = sorted(completion_times)
+    
+    def completed_by(self, t):
+        return bisect_right(self.times, t)
+    
+    def throughput(self, time_points):
+        times = self.times
+        return {T: bisect_right(times, T) for T in time_points}
+    
+    def steps(self):
+        times = self.times
+        return [(t, i + 1) for i, t in enumerate(times) if i + 1 == len(times) or times[i + 1] != t]
+    
+    def rates(self, window, start=0, end=None):
+        if window <= 0:
+            raise ValueError("Throughput penceresi pozitif olmalıdır")
+        times = self.times
+        if end is None:
+            end = times[-1] if times else start
+        
+        rates = []
+        done = bisect_right(times, start)
+        for i in range(max(0, -int(-(end - start) // window))):
+            t = start + i * window
+            next_done = bisect_right(times, t + window)
+            rates.append((t, (next_done - done) / window))
+            done = next_done
+        return rates
 
 class Scheduler:
-    def __init__(self, context_switch_time=0.001):
+    def __init__(self, context_switch_time=0.001, timeline=None, instrument=False, profile=None,
+                 checkpoint_interval=None):
         self.context_switch_time = context_switch_time
-        self.context_switches = 0
+        self.timeline = timeline
+        self.instrument = instrument
+        self.profile = profile
+        self.checkpoint_interval = checkpoint_interval
+    
+    def _new_context(self, processes, algorithm, previous=None, params=()):
+        workload = Workload.from_processes(processes)
+        key = (algorithm,) + params
+        checkpoint, position = _find_checkpoint(previous, workload, key)
+        if checkpoint is not None and checkpoint.timeline_length:
+            prefix = list(islice(previous['time_table'], checkpoint.timeline_length - 1))
+        else:
+            prefix = ()
+        
+        time_table = self.timeline(algorithm) if self.timeline is not None else None
+        ctx = RunContext(workload, time_table, self.instrument, key, self.checkpoint_interval)
+        if checkpoint is not None:
+            ctx.resume(previous, checkpoint, position, prefix)
+        return ctx
+    
+    def metric_columns(self, processes):
+        if isinstance(processes, ProcessResults):
+            workload = processes.workload
+            waits = (c - a - b for c, a, b in zip(processes.completion_times, workload.arrivals, workload.bursts))
+            turnarounds = (c - a for c, a in zip(processes.completion_times, workload.arrivals))
+            responses = (
+                response if response != -1 else start - arrival
+                for response, start, arrival in zip(processes.response_times, processes.start_times,
+                                                     workload.arrivals)
+                if response != -1 or start != -1
+            )
+        else:
+            waits = (p.waiting_time for p in processes)
+            turnarounds = (p.turnaround_time for p in processes)
+            responses = (p.response_time if p.response_time != -1 else p.start_time - p.arrival
+                         for p in processes if p.response_time != -1 or p.start_time != -1)
+        return waits, turnarounds, responses
     
-    def calculate_metrics(self, processes):
-        total_wait = sum(p.waiting_time for p in processes)
-        total_turnaround = sum(p.turnaround_time for p in processes)
-        avg_wait = total_wait / len(processes) if processes else 0
-        avg_turnaround = total_turnaround / len(processes) if processes else 0
-        max_wait = max(p.waiting_time for p in processes) if processes else 0
-        max_turnaround = max(p.turnaround_time for p in processes) if processes else 0
+    def metric_sketches(self, processes):
+        waits, turnarounds, responses = self.metric_columns(processes)
+        return {
+            'wait': QuantileSketch().update(waits),
+            'turnaround': QuantileSketch().update(turnarounds),
+            'response': QuantileSketch().update(responses)
+        }
+    
+    def calculate_metrics(self, processes, sketches=None):
+        if sketches is None:
+            sketches = self.metric_sketches(processes)
+        wait = sketches['wait']
+        turnaround = sketches['turnaround']
         
         return {
-            'avg_wait': avg_wait,
-            'avg_turnaround': avg_turnaround,
-            'max_wait': max_wait,
-            'max_turnaround': max_turnaround,
-            'total_wait': total_wait,
-            'total_turnaround': total_turnaround
+            'avg_wait': wait.mean(),
+            'avg_turnaround': turnaround.mean(),
+            'max_wait': wait.max if wait.count else 0,
+            'max_turnaround': turnaround.max if turnaround.count else 0,
+            'total_wait': wait.total,
+            'total_turnaround': turnaround.total,
+            'avg_response': sketches['response'].mean(),
+            'percentiles': {name: sketch.percentiles() for name, sketch in sketches.items()},
+            'percentile_error': wait.relative_accuracy
         }
     
-    def calculate_throughput(self, processes, time_points):
-        throughput = {}
-        for T in time_points:
-            completed = sum(1 for p in processes if p.completion_time <= T)
-            throughput[T] = completed
-        return throughput
+    def completion_curve(self, processes):
+        if isinstance(processes, ProcessResults):
+            return CompletionCurve(processes.completion_times)
+        return CompletionCurve(p.completion_time for p in processes)
+    
+    def calculate_throughput(self, processes, time_points=DEFAULT_TIME_POINTS):
+        return self.completion_curve(processes).throughput(time_points)
     
-    def calculate_cpu_efficiency(self, processes, total_time):
-        total_burst = sum(p.burst for p in processes)
-        total_context_time = self.context_switches * self.context_switch_time
+    def throughput_report(self, processes, time_points=DEFAULT_TIME_POINTS, window=None):
+        curve = self.completion_curve(processes)
+        report = {'throughput': curve.throughput(time_points)}
+        if window:
+            report['throughput_window'] = window
+            report['throughput_rates'] = curve.rates(window)
+        return report
+    
+    def calculate_cpu_efficiency(self, processes, total_time, context_switches):
+        if isinstance(processes, ProcessResults):
+            total_burst = sum(processes.workload.bursts)
+        else:
+            total_burst = sum(p.burst for p in processes)
+        total_context_time = context_switches * self.context_switch_time
         efficiency = total_burst / (total_time + total_context_time) if total_time > 0 else 0
         return efficiency * 100
     
-    def fcfs(self, processes):
-        proc_copy = copy.deepcopy(processes)
-        proc_copy.sort(key=lambda x: x.arrival)
+    def _results(self, ctx, **extra):
+        instrumented = ctx.instrumentation is not None
+        if instrumented:
+            ctx.end_phase('simulate')
         
-        time_table = []
-        current_time = 0
+        if isinstance(ctx.time_table, Timeline):
+            ctx.time_table.close()
+        if instrumented:
+            ctx.end_phase('timeline_flush')
         
-        for process in proc_copy:
-            if current_time < process.arrival:
-                time_table.append((current_time, "IDLE", process.arrival - current_time))
-                current_time = process.arrival
-            
-            process.start_time = current_time
-            time_table.append((current_time, process.pid, process.burst))
-            
-            process.completion_time = current_time + process.burst
-            process.turnaround_time = process.completion_time - process.arrival
-            process.waiting_time = process.turnaround_time - process.burst
-            
-            current_time = process.completion_time
-            self.context_switches += 1
+        processes = ctx.process_results()
+        sketches = ctx.sketches if ctx.sketches is not None else self.metric_sketches(processes)
+        results = {
+            'processes': processes,
+            'time_table': ctx.time_table,
+            'metrics': self.calculate_metrics(processes, sketches),
+            'sketches': sketches,
+            'total_time': ctx.total_time,
+            'context_switches': ctx.context_switches
+        }
+        results.update(extra)
+        if ctx.checkpoints is not None:
+            results['checkpoints'] = ctx.checkpoints
         
-        total_time = current_time
-        metrics = self.calculate_metrics(proc_copy)
+        if instrumented:
+            ctx.end_phase('metrics')
+            ctx.count(timeline_entries=len(ctx.time_table))
+            results['instrumentation'] = ctx.instrumentation
+        return results
+    
+    @profiled
+    def fcfs(self, processes, previous=None):
+        ctx = self._new_context(processes, 'fcfs', previous)
+        workload = ctx.workload
+        pids, arrivals, bursts = workload.pids, workload.arrivals, workload.bursts
+        n = len(workload)
+        start_times = ctx.start_times
+        completion_times = ctx.completion_times
         
-        return {
-            'processes': proc_copy,
-            'time_table': time_table,
-            'metrics': metrics,
-            'total_time': total_time,
-            'context_switches': self.context_switches
-        }
+        time_table = ctx.time_table
+        context_switches = 0
+        idle_jumps = 0
+        current_time = 0
+        first = 0
+        if ctx.resumed is not None:
+            current_time, first, context_switches, idle_jumps = ctx.resumed.state
+        next_checkpoint = ctx.next_checkpoint
+        
+        for i in range(first, n):
+            if current_time >= next_checkpoint:
+                next_checkpoint = ctx.save_checkpoint(current_time, float('-inf'), i, (),
+                                                      (current_time, i, context_switches, idle_jumps))
+            
+            if current_time < arrivals[i]:
+                time_table.append((current_time, "IDLE", arrivals[i] - current_time))
+                current_time = arrivals[i]
+                idle_jumps += 1
+            
+            start_times[i] = current_time
+            time_table.append((current_time, pids[i], bursts[i]))
+            
+            current_time += bursts[i]
+            completion_times[i] = current_time
+            context_switches += 1
+        
+        ctx.context_switches = context_switches
+        ctx.total_time = current_time
+        ctx.count(decisions=n, queue_operations=0, idle_jumps=idle_jumps, preemptions=0)
+        return self._results(ctx)
     
-    def sjf_nonpreemptive(self, processes):
-        proc_copy = copy.deepcopy(processes)
-        proc_copy.sort(key=lambda x: x.arrival)
+    def _run_nonpreemptive(self, processes, key_attr, algorithm, previous):
+        ctx = self._new_context(processes, algorithm, previous)
+        workload = ctx.workload
+        pids, arrivals, bursts = workload.pids, workload.arrivals, workload.bursts
+        keys = getattr(workload, key_attr)
+        n = len(workload)
+        start_times = ctx.start_times
+        completion_times = ctx.completion_times
         
-        time_table = []
+        time_table = ctx.time_table
+        context_switches = 0
+        idle_jumps = 0
         current_time = 0
         completed = 0
-        n = len(proc_copy)
-        is_completed = [False] * n
+        ready = []
+        cursor = 0
+        if ctx.resumed is not None:
+            current_time, cursor, completed, context_switches, ready, idle_jumps = ctx.resumed.state
+            ready = list(ready)
+        next_checkpoint = ctx.next_checkpoint
         
         while completed != n:
-            idx = -1
-            min_burst = float('inf')
-            
-            for i in range(n):
-                if (proc_copy[i].arrival <= current_time and 
-                    not is_completed[i] and 
-                    proc_copy[i].burst < min_burst):
-                    min_burst = proc_copy[i].burst
-                    idx = i
-            
-            if idx == -1:
-                next_arrival = min(p.arrival for i, p in enumerate(proc_copy) 
-                                  if not is_completed[i])
+            while cursor < n and arrivals[cursor] <= current_time:
+                heapq.heappush(ready, (keys[cursor], cursor))
+                cursor += 1
+            
+            if current_time >= next_checkpoint:
+                next_checkpoint = ctx.save_checkpoint(
+                    current_time, current_time, cursor, [idx for _, idx in ready],
+                    (current_time, cursor, completed, context_switches, list(ready), idle_jumps)
+                )
+            
+            if not ready:
+                next_arrival = arrivals[cursor]
                 idle_time = next_arrival - current_time
                 time_table.append((current_time, "IDLE", idle_time))
                 current_time = next_arrival
-            else:
-                process = proc_copy[idx]
-                process.start_time = current_time
-                time_table.append((current_time, process.pid, process.burst))
-                
-                process.completion_time = current_time + process.burst
-                process.turnaround_time = process.completion_time - process.arrival
-                process.waiting_time = process.turnaround_time - process.burst
-                
-                current_time = process.completion_time
-                is_completed[idx] = True
-                completed += 1
-                self.context_switches += 1
-        
-        total_time = current_time
-        metrics = self.calculate_metrics(proc_copy)
+                idle_jumps += 1
+                continue
+            
+            _, idx = heapq.heappop(ready)
+            start_times[idx] = current_time
+            time_table.append((current_time, pids[idx], bursts[idx]))
+            
+            current_time += bursts[idx]
+            completion_times[idx] = current_time
+            completed += 1
+            context_switches += 1
         
-        return {
-            'processes': proc_copy,
-            'time_table': time_table,
-            'metrics': metrics,
-            'total_time': total_time,
-            'context_switches': self.context_switches
-        }
+        ctx.context_switches = context_switches
+        ctx.total_time = current_time
+        ctx.count(decisions=n, queue_operations=2 * n, idle_jumps=idle_jumps, preemptions=0)
+        return self._results(ctx)
     
-    def sjf_preemptive(self, processes):
-        proc_copy = copy.deepcopy(processes)
-        proc_copy.sort(key=lambda x: x.arrival)
+    def _run_preemptive(self, processes, by_remaining, algorithm, previous):
+        ctx = self._new_context(processes, algorithm, previous)
+        workload = ctx.workload
+        pids, arrivals, priorities = workload.pids, workload.arrivals, workload.priorities
+        n = len(workload)
+        completion_times = ctx.completion_times
+        response_times = ctx.response_times
         
-        n = len(proc_copy)
-        remaining_time = [p.burst for p in proc_copy]
-        time_table = []
+        remaining_time = list(workload.bursts)
+        keys = remaining_time if by_remaining else priorities
+        time_table = ctx.time_table
+        context_switches = 0
+        idle_jumps = 0
+        preemptions = 0
         current_time = 0
         completed = 0
         prev = -1
+        ready = []
+        cursor = 0
+        if ctx.resumed is not None:
+            (current_time, cursor, completed, context_switches, prev, ready, remaining,
+             idle_jumps, preemptions) = ctx.resumed.state
+            ready = list(ready)
+            for idx, left in remaining.items():
+                remaining_time[idx] = left
+        next_checkpoint = ctx.next_checkpoint
         
         while completed != n:
-            idx = -1
-            min_remaining = float('inf')
-            
-            for i in range(n):
-                if (proc_copy[i].arrival <= current_time and 
-                    remaining_time[i] > 0 and 
-                    remaining_time[i] < min_remaining):
-                    min_remaining = remaining_time[i]
-                    idx = i
-            
-            if idx == -1:
-                next_arrival = min(p.arrival for i, p in enumerate(proc_copy) 
-                                  if remaining_time[i] > 0)
+            while cursor < n and arrivals[cursor] <= current_time:
+                heapq.heappush(ready, (keys[cursor], cursor))
+                cursor += 1
+            
+            if current_time >= next_checkpoint:
+                pending = [idx for _, idx in ready]
+                next_checkpoint = ctx.save_checkpoint(
+                    current_time, current_time, cursor, pending,
+                    (current_time, cursor, completed, context_switches, prev, list(ready),
+                     {idx: remaining_time[idx] for idx in pending}, idle_jumps, preemptions)
+                )
+            
+            if not ready:
+                next_arrival = arrivals[cursor]
                 idle_time = next_arrival - current_time
                 if idle_time > 0:
                     time_table.append((current_time, "IDLE", idle_time))
                 current_time = next_arrival
+                idle_jumps += 1
                 continue
             
-            process = proc_copy[idx]
+            running_key, idx = heapq.heappop(ready)
             
-            if process.response_time == -1:
-                process.response_time = current_time - process.arrival
+            if response_times[idx] == -1:
+                response_times[idx] = current_time - arrivals[idx]
             
             if prev != idx and prev != -1:
-                self.context_switches += 1
-            
-            next_event = current_time + 1
-            for i in range(n):
-                if (proc_copy[i].arrival > current_time and 
-                    proc_copy[i].arrival < next_event and 
-                    i != idx):
-                    next_event = proc_copy[i].arrival
-            
-            execution_time = min(remaining_time[idx], next_event - current_time)
+                context_switches += 1
+            
+            finish = current_time + remaining_time[idx]
+            preempt_at = None
+            while cursor < n and arrivals[cursor] < finish:
+                arrival = arrivals[cursor]
+                key = keys[cursor]
+                heapq.heappush(ready, (key, cursor))
+                if by_remaining:
+                    running_key = finish - arrival
+                cursor += 1
+                if key < running_key:
+                    preempt_at = arrival
+                    break
+            
+            if preempt_at is None:
+                execution_time = remaining_time[idx]
+            else:
+                execution_time = preempt_at - current_time
             
             if execution_time > 0:
-                time_table.append((current_time, process.pid, execution_time))
+                time_table.append((current_time, pids[idx], execution_time))
                 remaining_time[idx] -= execution_time
                 current_time += execution_time
             
-            if remaining_time[idx] == 0:
-                process.completion_time = current_time
-                process.turnaround_time = process.completion_time - process.arrival
-                process.waiting_time = process.turnaround_time - process.burst
+            if preempt_at is None:
+                remaining_time[idx] = 0
+                completion_times[idx] = current_time
                 completed += 1
+            else:
+                heapq.heappush(ready, (keys[idx], idx))
+                preemptions += 1
             
             prev = idx
         
-        self.context_switches += 1
-        
-        total_time = current_time
-        metrics = self.calculate_metrics(proc_copy)
+        context_switches += 1
         
-        return {
-            'processes': proc_copy,
-            'time_table': time_table,
-            'metrics': metrics,
-            'total_time': total_time,
-            'context_switches': self.context_switches
-        }
+        ctx.context_switches = context_switches
+        ctx.total_time = current_time
+        ctx.count(decisions=n + preemptions, queue_operations=2 * (n + preemptions),
+                  idle_jumps=idle_jumps, preemptions=preemptions)
+        return self._results(ctx)
     
-    def round_robin(self, processes, quantum=4):
-        proc_copy = copy.deepcopy(processes)
-        proc_copy.sort(key=lambda x: x.arrival)
+    @profiled
+    def sjf_nonpreemptive(self, processes, previous=None):
+        return self._run_nonpreemptive(processes, 'bursts', 'sjf_nonpreemptive', previous)
+    
+    @profiled
+    def sjf_preemptive(self, processes, previous=None):
+        return self._run_preemptive(processes, True, 'sjf_preemptive', previous)
+    
+    @profiled
+    def round_robin(self, processes, quantum=4, previous=None):
+        if quantum <= 0:
+            raise ValueError("Zaman dilimi pozitif olmalıdır")
         
-        n = len(proc_copy)
-        remaining_time = [p.burst for p in proc_copy]
-        time_table = []
+        ctx = self._new_context(processes, 'round_robin', previous, (quantum,))
+        workload = ctx.workload
+        pids, arrivals = workload.pids, workload.arrivals
+        n = len(workload)
+        completion_times = ctx.completion_times
+        response_times = ctx.response_times
+        
+        remaining_time = list(workload.bursts)
+        time_table = ctx.time_table
+        context_switches = 0
+        idle_jumps = 0
+        solo_total = 0
         current_time = 0
         completed = 0
         queue = deque()
-        in_queue = [False] * n
-        response_set = [False] * n
+        cursor = 0
+        if ctx.resumed is not None:
+            (current_time, cursor, completed, context_switches, queue, remaining,
+             idle_jumps, solo_total) = ctx.resumed.state
+            queue = deque(queue)
+            for idx, left in remaining.items():
+                remaining_time[idx] = left
+        next_checkpoint = ctx.next_checkpoint
         
-        for i in range(n):
-            if proc_copy[i].arrival <= current_time:
-                queue.append(i)
-                in_queue[i] = True
+        while cursor < n and arrivals[cursor] <= current_time:
+            queue.append(cursor)
+            cursor += 1
         
         while completed != n:
+            if current_time >= next_checkpoint:
+                next_checkpoint = ctx.save_checkpoint(
+                    current_time, current_time, cursor, queue,
+                    (current_time, cursor, completed, context_switches, list(queue),
+                     {idx: remaining_time[idx] for idx in queue}, idle_jumps, solo_total)
+                )
+            
             if not queue:
-                next_arrival = float('inf')
-                for i in range(n):
-                    if remaining_time[i] > 0 and proc_copy[i].arrival < next_arrival:
-                        next_arrival = proc_copy[i].arrival
+                next_arrival = arrivals[cursor]
                 
                 idle_time = next_arrival - current_time
                 if idle_time > 0:
                     time_table.append((current_time, "IDLE", idle_time))
                 
                 current_time = next_arrival
+                idle_jumps += 1
                 
-                for i in range(n):
-                    if (proc_copy[i].arrival <= current_time and 
-                        remaining_time[i] > 0 and 
-                        not in_queue[i]):
-                        queue.append(i)
-                        in_queue[i] = True
+                while cursor < n and arrivals[cursor] <= current_time:
+                    queue.append(cursor)
+                    cursor += 1
                 
                 continue
             
             idx = queue.popleft()
-            in_queue[idx] = False
             
-            process = proc_copy[idx]
-            
-            if not response_set[idx]:
-                process.response_time = current_time - process.arrival
-                response_set[idx] = True
+            if response_times[idx] == -1:
+                response_times[idx] = current_time - arrivals[idx]
+            
+            if not queue and remaining_time[idx] > quantum:
+                if cursor < n:
+                    until_arrival = -(-(arrivals[cursor] - current_time) // quantum)
+                else:
+                    until_arrival = float('inf')
+                solo_quanta = int(min(-(-remaining_time[idx] // quantum), until_arrival)) - 1
+                if solo_quanta > 0:
+                    time_table.extend((current_time + j * quantum, pids[idx], quantum)
+                                      for j in range(solo_quanta))
+                    remaining_time[idx] -= solo_quanta * quantum
+                    current_time += solo_quanta * quantum
+                    context_switches += solo_quanta
+                    solo_total += solo_quanta
             
             exec_time = min(quantum, remaining_time[idx])
-            time_table.append((current_time, process.pid, exec_time))
+            time_table.append((current_time, pids[idx], exec_time))
             
             remaining_time[idx] -= exec_time
             current_time += exec_time
             
-            for i in range(n):
-                if (proc_copy[i].arrival <= current_time and 
-                    remaining_time[i] > 0 and 
-                    not in_queue[i] and 
-                    i != idx):
-                    queue.append(i)
-                    in_queue[i] = True
+            while cursor < n and arrivals[cursor] <= current_time:
+                queue.append(cursor)
+                cursor += 1
             
             if remaining_time[idx] > 0:
                 queue.append(idx)
-                in_queue[idx] = True
             else:
-                process.completion_time = current_time
-                process.turnaround_time = process.completion_time - process.arrival
-                process.waiting_time = process.turnaround_time - process.burst
+                completion_times[idx] = current_time
                 completed += 1
             
-            self.context_switches += 1
-        
-        total_time = current_time
-        metrics = self.calculate_metrics(proc_copy)
+            context_switches += 1
         
-        return {
-            'processes': proc_copy,
-            'time_table': time_table,
-            'metrics': metrics,
-            'total_time': total_time,
-            'context_switches': self.context_switches,
-            'quantum': quantum
-        }
+        ctx.context_switches = context_switches
+        ctx.total_time = current_time
+        preemptions = context_switches - n
+        ctx.count(decisions=context_switches,
+                  queue_operations=2 * (n + preemptions - solo_total),
+                  idle_jumps=idle_jumps, preemptions=preemptions, fast_path_quanta=solo_total)
+        return self._results(ctx, quantum=quantum)
     
-    def priority_nonpreemptive(self, processes):
-        proc_copy = copy.deepcopy(processes)
-        proc_copy.sort(key=lambda x: x.arrival)
+    def _run_aging(self, processes, preemptive, algorithm, aging_interval, aging_limit):
+        if aging_interval <= 0:
+            raise ValueError("Yaşlandırma aralığı pozitif olmalıdır")
+        
+        ctx = self._new_context(processes, algorithm)
+        workload = ctx.workload
+        pids, arrivals, priorities = workload.pids, workload.arrivals, workload.priorities
+        n = len(workload)
+        start_times = ctx.start_times
+        completion_times = ctx.completion_times
+        response_times = ctx.response_times
         
-        time_table = []
+        remaining_time = list(workload.bursts)
+        enqueued = [0] * n
+        levels = list(priorities)
+        versions = [0] * n
+        longest_wait = [0] * n
+        priority_boost = [0] * n
+        ready = []
+        pending = []
+        waiting = 0
+        
+        time_table = ctx.time_table
+        context_switches = 0
+        idle_jumps = 0
+        preemptions = 0
+        promotions = 0
         current_time = 0
         completed = 0
-        n = len(proc_copy)
-        is_completed = [False] * n
+        prev = -1
+        cursor = 0
+        
+        def enqueue(idx, since):
+            enqueued[idx] = since
+            versions[idx] += 1
+            levels[idx] = priorities[idx]
+            heapq.heappush(ready, (levels[idx], idx, versions[idx]))
+            if levels[idx] > aging_limit:
+                heapq.heappush(pending, (since + aging_interval, idx, versions[idx]))
+        
+        def promote():
+            at, idx, version = heapq.heappop(pending)
+            if version != versions[idx]:
+                return None
+            levels[idx] -= 1
+            heapq.heappush(ready, (levels[idx], idx, version))
+            if levels[idx] > aging_limit:
+                steps = priorities[idx] - levels[idx] + 1
+                heapq.heappush(pending, (enqueued[idx] + steps * aging_interval, idx, version))
+            return idx
         
         while completed != n:
-            idx = -1
-            highest_priority = float('inf')
-            
-            for i in range(n):
-                if (proc_copy[i].arrival <= current_time and 
-                    not is_completed[i] and 
-                    proc_copy[i].priority < highest_priority):
-                    highest_priority = proc_copy[i].priority
-                    idx = i
-            
-            if idx == -1:
-                next_arrival = min(p.arrival for i, p in enumerate(proc_copy) 
-                                  if not is_completed[i])
+            while cursor < n and arrivals[cursor] <= current_time:
+                enqueue(cursor, arrivals[cursor])
+                waiting += 1
+                cursor += 1
+            
+            if not waiting:
+                next_arrival = arrivals[cursor]
                 idle_time = next_arrival - current_time
-                time_table.append((current_time, "IDLE", idle_time))
+                if idle_time > 0:
+                    time_table.append((current_time, "IDLE", idle_time))
                 current_time = next_arrival
-            else:
-                process = proc_copy[idx]
-                process.start_time = current_time
-                time_table.append((current_time, process.pid, process.burst))
-                
-                process.completion_time = current_time + process.burst
-                process.turnaround_time = process.completion_time - process.arrival
-                process.waiting_time = process.turnaround_time - process.burst
-                
-                current_time = process.completion_time
-                is_completed[idx] = True
+                idle_jumps += 1
+                continue
+            
+            while pending and pending[0][0] <= current_time:
+                if promote() is not None:
+                    promotions += 1
+            
+            while True:
+                level, idx, version = heapq.heappop(ready)
+                if version == versions[idx]:
+                    break
+            versions[idx] += 1
+            waiting -= 1
+            
+            longest_wait[idx] = max(longest_wait[idx], current_time - enqueued[idx])
+            priority_boost[idx] = max(priority_boost[idx], priorities[idx] - level)
+            
+            if not preemptive:
+                start_times[idx] = current_time
+                time_table.append((current_time, pids[idx], remaining_time[idx]))
+                current_time += remaining_time[idx]
+                remaining_time[idx] = 0
+                completion_times[idx] = current_time
                 completed += 1
-                self.context_switches += 1
+                context_switches += 1
+                continue
+            
+            if response_times[idx] == -1:
+                response_times[idx] = current_time - arrivals[idx]
+            
+            if prev != idx and prev != -1:
+                context_switches += 1
+            prev = idx
+            
+            finish = current_time + remaining_time[idx]
+            preempt_at = None
+            while True:
+                next_arrival = arrivals[cursor] if cursor < n else finish
+                next_promotion = pending[0][0] if pending else finish
+                if next_arrival < finish and next_arrival <= next_promotion:
+                    enqueue(cursor, next_arrival)
+                    waiting += 1
+                    cursor += 1
+                    if priorities[cursor - 1] < level:
+                        preempt_at = next_arrival
+                        break
+                elif next_promotion < finish:
+                    promoted = promote()
+                    if promoted is not None:
+                        promotions += 1
+                        if levels[promoted] < level:
+                            preempt_at = next_promotion
+                            break
+                else:
+                    break
+            
+            execution_time = (finish if preempt_at is None else preempt_at) - current_time
+            time_table.append((current_time, pids[idx], execution_time))
+            remaining_time[idx] -= execution_time
+            current_time += execution_time
+            
+            if preempt_at is None:
+                completion_times[idx] = current_time
+                completed += 1
+            else:
+                enqueue(idx, current_time)
+                waiting += 1
+                preemptions += 1
         
-        total_time = current_time
-        metrics = self.calculate_metrics(proc_copy)
+        if preemptive:
+            context_switches += 1
         
-        return {
-            'processes': proc_copy,
-            'time_table': time_table,
-            'metrics': metrics,
-            'total_time': total_time,
-            'context_switches': self.context_switches
-        }
+        ctx.context_switches = context_switches
+        ctx.total_time = current_time
+        ctx.count(decisions=n + preemptions, queue_operations=2 * (n + preemptions) + promotions,
+                  idle_jumps=idle_jumps, preemptions=preemptions, aging_promotions=promotions)
+        return self._results(ctx, aging_interval=aging_interval, starvation={
+            'longest_wait': longest_wait,
+            'priority_boost': priority_boost,
+            'aged_processes': sum(1 for boost in priority_boost if boost > 0)
+        })
+    
+    @profiled
+    def priority_nonpreemptive(self, processes, previous=None, aging_interval=None, aging_limit=1):
+        if aging_interval is not None:
+            return self._run_aging(processes, False, 'priority_nonpreemptive', aging_interval, aging_limit)
+        return self._run_nonpreemptive(processes, 'priorities', 'priority_nonpreemptive', previous)
     
-    def priority_preemptive(self, processes):
-        proc_copy = copy.deepcopy(processes)
-        proc_copy.sort(key=lambda x: x.arrival)
+    @profiled
+    def priority_preemptive(self, processes, previous=None, aging_interval=None, aging_limit=1):
+        if aging_interval is not None:
+            return self._run_aging(processes, True, 'priority_preemptive', aging_interval, aging_limit)
+        return self._run_preemptive(processes, False, 'priority_preemptive', previous)
+    
+    @profiled
+    def mlfq(self, processes, quanta=(4, 8, 16), boost_period=100):
+        if not quanta:
+            raise ValueError("MLFQ için en az bir seviye gereklidir")
+        if any(quantum <= 0 for quantum in quanta):
+            raise ValueError("MLFQ zaman dilimleri pozitif olmalıdır")
+        if boost_period and boost_period < 0:
+            raise ValueError("Öncelik yükseltme periyodu negatif olamaz")
+        
+        ctx = self._new_context(processes, 'mlfq')
+        workload = ctx.workload
+        pids, arrivals = workload.pids, workload.arrivals
+        n = len(workload)
+        completion_times = ctx.completion_times
+        response_times = ctx.response_times
         
-        n = len(proc_copy)
-        remaining_time = [p.burst for p in proc_copy]
-        time_table = []
+        remaining_time = list(workload.bursts)
+        lowest = len(quanta) - 1
+        level = [0] * n
+        used = [0] * n
+        queues = [deque() for _ in quanta]
+        waiting = 0
+        next_boost = boost_period if boost_period else float('inf')
+        
+        time_table = ctx.time_table
+        context_switches = 0
+        idle_jumps = 0
+        decisions = 0
+        preemptions = 0
+        demotions = 0
+        boosts = 0
         current_time = 0
         completed = 0
         prev = -1
+        cursor = 0
         
         while completed != n:
-            idx = -1
-            highest_priority = float('inf')
-            
-            for i in range(n):
-                if (proc_copy[i].arrival <= current_time and 
-                    remaining_time[i] > 0 and 
-                    proc_copy[i].priority < highest_priority):
-                    highest_priority = proc_copy[i].priority
-                    idx = i
-            
-            if idx == -1:
-                next_arrival = min(p.arrival for i, p in enumerate(proc_copy) 
-                                  if remaining_time[i] > 0)
-                idle_time = next_arrival - current_time
-                if idle_time > 0:
-                    time_table.append((current_time, "IDLE", idle_time))
+            while cursor < n and arrivals[cursor] <= current_time:
+                queues[0].append(cursor)
+                waiting += 1
+                cursor += 1
+            
+            if current_time >= next_boost:
+                top = queues[0]
+                for queue in queues[1:]:
+                    top.extend(queue)
+                    queue.clear()
+                for idx in top:
+                    level[idx] = 0
+                    used[idx] = 0
+                boosts += 1
+                next_boost = (current_time // boost_period + 1) * boost_period
+            
+            if not waiting:
+                next_arrival = arrivals[cursor]
+                time_table.append((current_time, "IDLE", next_arrival - current_time))
                 current_time = next_arrival
+                idle_jumps += 1
                 continue
             
-            process = proc_copy[idx]
+            lvl = 0
+            while not queues[lvl]:
+                lvl += 1
+            idx = queues[lvl].popleft()
+            waiting -= 1
+            decisions += 1
             
-            if process.response_time == -1:
-                process.response_time = current_time - process.arrival
+            if response_times[idx] == -1:
+                response_times[idx] = current_time - arrivals[idx]
             
-            if prev != idx and prev != -1:
-                self.context_switches += 1
+            if prev != idx:
+                context_switches += 1
+            prev = idx
             
-            next_event = current_time + 1
-            for i in range(n):
-                if (proc_copy[i].arrival > current_time and 
-                    proc_copy[i].arrival < next_event and 
-                    i != idx and 
-                    proc_copy[i].priority < highest_priority):
-                    next_event = proc_copy[i].arrival
+            exec_time = min(quanta[lvl] - used[idx], remaining_time[idx])
+            if lvl > 0 and cursor < n and arrivals[cursor] < current_time + exec_time:
+                exec_time = arrivals[cursor] - current_time
+                preemptions += 1
             
-            execution_time = min(remaining_time[idx], next_event - current_time)
+            time_table.append((current_time, pids[idx], exec_time))
+            remaining_time[idx] -= exec_time
+            used[idx] += exec_time
+            current_time += exec_time
             
-            if execution_time > 0:
-                time_table.append((current_time, process.pid, execution_time))
-                remaining_time[idx] -= execution_time
-                current_time += execution_time
+            while cursor < n and arrivals[cursor] <= current_time:
+                queues[0].append(cursor)
+                waiting += 1
+                cursor += 1
             
             if remaining_time[idx] == 0:
-                process.completion_time = current_time
-                process.turnaround_time = process.completion_time - process.arrival
-                process.waiting_time = process.turnaround_time - process.burst
+                completion_times[idx] = current_time
                 completed += 1
+                continue
             
-            prev = idx
+            if used[idx] >= quanta[lvl]:
+                used[idx] = 0
+                if lvl < lowest:
+                    level[idx] = lvl + 1
+                    demotions += 1
+            queues[level[idx]].append(idx)
+            waiting += 1
         
-        self.context_switches += 1
+        ctx.context_switches = context_switches
+        ctx.total_time = current_time
+        ctx.count(decisions=decisions, idle_jumps=idle_jumps,
+                  preemptions=preemptions, demotions=demotions, boosts=boosts)
+        return self._results(ctx, quanta=tuple(quanta), boost_period=boost_period)
+    
+    @profiled
+    def cfs(self, processes, target_latency=24, min_granularity=3):
+        if target_latency <= 0 or min_granularity <= 0:
+            raise ValueError("CFS hedef gecikmesi ve en küçük dilim pozitif olmalıdır")
         
-        total_time = current_time
-        metrics = self.calculate_metrics(proc_copy)
+        ctx = self._new_context(processes, 'cfs')
+        workload = ctx.workload
+        pids, arrivals = workload.pids, workload.arrivals
+        n = len(workload)
+        completion_times = ctx.completion_times
+        response_times = ctx.response_times
         
-        return {
-            'processes': proc_copy,
-            'time_table': time_table,
-            'metrics': metrics,
-            'total_time': total_time,
-            'context_switches': self.context_switches
-        }
\ No newline at end of file
+        remaining_time = list(workload.bursts)
+        weights = [cfs_weight(priority) for priority in workload.priorities]
+        vruntime = [0.0] * n
+        min_vruntime = 0.0
+        total_weight = 0
+        
+        time_table = ctx.time_table
+        context_switches = 0
+        idle_jumps = 0
+        decisions = 0
+        current_time = 0
+        completed = 0
+        prev = -1
+        ready = []
+        cursor = 0
+        
+        while completed != n:
+            while cursor < n and arrivals[cursor] <= current_time:
+                vruntime[cursor] = min_vruntime
+                heapq.heappush(ready, (min_vruntime, cursor))
+                total_weight += weights[cursor]
+                cursor += 1
+            
+            if not ready:
+                next_arrival = arrivals[cursor]
+                time_table.append((current_time, "IDLE", next_arrival - current_time))
+                current_time = next_arrival
+                idle_jumps += 1
+                continue
+            
+            _, idx = heapq.heappop(ready)
+            decisions += 1
+            
+            if response_times[idx] == -1:
+                response_times[idx] = current_time - arrivals[idx]
+            
+            if prev != idx:
+                context_switches += 1
+            prev = idx
+            
+            weight = weights[idx]
+            time_slice = max(min_granularity, int(target_latency * weight / total_weight))
+            exec_time = min(time_slice, remaining_time[idx])
+            
+            time_table.append((current_time, pids[idx], exec_time))
+            remaining_time[idx] -= exec_time
+            current_time += exec_time
+            vruntime[idx] += exec_time * NICE_0_WEIGHT / weight
+            
+            if ready:
+                min_vruntime = max(min_vruntime, min(vruntime[idx], ready[0][0]))
+            else:
+                min_vruntime = max(min_vruntime, vruntime[idx])
+            
+            if remaining_time[idx] == 0:
+                completion_times[idx] = current_time
+                completed += 1
+                total_weight -= weight
+            else:
+                heapq.heappush(ready, (vruntime[idx], idx))
+        
+        ctx.context_switches = context_switches
+        ctx.total_time = current_time
+        ctx.count(decisions=decisions, queue_operations=2 * decisions, idle_jumps=idle_jumps)
+        return self._results(ctx, target_latency=target_latency, min_granularity=min_granularity)
@@ -0,0 +1,160 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from process import Workload
+from scheduler import Scheduler
+from instrumentation import profiled
+from sketch import merge_sketches
+
+STITCHED_FIELDS = ('processes', 'time_table', 'metrics', 'sketches', 'total_time', 'context_switches',
+                   'checkpoints', 'instrumentation')
+
+_worker_workload = None
+
+
+def busy_periods(workload):
+    starts = []
+    busy_until = None
+    for i, (arrival, burst) in enumerate(zip(workload.arrivals, workload.bursts)):
+        if busy_until is None or arrival >= busy_until:
+            starts.append(i)
+            busy_until = arrival
+        busy_until += burst
+    return starts
+
+
+def group_periods(starts, n, chunk_size):
+    chunks = []
+    lo = 0
+    for start in starts[1:]:
+        if start - lo >= chunk_size:
+            chunks.append((lo, start))
+            lo = start
+    if n:
+        chunks.append((lo, n))
+    return chunks
+
+
+def _init_worker(workload):
+    global _worker_workload
+    _worker_workload = workload
+
+
+def _run_chunk(method_name, args, lo, hi):
+    workload = _worker_workload
+    chunk = Workload(workload.pids[lo:hi], workload.arrivals[lo:hi], workload.bursts[lo:hi],
+                     workload.priorities[lo:hi], presorted=True)
+    results = getattr(Scheduler(), method_name)(chunk, *args)
+    processes = results['processes']
+    extra = {name: value for name, value in results.items() if name not in STITCHED_FIELDS}
+    return (list(results['time_table']), processes.start_times, processes.completion_times,
+            processes.response_times, results['context_switches'], results['total_time'],
+            results['sketches'], extra)
+
+
+class SegmentedScheduler(Scheduler):
+    def __init__(self, workers=None, chunks_per_worker=4, context_switch_time=0.001, timeline=None,
+                 instrument=False, profile=None, checkpoint_interval=None):
+        super().__init__(context_switch_time, timeline, instrument, profile, checkpoint_interval)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.workload = None
+        self.periods = None
+        self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def _prepare(self, workload):
+        if workload is not self.workload:
+            self.close()
+            self.workload = workload
+            self.periods = busy_periods(workload)
+
+        chunk_size = -(-len(workload) // (self.workers * self.chunks_per_worker))
+        chunks = group_periods(self.periods, len(workload), chunk_size)
+        if len(chunks) > 1 and self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=min(self.workers, len(chunks)),
+                initializer=_init_worker,
+                initargs=(workload,)
+            )
+        return chunks
+
+    def _serial(self, options):
+        return (self.workers < 2 or self.checkpoint_interval is not None
+                or options.get('previous') is not None or options.get('aging_interval') is not None)
+
+    def _simulate(self, processes, method_name, args=(), **options):
+        workload = Workload.from_processes(processes)
+        chunks = [(0, len(workload))] if self._serial(options) else self._prepare(workload)
+        if len(chunks) < 2:
+            return getattr(Scheduler, method_name).__wrapped__(self, workload, *args, **options)
+
+        ctx = self._new_context(workload, method_name)
+        futures = [self.executor.submit(_run_chunk, method_name, args, lo, hi) for lo, hi in chunks]
+
+        time_table = ctx.time_table
+        arrivals = workload.arrivals
+        context_switches = 0
+        current_time = 0
+        sketches = []
+        extra = {}
+        for (lo, hi), future in zip(chunks, futures):
+            (entries, start_times, completion_times, response_times, switches, total_time,
+             chunk_sketches, extra) = future.result()
+            if lo and entries and entries[0][1] == "IDLE":
+                entries = entries[1:]
+                if arrivals[lo] > current_time:
+                    time_table.append((current_time, "IDLE", arrivals[lo] - current_time))
+            time_table.extend(entries)
+
+            ctx.start_times[lo:hi] = start_times
+            ctx.completion_times[lo:hi] = completion_times
+            ctx.response_times[lo:hi] = response_times
+            context_switches += switches
+            current_time = total_time
+            sketches.append(chunk_sketches)
+
+        ctx.context_switches = context_switches
+        ctx.total_time = current_time
+        ctx.sketches = {name: merge_sketches(chunk[name] for chunk in sketches) for name in sketches[0]}
+        ctx.count(busy_periods=len(self.periods), chunks=len(chunks))
+        return self._results(ctx, **extra)
+
+    @profiled
+    def fcfs(self, processes, previous=None):
+        return self._simulate(processes, 'fcfs', previous=previous)
+
+    @profiled
+    def sjf_nonpreemptive(self, processes, previous=None):
+        return self._simulate(processes, 'sjf_nonpreemptive', previous=previous)
+
+    @profiled
+    def sjf_preemptive(self, processes, previous=None):
+        return self._simulate(processes, 'sjf_preemptive', previous=previous)
+
+    @profiled
+    def round_robin(self, processes, quantum=4, previous=None):
+        return self._simulate(processes, 'round_robin', (quantum,), previous=previous)
+
+    @profiled
+    def priority_nonpreemptive(self, processes, previous=None, aging_interval=None, aging_limit=1):
+        return self._simulate(processes, 'priority_nonpreemptive', previous=previous,
+                              aging_interval=aging_interval, aging_limit=aging_limit)
+
+    @profiled
+    def priority_preemptive(self, processes, previous=None, aging_interval=None, aging_limit=1):
+        return self._simulate(processes, 'priority_preemptive', previous=previous,
+                              aging_interval=aging_interval, aging_limit=aging_limit)
+
+    @profiled
+    def mlfq(self, processes, quanta=(4, 8, 16), boost_period=100):
+        return self._simulate(processes, 'mlfq', (tuple(quanta), boost_period))
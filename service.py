@@ -0,0 +1,384 @@
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+from binary_workload import decode_workload
+from process import Workload
+from scheduler import DEFAULT_TIME_POINTS, Scheduler
+from timeline import discard, read_timeline, to_directory
+from utils import parse_priority
+
+METHODS = ('fcfs', 'sjf_nonpreemptive', 'sjf_preemptive', 'round_robin',
+           'priority_nonpreemptive', 'priority_preemptive', 'mlfq', 'cfs')
+DEFAULT_METHODS = METHODS[:6]
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+_worker_schedulers = {}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _warm():
+    return os.getpid()
+
+
+def _run_simulation(workload, method_name, args, context_switch_time, timeline_dir):
+    scheduler = _worker_schedulers.get(context_switch_time)
+    if scheduler is None:
+        scheduler = _worker_schedulers[context_switch_time] = Scheduler(context_switch_time)
+    scheduler.timeline = to_directory(timeline_dir) if timeline_dir else discard()
+
+    start_time = time.perf_counter()
+    results = getattr(scheduler, method_name)(workload, *args)
+    end_time = time.perf_counter()
+
+    processes = results['processes']
+    summary = {
+        'algorithm': method_name,
+        'metrics': results['metrics'],
+        'total_time': results['total_time'],
+        'context_switches': results['context_switches'],
+        'throughput': scheduler.calculate_throughput(processes, DEFAULT_TIME_POINTS),
+        'cpu_efficiency': scheduler.calculate_cpu_efficiency(
+            processes, results['total_time'], results['context_switches']
+        ),
+        'execution_time': end_time - start_time
+    }
+    if method_name == 'round_robin':
+        summary['quantum'] = results['quantum']
+    if timeline_dir:
+        summary['timeline_path'] = results['time_table'].path
+    return summary
+
+
+def _int_field(value, name):
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise HTTPError(400, f"'{name}' alanı tam sayı olmalıdır")
+    return value
+
+
+def _priority_field(value):
+    if isinstance(value, str):
+        try:
+            return parse_priority(value)
+        except ValueError:
+            raise HTTPError(400, f"Geçersiz öncelik: {value}")
+    return _int_field(value, 'priority')
+
+
+def parse_json_workload(spec):
+    if 'processes' in spec:
+        rows = spec['processes']
+        if not isinstance(rows, list):
+            raise HTTPError(400, "'processes' bir liste olmalıdır")
+        try:
+            pids = [str(row['pid']) for row in rows]
+            arrivals = [_int_field(row['arrival'], 'arrival') for row in rows]
+            bursts = [_int_field(row['burst'], 'burst') for row in rows]
+            priorities = [_priority_field(row.get('priority', 0)) for row in rows]
+        except (KeyError, TypeError, AttributeError):
+            raise HTTPError(400, "Her süreç 'pid', 'arrival' ve 'burst' alanlarını içermelidir")
+    elif 'columns' in spec:
+        columns = spec['columns']
+        try:
+            pids = [str(pid) for pid in columns['pid']]
+            arrivals = [_int_field(value, 'arrival') for value in columns['arrival']]
+            bursts = [_int_field(value, 'burst') for value in columns['burst']]
+            priorities = [_priority_field(value) for value in columns.get('priority', [0] * len(pids))]
+        except (KeyError, TypeError, AttributeError):
+            raise HTTPError(400, "'columns' nesnesi 'pid', 'arrival' ve 'burst' listelerini içermelidir")
+        if not len(pids) == len(arrivals) == len(bursts) == len(priorities):
+            raise HTTPError(400, "Sütun uzunlukları eşleşmiyor")
+    else:
+        raise HTTPError(400, "İş yükü 'processes' veya 'columns' alanında verilmelidir")
+
+    if any(burst <= 0 for burst in bursts) or any(arrival < 0 for arrival in arrivals):
+        raise HTTPError(400, "Varış zamanları negatif, çalışma süreleri sıfır veya negatif olamaz")
+    return Workload(pids, arrivals, bursts, priorities)
+
+
+def parse_options(options):
+    methods = options.get('algorithms') or DEFAULT_METHODS
+    if isinstance(methods, str):
+        methods = methods.split(',')
+    unknown = [method for method in methods if method not in METHODS]
+    if unknown:
+        raise HTTPError(400, f"Bilinmeyen algoritma: {', '.join(map(str, unknown))}")
+
+    try:
+        quantum = int(options.get('quantum', 4))
+        context_switch_time = float(options.get('context_switch_time', 0.001))
+    except (TypeError, ValueError):
+        raise HTTPError(400, "'quantum' tam sayı, 'context_switch_time' sayı olmalıdır")
+    if quantum < 1:
+        raise HTTPError(400, "Quantum en az 1 olmalıdır")
+
+    time_table = options.get('time_table', False)
+    if isinstance(time_table, str):
+        time_table = time_table.lower() in ('1', 'true', 'yes')
+    return list(dict.fromkeys(methods)), quantum, context_switch_time, bool(time_table)
+
+
+class SimulationService:
+    def __init__(self, workers=None, max_concurrency=4, max_body=64 << 20):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency
+        self.max_body = max_body
+        self.executor = None
+        self.semaphore = None
+        self.server = None
+
+    async def start(self, host='127.0.0.1', port=8765):
+        loop = asyncio.get_running_loop()
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(*(loop.run_in_executor(self.executor, _warm) for _ in range(self.workers)))
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    async def simulate(self, workload, methods, quantum, context_switch_time, time_table):
+        loop = asyncio.get_running_loop()
+        timeline_dir = tempfile.mkdtemp(prefix='cpu_sim_') if time_table else None
+        try:
+            async with self.semaphore:
+                return await asyncio.gather(*(
+                    loop.run_in_executor(
+                        self.executor, _run_simulation, workload, method,
+                        (quantum,) if method == 'round_robin' else (), context_switch_time, timeline_dir
+                    )
+                    for method in methods
+                )), timeline_dir
+        except BaseException:
+            if timeline_dir:
+                shutil.rmtree(timeline_dir, ignore_errors=True)
+            raise
+
+    async def _read_request(self, reader):
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        try:
+            method, target, _ = request_line.decode('latin-1').split(' ', 2)
+        except ValueError:
+            raise HTTPError(400, "Geçersiz istek satırı")
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise HTTPError(400, "Geçersiz Content-Length")
+        if length > self.max_body:
+            raise HTTPError(413, f"İstek gövdesi {self.max_body} baytı aşıyor")
+        body = await reader.readexactly(length) if length else b''
+        return method, target, headers, body
+
+    async def _send(self, writer, status, body, content_type='application/json; charset=utf-8'):
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode('latin-1') + body
+        )
+        await writer.drain()
+
+    async def _send_json(self, writer, status, payload):
+        await self._send(writer, status, json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+
+    async def _stream(self, writer, summaries, chunk_size=1 << 16):
+        writer.write(
+            "HTTP/1.1 200 OK\r\n"
+            "Content-Type: application/x-ndjson\r\n"
+            "Transfer-Encoding: chunked\r\n"
+            "Connection: close\r\n\r\n".encode('latin-1')
+        )
+
+        buffer = []
+        size = 0
+
+        async def flush():
+            nonlocal buffer, size
+            if buffer:
+                data = ''.join(buffer).encode('utf-8')
+                writer.write(b'%x\r\n%s\r\n' % (len(data), data))
+                await writer.drain()
+                buffer = []
+                size = 0
+
+        for summary in summaries:
+            path = summary.pop('timeline_path')
+            buffer.append(json.dumps(summary, ensure_ascii=False) + '\n')
+            for entry in read_timeline(path):
+                line = json.dumps(entry, ensure_ascii=False) + '\n'
+                buffer.append(line)
+                size += len(line)
+                if size >= chunk_size:
+                    await flush()
+            await flush()
+
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+    async def _run_spec(self, spec):
+        if not isinstance(spec, dict):
+            raise HTTPError(400, "Her istek bir JSON nesnesi olmalıdır")
+        workload = parse_json_workload(spec)
+        return await self.simulate(workload, *parse_options(spec))
+
+    def _inline(self, summaries):
+        for summary in summaries:
+            path = summary.pop('timeline_path', None)
+            if path is not None:
+                summary['time_table'] = list(read_timeline(path))
+        return {'results': summaries}
+
+    async def _batch(self, specs):
+        outcomes = await asyncio.gather(*(self._run_spec(spec) for spec in specs), return_exceptions=True)
+        try:
+            results = []
+            for outcome in outcomes:
+                if isinstance(outcome, HTTPError):
+                    results.append({'error': outcome.message})
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    results.append(self._inline(outcome[0]))
+            return results
+        finally:
+            for outcome in outcomes:
+                if isinstance(outcome, tuple) and outcome[1]:
+                    shutil.rmtree(outcome[1], ignore_errors=True)
+
+    def _decode_json(self, body):
+        try:
+            return json.loads(body)
+        except (UnicodeDecodeError, ValueError):
+            raise HTTPError(400, "Geçersiz JSON gövdesi")
+
+    async def route(self, writer, method, target, headers, body):
+        url = urlsplit(target)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        if url.path == '/health':
+            if method != 'GET':
+                raise HTTPError(405, "Yalnızca GET desteklenir")
+            await self._send_json(writer, 200, {'status': 'ok', 'workers': self.workers,
+                                                'max_concurrency': self.max_concurrency})
+            return
+
+        if url.path not in ('/simulate', '/batch'):
+            raise HTTPError(404, f"Bilinmeyen yol: {url.path}")
+        if method != 'POST':
+            raise HTTPError(405, "Yalnızca POST desteklenir")
+
+        if url.path == '/batch':
+            payload = self._decode_json(body)
+            specs = payload.get('requests') if isinstance(payload, dict) else payload
+            if not isinstance(specs, list):
+                raise HTTPError(400, "'requests' bir liste olmalıdır")
+            await self._send_json(writer, 200, {'results': await self._batch(specs)})
+            return
+
+        if headers.get('content-type', '').split(';')[0].strip() == 'application/octet-stream':
+            try:
+                workload = decode_workload(body, "İstek gövdesi")
+            except ValueError as e:
+                raise HTTPError(400, str(e))
+            options = query
+        else:
+            options = dict(query)
+            spec = self._decode_json(body)
+            if not isinstance(spec, dict):
+                raise HTTPError(400, "İstek gövdesi bir JSON nesnesi olmalıdır")
+            options.update(spec)
+            workload = parse_json_workload(spec)
+
+        summaries, timeline_dir = await self.simulate(workload, *parse_options(options))
+        if timeline_dir is None:
+            await self._send_json(writer, 200, {'results': summaries})
+            return
+        try:
+            await self._stream(writer, summaries)
+        finally:
+            shutil.rmtree(timeline_dir, ignore_errors=True)
+
+    async def handle(self, reader, writer):
+        try:
+            request = await self._read_request(reader)
+            if request is not None:
+                await self.route(writer, *request)
+        except HTTPError as e:
+            await self._send_json(writer, e.status, {'error': e.message})
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            await self._send_json(writer, 500, {'error': f"Simülasyon hatası: {e}"})
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def serve(host, port, workers, max_concurrency):
+    service = SimulationService(workers, max_concurrency)
+    server = await service.start(host, port)
+    print(f"Simülasyon servisi http://{host}:{port} adresinde çalışıyor "
+          f"({service.workers} işçi, en fazla {max_concurrency} eşzamanlı istek)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} pozitif bir tam sayı değil")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel HTTP/JSON CPU zamanlama simülasyon servisi")
+    parser.add_argument('--host', default='127.0.0.1', help="dinlenecek adres (varsayılan: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8765, help="dinlenecek port (varsayılan: 8765)")
+    parser.add_argument('--workers', type=positive_int, help="işçi süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--max-concurrency', type=positive_int, default=4,
+                        help="aynı anda çalışan en fazla istek sayısı (varsayılan: 4)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_concurrency))
+    except KeyboardInterrupt:
+        print("\nServis durduruldu")
+
+
+if __name__ == "__main__":
+    main()
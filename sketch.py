@@ -0,0 +1,116 @@
+import math
+from collections import Counter
+from itertools import islice
+
+PERCENTILES = (('p50', 0.5), ('p95', 0.95), ('p99', 0.99), ('p99.9', 0.999))
+DEFAULT_ACCURACY = 0.01
+CHUNK_SIZE = 65536
+
+
+class QuantileSketch:
+    __slots__ = ('relative_accuracy', 'gamma', 'log_gamma', 'buckets', 'zero_count',
+                 'count', 'total', 'min', 'max')
+
+    def __init__(self, relative_accuracy=DEFAULT_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Göreli doğruluk 0 ile 1 arasında olmalıdır")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def __len__(self):
+        return self.count
+
+    def _bucket(self, value):
+        return math.ceil(math.log(value) / self.log_gamma)
+
+    def add(self, value, count=1):
+        if value < 0:
+            raise ValueError(f"Eskize negatif değer eklenemez: {value}")
+        if value == 0:
+            self.zero_count += count
+        else:
+            index = self._bucket(value)
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def update(self, values):
+        values = iter(values)
+        chunk = list(islice(values, CHUNK_SIZE))
+        while chunk:
+            total = sum(chunk, self.total)
+            for value, count in Counter(chunk).items():
+                self.add(value, count)
+            self.total = total
+            chunk = list(islice(values, CHUNK_SIZE))
+        return self
+
+    def merge(self, other):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Farklı doğruluktaki eskizler birleştirilemez")
+        buckets = self.buckets
+        for index, count in other.buckets.items():
+            buckets[index] = buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        return self
+
+    def _value(self, index):
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def quantile(self, q):
+        if not 0 <= q <= 1:
+            raise ValueError(f"Yüzdelik 0 ile 1 arasında olmalıdır: {q}")
+        if not self.count:
+            return 0
+        rank = int(q * (self.count - 1))
+        if rank < self.zero_count:
+            return 0
+        seen = self.zero_count
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return min(max(self._value(index), self.min), self.max)
+        return self.max
+
+    def percentiles(self):
+        return {name: self.quantile(q) for name, q in PERCENTILES}
+
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def histogram(self):
+        rows = [(0, 0, self.zero_count)] if self.zero_count else []
+        gamma = self.gamma
+        for index in sorted(self.buckets):
+            rows.append((gamma ** (index - 1), gamma ** index, self.buckets[index]))
+        return rows
+
+
+def sketch_of(values, relative_accuracy=DEFAULT_ACCURACY):
+    return QuantileSketch(relative_accuracy).update(values)
+
+
+def merge_sketches(sketches):
+    merged = None
+    for sketch in sketches:
+        if merged is None:
+            merged = QuantileSketch(sketch.relative_accuracy)
+        merged.merge(sketch)
+    return merged
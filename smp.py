@@ -0,0 +1,343 @@
+import heapq
+from collections import deque
+from scheduler import RunContext, Scheduler
+from timeline import Timeline
+from instrumentation import profiled
+
+POLICIES = {
+    'fcfs': ('index', False),
+    'sjf_nonpreemptive': ('bursts', False),
+    'sjf_preemptive': ('remaining', True),
+    'round_robin': (None, False),
+    'priority_nonpreemptive': ('priorities', False),
+    'priority_preemptive': ('priorities', True)
+}
+
+QUEUE_MODES = ('global', 'per_core')
+
+
+class CoreTimelines:
+    __slots__ = ('tables',)
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    def __iter__(self):
+        return heapq.merge(*self.tables)
+
+    def __len__(self):
+        return sum(map(len, self.tables))
+
+
+class SMPScheduler(Scheduler):
+    def __init__(self, cpus=1, queue='global', work_stealing=True, affinity=False, migration_cost=0,
+                 context_switch_time=0.001, timeline=None, instrument=False, profile=None):
+        if cpus < 1:
+            raise ValueError("İşlemci sayısı en az 1 olmalıdır")
+        if queue not in QUEUE_MODES:
+            raise ValueError(f"Bilinmeyen kuyruk modu: {queue}")
+        super().__init__(context_switch_time, timeline, instrument, profile)
+        self.cpus = cpus
+        self.queue = queue
+        self.work_stealing = work_stealing
+        self.affinity = affinity
+        self.migration_cost = migration_cost
+
+    def _simulate(self, processes, algorithm, quantum=None):
+        ctx = RunContext(processes, None, self.instrument, (algorithm,))
+        workload = ctx.workload
+        pids, arrivals, bursts = workload.pids, workload.arrivals, workload.bursts
+        n = len(workload)
+        start_times = ctx.start_times
+        completion_times = ctx.completion_times
+        response_times = ctx.response_times
+
+        key_name, preemptive = POLICIES[algorithm]
+        round_robin = algorithm == 'round_robin'
+        by_remaining = key_name == 'remaining'
+        records_start = algorithm in ('fcfs', 'sjf_nonpreemptive', 'priority_nonpreemptive')
+        remaining_time = list(bursts)
+        if key_name == 'index':
+            keys = range(n)
+        elif by_remaining:
+            keys = remaining_time
+        elif key_name is not None:
+            keys = getattr(workload, key_name)
+
+        cpus = self.cpus
+        per_core = self.queue == 'per_core'
+        stealing = per_core and self.work_stealing
+        affinity = self.affinity
+        migration_cost = self.migration_cost
+
+        queues = [deque() if round_robin else [] for _ in range(cpus if per_core else 1)]
+        running = [-1] * cpus
+        slice_start = [0] * cpus
+        slice_end = [0] * cpus
+        version = [0] * cpus
+        prev = [-1] * cpus
+        free_since = [0] * cpus
+        busy = [0] * cpus
+        is_idle = [True] * cpus
+        idle = list(range(cpus))
+        last_core = [-1] * n
+        if self.timeline is not None:
+            tables = [self.timeline(f"{algorithm}_cpu{core}") for core in range(cpus)]
+        else:
+            tables = [[] for _ in range(cpus)]
+        events = []
+        running_heap = []
+
+        counters = {'waiting': 0, 'context_switches': 0, 'migrations': 0, 'steals': 0,
+                    'preemptions': 0, 'events': 0}
+
+        def push_ready(queue, idx):
+            if round_robin:
+                queue.append(idx)
+            else:
+                heapq.heappush(queue, (keys[idx], idx))
+            counters['waiting'] += 1
+
+        def pop_ready(queue):
+            counters['waiting'] -= 1
+            if round_robin:
+                return queue.popleft()
+            return heapq.heappop(queue)[1]
+
+        def pop_idle():
+            while idle:
+                core = heapq.heappop(idle)
+                if is_idle[core]:
+                    return core
+            return -1
+
+        def dispatch(core, idx, t):
+            if last_core[idx] != -1 and last_core[idx] != core and migration_cost:
+                remaining_time[idx] += migration_cost
+                counters['migrations'] += 1
+            last_core[idx] = core
+            is_idle[core] = False
+
+            if free_since[core] < t:
+                tables[core].append((free_since[core], "IDLE", t - free_since[core]))
+            if records_start:
+                start_times[idx] = t
+            elif response_times[idx] == -1:
+                response_times[idx] = t - arrivals[idx]
+            if round_robin or prev[core] != idx:
+                counters['context_switches'] += 1
+            prev[core] = idx
+
+            run = min(quantum, remaining_time[idx]) if round_robin else remaining_time[idx]
+            running[core] = idx
+            slice_start[core] = t
+            slice_end[core] = t + run
+            version[core] += 1
+            heapq.heappush(events, (t + run, core, version[core]))
+            if preemptive and not per_core:
+                running_key = -(t + run) if by_remaining else -keys[idx]
+                heapq.heappush(running_heap, (running_key, -idx, core, version[core]))
+
+        def stop(core, t):
+            idx = running[core]
+            duration = t - slice_start[core]
+            if duration > 0:
+                tables[core].append((slice_start[core], pids[idx], duration))
+                busy[core] += duration
+                remaining_time[idx] -= duration
+            running[core] = -1
+            version[core] += 1
+            free_since[core] = t
+            return idx
+
+        def running_key(core, t):
+            if by_remaining:
+                return slice_end[core] - t
+            return keys[running[core]]
+
+        def steal(core, t):
+            victim = max(range(cpus), key=lambda c: len(queues[c]))
+            queue = queues[victim]
+            if not queue:
+                return False
+            if affinity:
+                candidates = [entry for entry in queue
+                              if last_core[entry if round_robin else entry[1]] == -1]
+                if not candidates:
+                    return False
+                entry = candidates[0] if round_robin else min(candidates)
+                queue.remove(entry)
+                if not round_robin:
+                    heapq.heapify(queue)
+                counters['waiting'] -= 1
+                idx = entry if round_robin else entry[1]
+            else:
+                idx = pop_ready(queue)
+            counters['steals'] += 1
+            dispatch(core, idx, t)
+            return True
+
+        def schedule_global(t):
+            queue = queues[0]
+            while counters['waiting']:
+                while idle and not is_idle[idle[0]]:
+                    heapq.heappop(idle)
+                if not idle:
+                    break
+                idx = pop_ready(queue)
+                core = last_core[idx] if affinity else -1
+                if core == -1 or not is_idle[core]:
+                    core = heapq.heappop(idle)
+                dispatch(core, idx, t)
+
+            if not preemptive:
+                return
+            while counters['waiting']:
+                while running_heap and running_heap[0][3] != version[running_heap[0][2]]:
+                    heapq.heappop(running_heap)
+                if not running_heap:
+                    return
+                core = running_heap[0][2]
+                if queue[0][0] >= running_key(core, t):
+                    return
+                idx = pop_ready(queue)
+                push_ready(queue, stop(core, t))
+                counters['preemptions'] += 1
+                dispatch(core, idx, t)
+
+        def schedule_per_core(t, dirty):
+            for core in sorted(dirty):
+                queue = queues[core]
+                if is_idle[core]:
+                    if queue:
+                        dispatch(core, pop_ready(queue), t)
+                    elif stealing:
+                        steal(core, t)
+                elif preemptive and queue and queue[0][0] < running_key(core, t):
+                    idx = pop_ready(queue)
+                    push_ready(queue, stop(core, t))
+                    counters['preemptions'] += 1
+                    dispatch(core, idx, t)
+
+            if stealing and counters['waiting']:
+                skipped = []
+                while counters['waiting']:
+                    core = pop_idle()
+                    if core == -1:
+                        break
+                    if not steal(core, t):
+                        skipped.append(core)
+                        break
+                for core in skipped:
+                    heapq.heappush(idle, core)
+
+        completed = 0
+        cursor = 0
+        current_time = 0
+        infinity = float('inf')
+
+        while completed != n:
+            while events and events[0][2] != version[events[0][1]]:
+                heapq.heappop(events)
+            next_event = events[0][0] if events else infinity
+            next_arrival = arrivals[cursor] if cursor < n else infinity
+            current_time = min(next_event, next_arrival)
+            counters['events'] += 1
+
+            dirty = set()
+            expired = []
+            while events and events[0][0] == current_time:
+                _, core, core_version = heapq.heappop(events)
+                if core_version != version[core]:
+                    continue
+                idx = stop(core, current_time)
+                if remaining_time[idx] == 0:
+                    completion_times[idx] = current_time
+                    completed += 1
+                else:
+                    expired.append((core, idx))
+                is_idle[core] = True
+                heapq.heappush(idle, core)
+                dirty.add(core)
+
+            while cursor < n and arrivals[cursor] <= current_time:
+                if per_core:
+                    core = pop_idle()
+                    if core == -1:
+                        core = cursor % cpus
+                    dirty.add(core)
+                    push_ready(queues[core], cursor)
+                else:
+                    push_ready(queues[0], cursor)
+                cursor += 1
+
+            for core, idx in expired:
+                push_ready(queues[core] if per_core else queues[0], idx)
+
+            if per_core:
+                schedule_per_core(current_time, dirty)
+            else:
+                schedule_global(current_time)
+
+        for table in tables:
+            if isinstance(table, Timeline):
+                table.close()
+        ctx.time_table = CoreTimelines(tables)
+        ctx.context_switches = counters['context_switches']
+        ctx.total_time = current_time
+        ctx.count(events=counters['events'], preemptions=counters['preemptions'],
+                  migrations=counters['migrations'], steals=counters['steals'])
+
+        utilization = [core_busy / current_time if current_time else 0 for core_busy in busy]
+        extra = {
+            'cpus': cpus,
+            'core_time_tables': tables,
+            'utilization': utilization,
+            'avg_utilization': sum(utilization) / cpus,
+            'migrations': counters['migrations'],
+            'steals': counters['steals']
+        }
+        if round_robin:
+            extra['quantum'] = quantum
+        return self._results(ctx, **extra)
+
+    def calculate_cpu_efficiency(self, processes, total_time, context_switches):
+        return super().calculate_cpu_efficiency(processes, total_time * self.cpus, context_switches)
+
+    def _reject_aging(self, aging_interval):
+        if aging_interval is not None:
+            raise ValueError("SMP zamanlayıcısı yaşlandırmayı desteklemez")
+
+    @profiled
+    def fcfs(self, processes, previous=None):
+        return self._simulate(processes, 'fcfs')
+
+    @profiled
+    def sjf_nonpreemptive(self, processes, previous=None):
+        return self._simulate(processes, 'sjf_nonpreemptive')
+
+    @profiled
+    def sjf_preemptive(self, processes, previous=None):
+        return self._simulate(processes, 'sjf_preemptive')
+
+    @profiled
+    def round_robin(self, processes, quantum=4, previous=None):
+        if quantum <= 0:
+            raise ValueError("Zaman dilimi pozitif olmalıdır")
+        return self._simulate(processes, 'round_robin', quantum)
+
+    @profiled
+    def priority_nonpreemptive(self, processes, previous=None, aging_interval=None, aging_limit=1):
+        self._reject_aging(aging_interval)
+        return self._simulate(processes, 'priority_nonpreemptive')
+
+    @profiled
+    def priority_preemptive(self, processes, previous=None, aging_interval=None, aging_limit=1):
+        self._reject_aging(aging_interval)
+        return self._simulate(processes, 'priority_preemptive')
+
+    def mlfq(self, processes, quanta=(4, 8, 16), boost_period=100):
+        raise ValueError("SMP zamanlayıcısı mlfq algoritmasını desteklemez")
+
+    def cfs(self, processes, target_latency=24, min_granularity=3):
+        raise ValueError("SMP zamanlayıcısı cfs algoritmasını desteklemez")
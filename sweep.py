@@ -0,0 +1,138 @@
+import argparse
+import csv
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from scheduler import Scheduler
+from timeline import discard
+from utils import load_workload
+from binary_workload import load_binary
+
+SURFACE_FIELDS = ['quantum', 'context_switch_time', 'avg_wait', 'max_turnaround',
+                  'cpu_efficiency', 'context_switches', 'total_time']
+
+_worker_workload = None
+_worker_schedulers = []
+
+
+def _init_worker(workload, context_switch_times):
+    global _worker_workload, _worker_schedulers
+    _worker_workload = workload
+    _worker_schedulers = [Scheduler(cst, timeline=discard()) for cst in context_switch_times]
+
+
+def _simulate(quantum):
+    results = _worker_schedulers[0].round_robin(_worker_workload, quantum)
+    metrics = results['metrics']
+    rows = []
+    for scheduler in _worker_schedulers:
+        rows.append({
+            'quantum': quantum,
+            'context_switch_time': scheduler.context_switch_time,
+            'avg_wait': metrics['avg_wait'],
+            'max_turnaround': metrics['max_turnaround'],
+            'cpu_efficiency': scheduler.calculate_cpu_efficiency(
+                results['processes'], results['total_time'], results['context_switches']
+            ),
+            'context_switches': results['context_switches'],
+            'total_time': results['total_time']
+        })
+    return rows
+
+
+def _objectives(row):
+    return (row['avg_wait'], row['max_turnaround'], -row['cpu_efficiency'])
+
+
+def _dominates(a, b):
+    return all(x <= y for x, y in zip(a, b)) and a != b
+
+
+def pareto_front(rows):
+    front = []
+    for row in sorted(rows, key=_objectives):
+        objectives = _objectives(row)
+        if not any(_dominates(_objectives(kept), objectives) or _objectives(kept) == objectives
+                   for kept in front):
+            front.append(row)
+    return front
+
+
+def sweep_round_robin(workload, quanta, context_switch_times, workers=None):
+    quanta = list(quanta)
+    context_switch_times = list(context_switch_times)
+    if not quanta or not context_switch_times:
+        raise ValueError("En az bir quantum ve bir bağlam değiştirme süresi gerekli")
+
+    workers = min(workers or os.cpu_count() or 1, len(quanta))
+    if workers == 1:
+        _init_worker(workload, context_switch_times)
+        point_rows = [_simulate(quantum) for quantum in quanta]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(workload, context_switch_times)
+        ) as executor:
+            chunksize = max(1, len(quanta) // (workers * 4))
+            point_rows = list(executor.map(_simulate, quanta, chunksize=chunksize))
+
+    surface = [row for rows in point_rows for row in rows]
+    pareto = {}
+    for cst in context_switch_times:
+        pareto[cst] = pareto_front([row for row in surface if row['context_switch_time'] == cst])
+
+    return {'surface': surface, 'pareto': pareto}
+
+
+def parse_values(text, convert):
+    if ':' in text:
+        parts = [convert(part) for part in text.split(':')]
+        if len(parts) == 2:
+            parts.append(1)
+        start, stop, step = parts
+        if step <= 0:
+            raise ValueError(f"Geçersiz adım: {step}")
+        return [start + i * step for i in range(int((stop - start) / step + 1e-9) + 1)]
+    return [convert(part) for part in text.split(',')]
+
+
+def save_surface(surface, file_path):
+    with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=SURFACE_FIELDS)
+        writer.writeheader()
+        writer.writerows(surface)
+    return file_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Round Robin quantum ve bağlam değiştirme süresi taraması")
+    parser.add_argument('workload', help="iş yükü dosyası (.csv veya .bin)")
+    parser.add_argument('--quanta', default='1:32',
+                        help="quantum değerleri: başlangıç:bitiş[:adım] veya virgülle ayrılmış liste")
+    parser.add_argument('--cst', default='0.001',
+                        help="bağlam değiştirme süreleri: başlangıç:bitiş[:adım] veya virgülle ayrılmış liste")
+    parser.add_argument('--workers', type=int, help="işçi süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--output', default='rr_sweep.csv', help="metrik yüzeyinin yazılacağı CSV dosyası")
+    args = parser.parse_args()
+
+    if args.workload.endswith('.bin'):
+        workload = load_binary(args.workload)
+    else:
+        workload = load_workload(args.workload)
+    if workload is None:
+        sys.exit(1)
+
+    sweep = sweep_round_robin(workload, parse_values(args.quanta, int),
+                              parse_values(args.cst, float), args.workers)
+    print(f"Metrik yüzeyi kaydedildi: {save_surface(sweep['surface'], args.output)}")
+
+    for cst, front in sweep['pareto'].items():
+        print(f"\nPareto-optimal ayarlar (bağlam değiştirme süresi={cst}):")
+        for row in front:
+            print(f"  quantum={row['quantum']:<5} ort. bekleme={row['avg_wait']:.2f} "
+                  f"maks. tamamlanma={row['max_turnaround']} verim={row['cpu_efficiency']:.2f}%")
+
+
+if __name__ == "__main__":
+    main()
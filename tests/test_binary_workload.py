@@ -0,0 +1,56 @@
+import os
+import pickle
+import pytest
+from binary_workload import convert_csv, decode_workload, load_binary, write_workload
+from process import Workload
+from scheduler import Scheduler
+from utils import load_workload
+from workloads import DATA_DIR, random_rows, workload
+
+
+def columns(loaded):
+    return (list(loaded.pids), list(loaded.arrivals), list(loaded.bursts), list(loaded.priorities))
+
+
+def test_round_trip_through_mapped_file(tmp_path):
+    loaded = workload(random_rows(2, 300) + [('P001', 1000, 4, 2)])
+    path = write_workload(loaded, str(tmp_path / 'trace.bin'))
+    mapped = load_binary(path)
+    assert columns(mapped) == columns(loaded)
+    assert columns(decode_workload(open(path, 'rb').read())) == columns(loaded)
+    assert columns(pickle.loads(pickle.dumps(mapped))) == columns(loaded)
+    assert Scheduler().round_robin(mapped)['metrics'] == Scheduler().round_robin(loaded)['metrics']
+
+
+def test_convert_csv_matches_csv_loader(tmp_path):
+    csv_path = os.path.join(DATA_DIR, 'case1.csv')
+    path = convert_csv(csv_path, str(tmp_path / 'case1.bin'))
+    assert columns(load_binary(path)) == columns(load_workload(csv_path))
+
+
+def test_decode_sorts_unsorted_rows(tmp_path):
+    rows = [('a', 5, 3, 1), ('b', 0, 4, 2), ('c', 2, 1, 3)]
+    unsorted = Workload(*zip(*rows), presorted=True)
+    path = write_workload(unsorted, str(tmp_path / 'unsorted.bin'))
+    decoded = decode_workload(open(path, 'rb').read())
+    assert list(decoded.pids) == ['b', 'c', 'a']
+    assert Scheduler().fcfs(decoded)['metrics'] == Scheduler().fcfs(workload(rows))['metrics']
+
+
+@pytest.mark.parametrize('row', [('a', 0, 0, 1), ('a', 0, -2, 1), ('a', -1, 3, 1)])
+def test_decode_rejects_invalid_rows(tmp_path, row):
+    path = write_workload(Workload(*zip(row), presorted=True), str(tmp_path / 'bad.bin'))
+    with pytest.raises(ValueError):
+        decode_workload(open(path, 'rb').read())
+
+
+@pytest.mark.parametrize('data', [b'', b'NOTAWORKLOAD' + bytes(32)])
+def test_decode_rejects_foreign_data(data):
+    with pytest.raises(ValueError):
+        decode_workload(data)
+
+
+def test_decode_rejects_truncated_data(tmp_path):
+    path = write_workload(workload(random_rows(4, 10)), str(tmp_path / 'trace.bin'))
+    with pytest.raises(ValueError):
+        decode_workload(open(path, 'rb').read()[:-40])
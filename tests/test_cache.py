@@ -0,0 +1,54 @@
+import os
+from cache import ResultCache, result_key, workload_digest
+from scheduler import Scheduler
+from workloads import process_rows, random_rows, workload
+
+
+def test_round_trip_restores_results(tmp_path):
+    loaded = workload(random_rows(3, 80))
+    results = Scheduler().round_robin(loaded, 3)
+    cache = ResultCache(str(tmp_path))
+    key = result_key(workload_digest(loaded), 'round_robin', [3])
+    cache.put(key, results)
+
+    cached = cache.get(key, loaded)
+    assert cached['cache_key'] == key
+    assert process_rows(cached) == process_rows(results)
+    assert list(cached['time_table']) == list(results['time_table'])
+    for name in ('metrics', 'total_time', 'context_switches', 'quantum'):
+        assert cached[name] == results[name]
+
+
+def test_keys_follow_workload_and_parameters():
+    rows = random_rows(4, 30)
+    digest = workload_digest(workload(rows))
+    assert workload_digest(workload(list(rows))) == digest
+    changed = list(rows)
+    changed[5] = (changed[5][0], changed[5][1], changed[5][2] + 1, changed[5][3])
+    assert workload_digest(workload(changed)) != digest
+    assert result_key(digest, 'round_robin', [3]) == result_key(digest, 'round_robin', [3])
+    assert result_key(digest, 'round_robin', [3]) != result_key(digest, 'round_robin', [4])
+    assert result_key(digest, 'fcfs', []) != result_key(digest, 'sjf_nonpreemptive', [])
+
+
+def test_missing_and_corrupt_entries_miss(tmp_path):
+    loaded = workload(random_rows(5, 10))
+    cache = ResultCache(str(tmp_path))
+    assert cache.get('missing', loaded) is None
+    path = tmp_path / 'broken.bin'
+    path.write_bytes(b'not a cache entry')
+    assert cache.get('broken', loaded) is None
+    assert not path.exists()
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    loaded = workload(random_rows(6, 200))
+    results = Scheduler().fcfs(loaded)
+    cache = ResultCache(str(tmp_path))
+    for age, key in enumerate(('a', 'b', 'c')):
+        cache.put(key, dict(results))
+        os.utime(tmp_path / f"{key}.bin", (1000 + age, 1000 + age))
+    cache.get('a', loaded)
+    cache.max_bytes = os.path.getsize(tmp_path / 'a.bin') * 2
+    cache.evict()
+    assert sorted(os.listdir(tmp_path)) == ['a.bin', 'c.bin']
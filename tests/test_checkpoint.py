@@ -0,0 +1,73 @@
+import random
+from array import array
+import pytest
+from process import Workload
+from scheduler import Scheduler, _first_difference
+from timeline import in_memory
+from workloads import ALGORITHMS, process_rows, random_rows, workload
+
+
+def edit(rows, rnd, step):
+    rows = list(rows)
+    op = rnd.choice('aer')
+    if op == 'a' or not rows:
+        rows.append((f"N{step}", rnd.randint(0, 160), rnd.randint(1, 15), rnd.randint(1, 3)))
+    elif op == 'e':
+        i = rnd.randrange(len(rows))
+        pid, arrival, _, priority = rows[i]
+        rows[i] = (pid, arrival, rnd.randint(1, 15), priority)
+    else:
+        rows.pop(rnd.randrange(len(rows)))
+    return rows
+
+
+@pytest.mark.parametrize('timeline', [None, in_memory], ids=['list', 'memory'])
+@pytest.mark.parametrize('method_name, args', ALGORITHMS)
+@pytest.mark.parametrize('seed', range(25))
+def test_resume_matches_full_run(timeline, method_name, args, seed):
+    rnd = random.Random(seed)
+    rows = random_rows(seed, rnd.randint(1, 40), spread=4, max_burst=15, levels=3)
+    options = {'timeline': timeline()} if timeline else {}
+    scheduler = Scheduler(checkpoint_interval=rnd.choice([1, 5, 20]), **options)
+
+    previous = getattr(scheduler, method_name)(workload(rows), *args)
+    for step in range(3):
+        rows = edit(rows, rnd, step)
+        full = getattr(Scheduler(**options), method_name)(workload(rows), *args)
+        resumed = getattr(scheduler, method_name)(workload(rows), *args, previous=previous)
+
+        assert list(resumed['time_table']) == list(full['time_table'])
+        assert process_rows(resumed) == process_rows(full)
+        assert resumed['context_switches'] == full['context_switches']
+        assert resumed['total_time'] == full['total_time']
+        assert resumed['metrics'] == full['metrics']
+        previous = resumed
+
+
+def test_unchanged_prefix_reuses_checkpoints():
+    rows = random_rows(1, 40)
+    scheduler = Scheduler(checkpoint_interval=5)
+    previous = scheduler.round_robin(workload(rows), 3)
+    last = max(row[1] for row in rows)
+    resumed = scheduler.round_robin(workload(rows + [('LATE', last + 1, 2, 1)]), 3, previous=previous)
+    assert resumed['checkpoints'][0] is previous['checkpoints'][0]
+
+
+@pytest.mark.parametrize('columns', [tuple, list, lambda values: array('q', values)], ids=['tuple', 'list', 'array'])
+@pytest.mark.parametrize('seed', range(20))
+def test_first_difference_finds_earliest_change(columns, seed):
+    rnd = random.Random(seed)
+    rows = [(f"P{i}", i, rnd.randint(1, 9), rnd.randint(1, 3)) for i in range(rnd.randint(0, 10000))]
+    changed = list(rows)
+    if changed and seed % 4:
+        i = rnd.randrange(len(changed))
+        field = rnd.randrange(4)
+        row = list(changed[i])
+        row[field] = row[field] + 'x' if field == 0 else row[field] + 1
+        changed[i] = tuple(row)
+    if seed % 3 == 0:
+        changed = changed[:rnd.randint(0, len(changed))]
+    expected = next((i for i, (a, b) in enumerate(zip(rows, changed)) if a != b), min(len(rows), len(changed)))
+    new = Workload([row[0] for row in changed], *(columns([row[k] for row in changed]) for k in (1, 2, 3)),
+                   presorted=True)
+    assert _first_difference(workload(rows), new) == expected
@@ -0,0 +1,30 @@
+import pytest
+from scheduler import Scheduler
+from workloads import random_rows, workload
+
+pytest.importorskip('numpy')
+columnar = pytest.importorskip('columnar')
+
+
+def test_columnar_backend_matches_scheduler():
+    rows = random_rows(3, 200)
+    loaded = workload(rows)
+    columns = columnar.ColumnarWorkload(list(loaded.pids), list(loaded.arrivals), list(loaded.bursts),
+                                        list(loaded.priorities))
+    for method_name in ('fcfs', 'sjf_nonpreemptive', 'priority_nonpreemptive'):
+        expected = getattr(Scheduler(), method_name)(loaded)
+        results = getattr(columnar.ColumnarScheduler(), method_name)(columns)
+        assert results['metrics'] == expected['metrics']
+        assert set(results) == set(expected)
+        assert list(results['time_table']) == list(expected['time_table'])
+
+
+def test_sketches_match_scalar_sketches():
+    import numpy as np
+    from sketch import QuantileSketch
+    values = [0, 0, 0.5, 1, 1, 2, 7.25, 40, 1000.125, 31337]
+    sketch = columnar._sketch_of(np.array(values))
+    expected = QuantileSketch().update(values)
+    assert sketch.histogram() == expected.histogram()
+    assert (sketch.count, sketch.min, sketch.max, sketch.total) == \
+        (expected.count, expected.min, expected.max, expected.total)
@@ -0,0 +1,28 @@
+import tracemalloc
+import pytest
+from instrumentation import profile_call
+from scheduler import Scheduler
+from workloads import random_rows, workload
+
+
+@pytest.mark.parametrize('reset_peak', [True, False], ids=['reset_peak', 'restart'])
+def test_tracemalloc_peak_is_per_call(monkeypatch, reset_peak):
+    if not reset_peak:
+        monkeypatch.delattr(tracemalloc, 'reset_peak', raising=False)
+    loaded = workload(random_rows(12, 200))
+    tracemalloc.start()
+    try:
+        ballast = [bytes(1 << 20) for _ in range(8)]
+        del ballast
+        results = profile_call('tracemalloc', Scheduler().fcfs, loaded, top=3)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    report = results['instrumentation']['profile']
+    assert 0 < report['peak_bytes'] < 4 << 20
+    assert len(report['top']) <= 3
+
+
+def test_unknown_profile_mode_is_rejected():
+    with pytest.raises(ValueError):
+        profile_call('perf', Scheduler().fcfs, workload([]))
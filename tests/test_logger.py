@@ -0,0 +1,65 @@
+import json
+import multiprocessing
+import sys
+import threading
+from logger import Logger
+
+
+def read_entries(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def log_many(worker, count):
+    for i in range(count):
+        worker.log('fcfs', f"case{i}", 'INFO', "işlendi")
+    worker.flush()
+
+
+def test_threads_write_every_record(tmp_path):
+    path = str(tmp_path / 'log.jsonl')
+    logger = Logger(path, console=False)
+    threads = [threading.Thread(target=lambda: [logger.log('fcfs', 'case', 'START') for _ in range(500)])
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    logger.close()
+
+    entries = read_entries(path)
+    assert len(entries) == logger.written == 2000
+    assert len({entry['thread'] for entry in entries}) == 4
+
+
+def test_worker_drops_reach_the_summary(tmp_path):
+    path = str(tmp_path / 'log.jsonl')
+    logger = Logger(path, sample_rate=0.5, console=False)
+    process = multiprocessing.Process(target=log_many, args=(logger.worker_logger(), 400))
+    process.start()
+    process.join()
+    logger.save_logs()
+
+    entries = read_entries(path)
+    summary = entries[-1]
+    assert summary['message'] == "Log özeti"
+    assert {entry['pid'] for entry in entries[:-1]} <= {process.pid}
+    assert len(entries) - 1 + summary['data']['sampled_out'] == 400
+
+
+def test_console_lines_leave_stdout_alone(tmp_path, capsys):
+    stdout = sys.stdout
+    first = Logger(str(tmp_path / 'a.jsonl'))
+    second = Logger(str(tmp_path / 'b.jsonl'))
+    first.log('fcfs', 'case1', 'SUCCESS', "bitti")
+    second.log('sjf', 'case2', 'ERROR', "hata")
+    first.close()
+    print("araya giren satır")
+    second.close()
+    print("son satır")
+
+    assert sys.stdout is stdout
+    out = capsys.readouterr().out
+    assert "[SUCCESS] fcfs - case1: bitti" in out
+    assert "[ERROR] sjf - case2: hata" in out
+    assert "araya giren satır\n" in out and out.endswith("son satır\n")
@@ -0,0 +1,61 @@
+import random
+import pytest
+from online import ALGORITHMS, OnlineScheduler, stream
+from scheduler import Scheduler
+from timeline import MemoryTimeline
+from workloads import coalesce, random_rows, workload
+
+
+def quantum_args(algorithm):
+    return (3,) if algorithm == 'round_robin' else ()
+
+
+def trim_idle(time_table):
+    time_table = coalesce(time_table)
+    while time_table and time_table[-1][1] == 'IDLE':
+        time_table.pop()
+    return time_table
+
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+@pytest.mark.parametrize('seed', range(40))
+def test_online_matches_batch(algorithm, seed):
+    rnd = random.Random(seed)
+    loaded = workload(random_rows(seed, rnd.randint(1, 40), levels=3))
+    batch = getattr(Scheduler(), algorithm)(loaded, *quantum_args(algorithm))
+    expected = {p.pid: (p.start_time, p.completion_time, p.response_time) for p in batch['processes']}
+
+    timeline = MemoryTimeline()
+    online = OnlineScheduler(algorithm, 3, timeline)
+    events = []
+    processes = list(loaded)
+    i = 0
+    t = 0
+    while i < len(processes):
+        t += rnd.randint(0, 6)
+        while i < len(processes) and processes[i].arrival <= t:
+            online.submit(processes[i])
+            i += 1
+        events += online.advance(t)
+    events += online.drain()
+    timeline.close()
+
+    assert {e.pid: (e.start_time, e.completion_time, e.response_time) for e in events} == expected
+    assert [e.completion_time for e in events] == sorted(e.completion_time for e in events)
+    assert trim_idle(list(timeline)) == coalesce(list(batch['time_table']))
+    assert online.metrics()['context_switches'] == batch['context_switches']
+    assert online.metrics()['avg_wait'] == pytest.approx(batch['metrics']['avg_wait'])
+
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+def test_stream_matches_batch(algorithm):
+    loaded = workload(random_rows(5, 50, levels=3))
+    batch = getattr(Scheduler(), algorithm)(loaded, *quantum_args(algorithm))
+    expected = {p.pid: (p.start_time, p.completion_time, p.response_time) for p in batch['processes']}
+    events = stream(loaded, algorithm, 3)
+    assert {e.pid: (e.start_time, e.completion_time, e.response_time) for e in events} == expected
+
+
+def test_round_robin_rejects_non_positive_quantum():
+    with pytest.raises(ValueError):
+        OnlineScheduler('round_robin', 0)
@@ -0,0 +1,71 @@
+import csv
+import os
+import pytest
+from result_writer import (EXPORT_FORMATS, PROCESS_FIELDS, TIME_TABLE_FIELDS, export_paths, export_results,
+                           pid_sort_key, process_columns, write_text)
+from scheduler import Scheduler
+from workloads import random_rows, workload
+
+
+def sample_results():
+    rows = random_rows(9, 40) + [('P2', 7, 3, 1), ('P10', 7, 2, 1)]
+    return Scheduler().priority_preemptive(workload(rows), aging_interval=4)
+
+
+def test_pid_sort_key_orders_numbers_naturally():
+    assert sorted(['P10', 'P2', 'A', 'P001', 'B3'], key=pid_sort_key) == ['A', 'B3', 'P001', 'P2', 'P10']
+
+
+def test_text_report(tmp_path):
+    results = sample_results()
+    path = write_text(results, 'priority', 'case', str(tmp_path / 'report.txt'))
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    metrics = results['metrics']
+    assert text.startswith("=== PRIORITY - CASE ===")
+    assert f"Ortalama Bekleme Süresi: {metrics['avg_wait']:.2f}\n" in text
+    assert f"Toplam Bağlam Değiştirme Sayısı: {results['context_switches']}\n" in text
+    assert "YÜZDELİKLER" in text and "AÇLIK İSTATİSTİKLERİ" in text
+    assert text.index("P2  |") < text.index("P10 |")
+    first_start, first_pid, first_duration = next(iter(results['time_table']))
+    assert f"[{first_start:3}] --- {first_pid:6} --- [{first_start + first_duration:3}]" in text
+
+
+def test_csv_export_matches_results(tmp_path):
+    results = sample_results()
+    paths = export_results(results, str(tmp_path), 'priority', ['csv'])
+    assert all(os.path.exists(path) for path in paths)
+
+    with open(paths[0], newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == PROCESS_FIELDS
+    columns = process_columns(results['processes'])
+    assert rows[1:] == [list(map(str, row)) for row in zip(*(columns[field] for field in PROCESS_FIELDS))]
+
+    with open(paths[1], newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == TIME_TABLE_FIELDS
+    assert rows[1:] == [list(map(str, entry)) for entry in results['time_table']]
+
+
+def test_numpy_exports_are_readable(tmp_path):
+    np = pytest.importorskip('numpy')
+    results = sample_results()
+    paths = export_results(results, str(tmp_path), 'priority', ['npy', 'npz'])
+    assert all(os.path.exists(path) for path in paths)
+
+    columns = process_columns(results['processes'])
+    archive = np.load(paths[-1])
+    for field in PROCESS_FIELDS:
+        expected = list(columns[field])
+        assert np.load(str(tmp_path / 'priority' / f"process_{field}.npy")).tolist() == expected
+        assert archive[f"process_{field}"].tolist() == expected
+    starts = [entry[0] for entry in results['time_table']]
+    assert np.load(str(tmp_path / 'priority' / 'time_table_start.npy')).tolist() == starts
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        export_paths(str(tmp_path), 'fcfs', ['xlsx'])
+    assert len(export_paths(str(tmp_path), 'fcfs', EXPORT_FORMATS)) == 2 + len(PROCESS_FIELDS) + \
+        len(TIME_TABLE_FIELDS) + 1
@@ -0,0 +1,114 @@
+import os
+import pytest
+import baseline_scheduler as baseline
+from scheduler import Scheduler
+from utils import load_workload
+from workloads import ALGORITHMS, DATA_DIR, OLD_METRICS, coalesce, process_rows, random_rows, workload
+
+
+def run_baseline(rows, method_name, args):
+    processes = [baseline.Process(*row) for row in rows]
+    return getattr(baseline.Scheduler(), method_name)(processes, *args)
+
+
+def assert_matches_baseline(expected, results):
+    assert process_rows(results) == process_rows(expected)
+    assert coalesce(list(results['time_table'])) == coalesce(expected['time_table'])
+    assert {name: results['metrics'][name] for name in OLD_METRICS} == expected['metrics']
+    assert results['context_switches'] == expected['context_switches']
+    assert results['total_time'] == expected['total_time']
+
+
+@pytest.mark.parametrize('method_name, args', ALGORITHMS)
+@pytest.mark.parametrize('seed', range(60))
+def test_random_workloads_match_baseline(method_name, args, seed):
+    rows = random_rows(seed)
+    expected = run_baseline(rows, method_name, args)
+    assert_matches_baseline(expected, getattr(Scheduler(), method_name)(workload(rows), *args))
+
+
+@pytest.mark.parametrize('method_name, args', ALGORITHMS)
+@pytest.mark.parametrize('case_name', ['case1', 'case2'])
+def test_data_cases_match_baseline(method_name, args, case_name):
+    loaded = load_workload(os.path.join(DATA_DIR, f"{case_name}.csv"))
+    rows = list(zip(loaded.pids, loaded.arrivals, loaded.bursts, loaded.priorities))
+    expected = run_baseline(rows, method_name, args)
+    assert_matches_baseline(expected, getattr(Scheduler(), method_name)(loaded, *args))
+
+
+@pytest.mark.parametrize('method_name', ['priority_nonpreemptive', 'priority_preemptive'])
+@pytest.mark.parametrize('seed', range(30))
+def test_aging_with_huge_interval_matches_plain_priority(method_name, seed):
+    rows = random_rows(seed)
+    plain = getattr(Scheduler(), method_name)(workload(rows))
+    aged = getattr(Scheduler(), method_name)(workload(rows), aging_interval=10 ** 9)
+    assert list(aged['time_table']) == list(plain['time_table'])
+    assert process_rows(aged) == process_rows(plain)
+    assert aged['context_switches'] == plain['context_switches']
+    assert aged['starvation']['aged_processes'] == 0
+
+
+def test_aging_promotes_one_level_per_interval():
+    rows = [('A', 0, 10.5, 5), ('B', 0.25, 3, 3), ('C', 0.5, 2, 4)]
+    results = Scheduler().priority_preemptive(workload(rows), aging_interval=0.75, aging_limit=0)
+    assert list(results['time_table'])[:3] == [(0, 'A', 0.25), (0.25, 'B', 1.75), (2.0, 'C', 1.25)]
+
+
+@pytest.mark.parametrize('method_name, kwargs', [
+    ('round_robin', {'quantum': 0}),
+    ('round_robin', {'quantum': -2}),
+    ('mlfq', {'quanta': ()}),
+    ('mlfq', {'quanta': (4, -1)}),
+    ('mlfq', {'quanta': (0, 8)}),
+    ('mlfq', {'boost_period': -5}),
+    ('cfs', {'min_granularity': 0}),
+    ('cfs', {'target_latency': 0}),
+    ('cfs', {'target_latency': -24})
+])
+def test_invalid_parameters_are_rejected(method_name, kwargs):
+    with pytest.raises(ValueError):
+        getattr(Scheduler(), method_name)(workload(random_rows(0, 5)), **kwargs)
+
+
+@pytest.mark.parametrize('method_name, kwargs', [
+    ('mlfq', {}),
+    ('mlfq', {'quanta': (1, 3), 'boost_period': 10}),
+    ('mlfq', {'quanta': (2,), 'boost_period': 0}),
+    ('cfs', {}),
+    ('cfs', {'target_latency': 6, 'min_granularity': 1})
+])
+@pytest.mark.parametrize('seed', range(30))
+def test_timeline_accounts_for_every_burst(method_name, kwargs, seed):
+    rows = random_rows(seed)
+    results = getattr(Scheduler(), method_name)(workload(rows), **kwargs)
+    arrival = {pid: a for pid, a, _, _ in rows}
+    ran = dict.fromkeys(arrival, 0)
+    end = 0
+    finished = {}
+    for start, pid, duration in results['time_table']:
+        assert start == end and duration > 0
+        end = start + duration
+        if pid != 'IDLE':
+            assert start >= arrival[pid]
+            ran[pid] += duration
+            finished[pid] = end
+    assert ran == {pid: burst for pid, _, burst, _ in rows}
+    assert end == results['total_time']
+    assert {row[0]: row[2] for row in process_rows(results)} == finished
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_single_level_mlfq_is_round_robin(seed):
+    rows = random_rows(seed)
+    mlfq = Scheduler().mlfq(workload(rows), quanta=(3,), boost_period=0)
+    rr = Scheduler().round_robin(workload(rows), 3)
+    assert process_rows(mlfq) == process_rows(rr)
+    assert coalesce(list(mlfq['time_table'])) == coalesce(list(rr['time_table']))
+
+
+def test_cfs_splits_target_latency_by_weight():
+    rows = [('A', 0, 4, 2), ('B', 0, 4, 2), ('C', 0, 2, 1)]
+    results = Scheduler().cfs(workload(rows), target_latency=8, min_granularity=1)
+    slices = list(results['time_table'])[:3]
+    assert [pid for _, pid, _ in slices] == ['A', 'B', 'C']
+    assert slices[0][2] == slices[1][2] < slices[2][2]
@@ -0,0 +1,77 @@
+import os
+import pytest
+from scheduler import Scheduler
+from segmented import SegmentedScheduler, busy_periods, group_periods
+from timeline import in_memory
+from utils import load_workload
+from workloads import DATA_DIR, bursty_rows, workload
+
+ALGORITHMS = [
+    ('fcfs', ()),
+    ('sjf_nonpreemptive', ()),
+    ('sjf_preemptive', ()),
+    ('round_robin', (3,)),
+    ('priority_nonpreemptive', ()),
+    ('priority_preemptive', ()),
+    ('mlfq', ()),
+    ('mlfq', ((2, 5), 7))
+]
+
+CASES = [workload(bursty_rows(seed, n)) for seed in range(6) for n in (1, 5, 50, 400)]
+
+
+def assert_same_results(expected, results):
+    assert set(results) == set(expected)
+    for name, value in expected.items():
+        if name == 'processes':
+            assert list(results[name].start_times) == list(value.start_times)
+            assert list(results[name].completion_times) == list(value.completion_times)
+            assert list(results[name].response_times) == list(value.response_times)
+        elif name == 'sketches':
+            for metric, sketch in value.items():
+                merged = results[name][metric]
+                assert merged.histogram() == sketch.histogram()
+                assert (merged.count, merged.min, merged.max, merged.total) == \
+                    (sketch.count, sketch.min, sketch.max, sketch.total)
+        elif name == 'time_table':
+            assert list(results[name]) == list(value)
+        else:
+            assert results[name] == value, name
+
+
+@pytest.mark.parametrize('timeline', [None, in_memory], ids=['list', 'memory'])
+def test_segmented_matches_serial(timeline):
+    cases = CASES + [load_workload(os.path.join(DATA_DIR, f"{name}.csv")) for name in ('case1', 'case2')]
+    with SegmentedScheduler(workers=3, chunks_per_worker=2, timeline=timeline() if timeline else None) as seg:
+        serial = Scheduler(timeline=timeline() if timeline else None)
+        for loaded in cases:
+            for method_name, args in ALGORITHMS:
+                expected = getattr(serial, method_name)(loaded, *args)
+                assert_same_results(expected, getattr(seg, method_name)(loaded, *args))
+
+
+def test_busy_periods_split_at_idle_gaps():
+    loaded = workload([('A', 0, 3, 1), ('B', 1, 2, 1), ('C', 5, 2, 1), ('D', 6, 4, 1), ('E', 20, 1, 1)])
+    assert busy_periods(loaded) == [0, 2, 4]
+    assert group_periods([0, 2, 4], 5, 2) == [(0, 2), (2, 4), (4, 5)]
+    assert group_periods([0, 2, 4], 5, 5) == [(0, 5)]
+
+
+@pytest.mark.parametrize('method_name', ['priority_nonpreemptive', 'priority_preemptive'])
+def test_aging_runs_like_serial(method_name):
+    loaded = workload(bursty_rows(3, 200))
+    expected = getattr(Scheduler(), method_name)(loaded, aging_interval=5, aging_limit=0)
+    with SegmentedScheduler(workers=3, chunks_per_worker=2) as seg:
+        assert_same_results(expected, getattr(seg, method_name)(loaded, aging_interval=5, aging_limit=0))
+
+
+def test_resume_from_previous_run():
+    rows = bursty_rows(4, 200)
+    previous = Scheduler(checkpoint_interval=10).round_robin(workload(rows), 3)
+    rows[-1] = (rows[-1][0], rows[-1][1], rows[-1][2] + 1, rows[-1][3])
+    expected = Scheduler().round_robin(workload(rows), 3)
+    with SegmentedScheduler(workers=3, chunks_per_worker=2, checkpoint_interval=10) as seg:
+        resumed = seg.round_robin(workload(rows), 3, previous=previous)
+        assert list(resumed['time_table']) == list(expected['time_table'])
+        assert resumed['metrics'] == expected['metrics']
+        assert seg.round_robin(workload(rows), 3, previous=resumed)['metrics'] == expected['metrics']
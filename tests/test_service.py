@@ -0,0 +1,119 @@
+import asyncio
+import json
+import pytest
+from binary_workload import write_workload
+from scheduler import Scheduler
+from service import SimulationService
+from timeline import in_memory
+from workloads import random_rows, workload
+
+ROWS = random_rows(7, 60)
+PROCESSES = [{'pid': pid, 'arrival': arrival, 'burst': burst, 'priority': priority}
+             for pid, arrival, burst, priority in ROWS]
+
+
+async def request(port, method, path, body=b'', content_type='application/json'):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Type: {content_type}\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body)
+    await writer.drain()
+    data = await reader.read()
+    writer.close()
+    head, _, body = data.partition(b'\r\n\r\n')
+    if b'chunked' in head:
+        chunks = []
+        while True:
+            size, _, body = body.partition(b'\r\n')
+            size = int(size, 16)
+            if not size:
+                break
+            chunks.append(body[:size])
+            body = body[size + 2:]
+        body = b''.join(chunks)
+    return int(head.split()[1]), body
+
+
+def with_service(scenario):
+    async def run():
+        service = SimulationService(workers=1, max_concurrency=2)
+        server = await service.start('127.0.0.1', 0)
+        try:
+            return await scenario(server.sockets[0].getsockname()[1])
+        finally:
+            await service.close()
+    return asyncio.run(run())
+
+
+def test_health():
+    status, body = with_service(lambda port: request(port, 'GET', '/health'))
+    assert status == 200 and json.loads(body)['status'] == 'ok'
+
+
+def test_json_simulation_matches_scheduler():
+    body = json.dumps({'processes': PROCESSES, 'quantum': 3}).encode()
+    status, body = with_service(lambda port: request(port, 'POST', '/simulate', body))
+    assert status == 200
+    loaded = workload(ROWS)
+    for summary in json.loads(body)['results']:
+        args = (3,) if summary['algorithm'] == 'round_robin' else ()
+        expected = getattr(Scheduler(), summary['algorithm'])(loaded, *args)
+        assert summary['metrics'] == json.loads(json.dumps(expected['metrics']))
+        assert summary['context_switches'] == expected['context_switches']
+
+
+def test_binary_body_streams_the_timeline(tmp_path):
+    loaded = workload(ROWS)
+    with open(write_workload(loaded, str(tmp_path / 'trace.bin')), 'rb') as f:
+        data = f.read()
+    status, body = with_service(lambda port: request(
+        port, 'POST', '/simulate?algorithms=round_robin&quantum=3&time_table=1', data, 'application/octet-stream'))
+    assert status == 200
+    lines = [json.loads(line) for line in body.decode('utf-8').splitlines()]
+    expected = Scheduler(timeline=in_memory()).round_robin(loaded, 3)
+    assert lines[0]['algorithm'] == 'round_robin' and lines[0]['quantum'] == 3
+    assert [tuple(entry) for entry in lines[1:]] == list(expected['time_table'])
+
+
+@pytest.mark.parametrize('method, path, body, content_type, status', [
+    ('POST', '/simulate', b'{', 'application/json', 400),
+    ('POST', '/simulate', b'xx', 'application/octet-stream', 400),
+    ('POST', '/simulate', json.dumps({'processes': PROCESSES, 'algorithms': ['foo']}).encode(),
+     'application/json', 400),
+    ('POST', '/simulate', json.dumps({'processes': [{'pid': 'a', 'arrival': 0, 'burst': 0}]}).encode(),
+     'application/json', 400),
+    ('GET', '/simulate', b'', 'application/json', 405),
+    ('GET', '/nope', b'', 'application/json', 404)
+])
+def test_bad_requests_get_error_status(method, path, body, content_type, status):
+    result = with_service(lambda port: request(port, method, path, body, content_type))
+    assert result[0] == status and 'error' in json.loads(result[1])
+
+
+def test_batch_reports_errors_per_request():
+    specs = [{'processes': PROCESSES[:5], 'algorithms': ['fcfs'], 'time_table': True},
+             {'columns': {'pid': ['a'], 'arrival': [0], 'burst': [-1]}},
+             {'processes': PROCESSES, 'algorithms': 'mlfq'}]
+    status, body = with_service(lambda port: request(port, 'POST', '/batch', json.dumps({'requests': specs}).encode()))
+    assert status == 200
+    first, second, third = json.loads(body)['results']
+    expected = Scheduler().fcfs(workload(ROWS[:5]))
+    assert [tuple(entry) for entry in first['results'][0]['time_table']] == list(expected['time_table'])
+    assert 'error' in second
+    assert third['results'][0]['algorithm'] == 'mlfq'
+
+
+def test_batch_removes_timelines_when_a_request_fails(tmp_path, monkeypatch):
+    service = SimulationService()
+    directories = [tmp_path / 'a', tmp_path / 'b']
+    for directory in directories:
+        directory.mkdir()
+
+    async def run_spec(spec):
+        if spec == 'boom':
+            raise RuntimeError(spec)
+        return [{'algorithm': 'fcfs'}], str(tmp_path / spec)
+
+    monkeypatch.setattr(service, '_run_spec', run_spec)
+    with pytest.raises(RuntimeError):
+        asyncio.run(service._batch(['a', 'boom', 'b']))
+    assert not any(directory.exists() for directory in directories)
@@ -0,0 +1,69 @@
+import pytest
+from scheduler import Scheduler
+from smp import SMPScheduler
+from workloads import ALGORITHMS, coalesce, process_rows, random_rows, workload
+
+CONFIGS = [
+    {'queue': 'global'},
+    {'queue': 'global', 'affinity': True, 'migration_cost': 2},
+    {'queue': 'per_core'},
+    {'queue': 'per_core', 'work_stealing': False},
+    {'queue': 'per_core', 'affinity': True, 'migration_cost': 1}
+]
+
+
+@pytest.mark.parametrize('queue', ['global', 'per_core'])
+@pytest.mark.parametrize('method_name, args', ALGORITHMS)
+@pytest.mark.parametrize('seed', range(30))
+def test_single_cpu_matches_scheduler(queue, method_name, args, seed):
+    loaded = workload(random_rows(seed, spread=3, max_burst=15, levels=3))
+    expected = getattr(Scheduler(), method_name)(loaded, *args)
+    results = getattr(SMPScheduler(1, queue=queue), method_name)(loaded, *args)
+    assert process_rows(results) == process_rows(expected)
+    assert coalesce(list(results['time_table'])) == coalesce(list(expected['time_table']))
+    assert results['context_switches'] == expected['context_switches']
+    assert results['total_time'] == expected['total_time']
+    assert results['metrics'] == expected['metrics']
+
+
+@pytest.mark.parametrize('config', CONFIGS, ids=lambda config: '-'.join(map(str, config.values())))
+@pytest.mark.parametrize('cpus', [2, 3, 8])
+@pytest.mark.parametrize('method_name, args', ALGORITHMS)
+@pytest.mark.parametrize('seed', range(10))
+def test_multicore_invariants(config, cpus, method_name, args, seed):
+    rows = random_rows(seed, 50, max_burst=15, levels=3)
+    results = getattr(SMPScheduler(cpus, **config), method_name)(workload(rows), *args)
+
+    spans = {}
+    busy = 0
+    for table in results['core_time_tables']:
+        end = 0
+        for start, pid, duration in table:
+            assert start >= end and duration > 0
+            end = start + duration
+            if pid != 'IDLE':
+                spans.setdefault(pid, []).append((start, end))
+                busy += duration
+        assert end <= results['total_time']
+
+    for p in results['processes']:
+        own = sorted(spans[p.pid])
+        assert all(a[1] <= b[0] for a, b in zip(own, own[1:]))
+        assert own[0][0] >= p.arrival and own[-1][1] == p.completion_time
+    extra = results['migrations'] * config.get('migration_cost', 0)
+    assert busy == sum(row[2] for row in rows) + extra
+    assert results['total_time'] == max(p.completion_time for p in results['processes'])
+
+
+def test_options_without_smp_support_are_rejected():
+    loaded = workload(random_rows(1, 10))
+    smp = SMPScheduler(2)
+    with pytest.raises(ValueError):
+        smp.priority_preemptive(loaded, aging_interval=5)
+    with pytest.raises(ValueError):
+        smp.round_robin(loaded, 0)
+    with pytest.raises(ValueError):
+        smp.mlfq(loaded)
+    with pytest.raises(ValueError):
+        smp.cfs(loaded)
+    assert smp.fcfs(loaded, previous=smp.fcfs(loaded))['metrics'] == smp.fcfs(loaded)['metrics']
@@ -0,0 +1,40 @@
+import pytest
+from scheduler import Scheduler
+from sweep import pareto_front, parse_values, sweep_round_robin
+from workloads import random_rows, workload
+
+
+def test_surface_matches_direct_runs():
+    loaded = workload(random_rows(8, 60))
+    quanta = [1, 2, 4, 8]
+    switch_times = [0.001, 0.5]
+    sweep = sweep_round_robin(loaded, quanta, switch_times, workers=2)
+    assert len(sweep['surface']) == len(quanta) * len(switch_times)
+    for row in sweep['surface']:
+        scheduler = Scheduler(row['context_switch_time'])
+        results = scheduler.round_robin(loaded, row['quantum'])
+        assert row['avg_wait'] == results['metrics']['avg_wait']
+        assert row['context_switches'] == results['context_switches']
+        assert row['cpu_efficiency'] == scheduler.calculate_cpu_efficiency(
+            results['processes'], results['total_time'], results['context_switches'])
+    assert sweep == sweep_round_robin(loaded, quanta, switch_times, workers=1)
+
+
+def test_pareto_front_keeps_only_undominated_rows():
+    rows = [
+        {'avg_wait': 1, 'max_turnaround': 5, 'cpu_efficiency': 90},
+        {'avg_wait': 2, 'max_turnaround': 4, 'cpu_efficiency': 90},
+        {'avg_wait': 2, 'max_turnaround': 5, 'cpu_efficiency': 80},
+        {'avg_wait': 1, 'max_turnaround': 5, 'cpu_efficiency': 90}
+    ]
+    assert pareto_front(rows) == rows[:2]
+
+
+def test_parse_values():
+    assert parse_values('1:4', int) == [1, 2, 3, 4]
+    assert parse_values('0:1:0.25', float) == [0, 0.25, 0.5, 0.75, 1]
+    assert parse_values('3,5,9', int) == [3, 5, 9]
+    with pytest.raises(ValueError):
+        parse_values('1:4:0', int)
+    with pytest.raises(ValueError):
+        sweep_round_robin(workload(random_rows(1, 5)), [], [0.001])
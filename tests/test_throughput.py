@@ -0,0 +1,42 @@
+import random
+import pytest
+from scheduler import CompletionCurve, Scheduler
+from workloads import random_rows, workload
+
+
+def brute_completed(times, t):
+    return sum(1 for time in times if time <= t)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_curve_matches_brute_count(seed):
+    rnd = random.Random(seed)
+    times = [rnd.randint(0, 60) for _ in range(rnd.randint(0, 50))]
+    curve = CompletionCurve(times)
+    points = sorted(rnd.sample(range(-5, 70), 12))
+    assert curve.throughput(points) == {t: brute_completed(times, t) for t in points}
+    assert all(curve.completed_by(t) == brute_completed(times, t) for t in range(-1, 65))
+    assert curve.steps() == sorted({(t, brute_completed(times, t)) for t in times})
+
+    window = rnd.choice([1, 3, 7.5])
+    for start, rate in curve.rates(window):
+        assert rate == (brute_completed(times, start + window) - brute_completed(times, start)) / window
+    if times:
+        assert curve.rates(window)[-1][0] + window >= max(times)
+
+
+def test_report_uses_scheduler_results():
+    loaded = workload(random_rows(11, 60))
+    scheduler = Scheduler()
+    results = scheduler.round_robin(loaded, 3)
+    completions = [p.completion_time for p in results['processes']]
+    report = scheduler.throughput_report(results['processes'], [10, 50, 100], window=20)
+    assert report['throughput'] == {t: brute_completed(completions, t) for t in (10, 50, 100)}
+    assert report['throughput_window'] == 20
+    assert sum(rate * 20 for _, rate in report['throughput_rates']) == len(completions)
+    assert scheduler.calculate_throughput(results['processes'], [50]) == {50: brute_completed(completions, 50)}
+
+
+def test_rates_reject_non_positive_window():
+    with pytest.raises(ValueError):
+        CompletionCurve([1, 2]).rates(0)
@@ -0,0 +1,16 @@
+import pytest
+from scheduler import Scheduler
+from timeline import discard, in_memory
+from workloads import ALGORITHMS, coalesce, process_rows, random_rows, workload
+
+
+@pytest.mark.parametrize('method_name, args', ALGORITHMS)
+def test_timeline_sinks_agree(method_name, args):
+    rows = random_rows(7, 60)
+    plain = getattr(Scheduler(), method_name)(workload(rows), *args)
+    memory = getattr(Scheduler(timeline=in_memory()), method_name)(workload(rows), *args)
+    dropped = getattr(Scheduler(timeline=discard()), method_name)(workload(rows), *args)
+    assert list(memory['time_table']) == coalesce(list(plain['time_table']))
+    assert list(dropped['time_table']) == []
+    assert process_rows(memory) == process_rows(plain) == process_rows(dropped)
+    assert memory['context_switches'] == plain['context_switches'] == dropped['context_switches']
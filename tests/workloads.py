@@ -0,0 +1,53 @@
+import os
+import random
+from process import Workload
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+ALGORITHMS = [
+    ('fcfs', ()),
+    ('sjf_nonpreemptive', ()),
+    ('sjf_preemptive', ()),
+    ('round_robin', (3,)),
+    ('priority_nonpreemptive', ()),
+    ('priority_preemptive', ())
+]
+
+OLD_METRICS = ('avg_wait', 'avg_turnaround', 'max_wait', 'max_turnaround', 'total_wait', 'total_turnaround')
+
+
+def random_rows(seed, n=None, spread=3, max_burst=12, levels=4):
+    rnd = random.Random(seed)
+    if n is None:
+        n = rnd.randint(0, 40)
+    return [(f"P{i:03}", rnd.randint(0, n * spread), rnd.randint(1, max_burst), rnd.randint(1, levels))
+            for i in range(n)]
+
+
+def bursty_rows(seed, n):
+    rnd = random.Random(seed)
+    rows = []
+    t = 0
+    for i in range(n):
+        t += rnd.choice([0, 0, 1, 2, 3, 5, 20, 40])
+        rows.append((f"P{i}", t, rnd.randint(1, 12), rnd.randint(1, 3)))
+    return rows
+
+
+def workload(rows):
+    return Workload([r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows], [r[3] for r in rows])
+
+
+def coalesce(time_table):
+    out = []
+    for start, pid, duration in time_table:
+        if out and out[-1][1] == pid and out[-1][0] + out[-1][2] == start:
+            out[-1] = (out[-1][0], pid, out[-1][2] + duration)
+        else:
+            out.append((start, pid, duration))
+    return out
+
+
+def process_rows(results):
+    return sorted((p.pid, p.start_time, p.completion_time, p.turnaround_time, p.waiting_time, p.response_time)
+                  for p in results['processes'])
@@ -1,31 +1,33 @@
 import threading
 import time
 from queue import Queue
+from scheduler import DEFAULT_TIME_POINTS
 
 class ThreadRunner:
-    def __init__(self, scheduler, processes, case_name, output_dir):
+    def __init__(self, scheduler, processes, case_name, output_dir, time_points=DEFAULT_TIME_POINTS,
+                 throughput_window=None):
         self.scheduler = scheduler
         self.processes = processes
         self.case_name = case_name
         self.output_dir = output_dir
+        self.time_points = time_points
+        self.throughput_window = throughput_window
         self.results_queue = Queue()
         self.threads = []
         
     def run_algorithm_thread(self, algorithm_name, algorithm_func, *args):
         try:
-            self.scheduler.context_switches = 0
-            
             start_time = time.time()
             results = algorithm_func(*args)
             end_time = time.time()
             
-            time_points = [50, 100, 150, 200]
-            results['throughput'] = self.scheduler.calculate_throughput(
-                results['processes'], time_points
-            )
+            results.update(self.scheduler.throughput_report(
+                results['processes'], self.time_points, self.throughput_window
+            ))
             
             results['cpu_efficiency'] = self.scheduler.calculate_cpu_efficiency(
-                results['processes'], results['total_time']
+                results['processes'], results['total_time'],
+                results['context_switches']
             )
             
             results['execution_time'] = end_time - start_time
@@ -60,7 +62,6 @@ class ThreadRunner:
             )
             self.threads.append(thread)
             thread.start()
-            time.sleep(0.01)
         
         for thread in self.threads:
             thread.join()
@@ -0,0 +1,112 @@
+import os
+
+
+class Timeline:
+    def __init__(self):
+        self.pending = None
+        self.count = 0
+
+    def append(self, entry):
+        pending = self.pending
+        if pending is not None:
+            start, pid, duration = pending
+            if entry[1] == pid and start + duration == entry[0]:
+                self.pending = (start, pid, duration + entry[2])
+                return
+            self._emit(pending)
+            self.count += 1
+        self.pending = entry
+
+    def extend(self, entries):
+        for entry in entries:
+            self.append(entry)
+
+    def close(self):
+        if self.pending is not None:
+            self._emit(self.pending)
+            self.count += 1
+            self.pending = None
+
+    def __len__(self):
+        return self.count + (self.pending is not None)
+
+    def _emit(self, entry):
+        raise NotImplementedError
+
+
+class NullTimeline(Timeline):
+    def _emit(self, entry):
+        pass
+
+    def __iter__(self):
+        return iter(())
+
+
+class MemoryTimeline(Timeline):
+    def __init__(self):
+        super().__init__()
+        self.entries = []
+
+    def _emit(self, entry):
+        self.entries.append(entry)
+
+    def __iter__(self):
+        yield from self.entries
+        if self.pending is not None:
+            yield self.pending
+
+
+def _split_line(line):
+    start, rest = line.rstrip('\n').split(',', 1)
+    pid, duration = rest.rsplit(',', 1)
+    return start, pid, duration
+
+
+def _parse_time(value):
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+class FileTimeline(Timeline):
+    def __init__(self, path, buffer_size=1 << 20):
+        super().__init__()
+        self.path = path
+        self.file = open(path, 'w', encoding='utf-8', buffering=buffer_size)
+
+    def _emit(self, entry):
+        start, pid, duration = entry
+        self.file.write(f"{start},{pid},{duration}\n")
+
+    def close(self):
+        super().close()
+        if not self.file.closed:
+            self.file.close()
+
+    def __iter__(self):
+        if not self.file.closed:
+            self.file.flush()
+        yield from read_timeline(self.path)
+        if self.pending is not None:
+            yield self.pending
+
+
+def read_timeline(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            start, pid, duration = _split_line(line)
+            yield (_parse_time(start), pid, _parse_time(duration))
+
+
+def discard():
+    return lambda algorithm: NullTimeline()
+
+
+def in_memory():
+    return lambda algorithm: MemoryTimeline()
+
+
+def to_directory(directory):
+    os.makedirs(directory, exist_ok=True)
+    return lambda algorithm: FileTimeline(os.path.join(directory, f"{algorithm}_timeline.csv"))
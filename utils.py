@@ -1,104 +1,119 @@
 import csv
 import os
+from array import array
+from operator import itemgetter
+from process import Workload
+from result_writer import export_paths, export_results, write_text
 
-def read_csv(file_path):
-    processes = []
+PRIORITY_LEVELS = {'high': 1, 'normal': 2, 'low': 3}
+
+COLUMN_ALIASES = {
+    'pid': ('PID', 'Process_ID'),
+    'arrival': ('Arrival', 'Arrival_Time'),
+    'burst': ('Burst', 'CPU_Burst_Time'),
+    'priority': ('Priority',)
+}
+
+def parse_priority(value):
+    level = PRIORITY_LEVELS.get(value.strip().lower())
+    return level if level is not None else int(value)
+
+def _column_index(header, field):
+    for name in COLUMN_ALIASES[field]:
+        if name in header:
+            return header.index(name)
+    return None
+
+def compile_row_parser(header):
+    header = [name.strip() for name in header]
+    indices = {field: _column_index(header, field) for field in COLUMN_ALIASES}
+    
+    for field in ('pid', 'arrival', 'burst'):
+        if indices[field] is None:
+            raise KeyError(COLUMN_ALIASES[field][0])
+    
+    if indices['priority'] is None:
+        fields = itemgetter(indices['pid'], indices['arrival'], indices['burst'])
+        
+        def parse(row):
+            pid, arrival, burst = fields(row)
+            return pid, int(arrival), int(burst), 0
+    else:
+        fields = itemgetter(indices['pid'], indices['arrival'], indices['burst'], indices['priority'])
+        
+        def parse(row):
+            pid, arrival, burst, priority = fields(row)
+            return pid, int(arrival), int(burst), parse_priority(priority)
+    
+    return parse
+
+def iter_csv(file_path):
+    with open(file_path, 'r', newline='') as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+        parse = compile_row_parser(header)
+        for row in reader:
+            if row:
+                yield parse(row)
+
+def load_workload(file_path):
+    pids = []
+    arrivals = array('q')
+    bursts = array('q')
+    priorities = array('q')
     
     try:
-        with open(file_path, 'r') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                pid = row['PID']
-                arrival = int(row['Arrival'])
-                burst = int(row['Burst'])
-                priority = int(row.get('Priority', 0))
-                
-                processes.append({
-                    'pid': pid,
-                    'arrival': arrival,
-                    'burst': burst,
-                    'priority': priority
-                })
+        for pid, arrival, burst, priority in iter_csv(file_path):
+            pids.append(pid)
+            arrivals.append(arrival)
+            bursts.append(burst)
+            priorities.append(priority)
     except FileNotFoundError:
         print(f"Hata: {file_path} dosyası bulunamadı!")
-        return []
+        return None
     except KeyError as e:
         print(f"Hata: CSV dosyasında gerekli sütun eksik: {e}")
-        return []
+        return None
     
-    return processes
+    return Workload(pids, arrivals, bursts, priorities)
 
 def create_output_dir(case_name):
     dir_path = f"outputs/{case_name}"
     os.makedirs(dir_path, exist_ok=True)
     return dir_path
 
-def save_results(results, algorithm_name, case_name, output_dir):
+def _output_stamp(paths, cache_key):
+    stamp = [cache_key]
+    for path in paths:
+        stat = os.stat(path)
+        stamp.append(f"{path} {stat.st_size} {stat.st_mtime_ns}")
+    return '\n'.join(stamp)
+
+def _output_current(paths, stamp_path, cache_key):
+    try:
+        with open(stamp_path, 'r', encoding='utf-8') as f:
+            return f.read() == _output_stamp(paths, cache_key)
+    except FileNotFoundError:
+        return False
+
+def save_results(results, algorithm_name, case_name, output_dir, export=()):
     file_path = f"{output_dir}/{algorithm_name}.txt"
+    stamp_path = f"{output_dir}/.{algorithm_name}.key"
+    cache_key = results.get('cache_key')
+    paths = [file_path] + export_paths(output_dir, algorithm_name, export)
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(f"=== {algorithm_name.upper()} - {case_name.upper()} ===\n\n")
-        
-        f.write("Zaman Tablosu:\n")
-        f.write("-" * 50 + "\n")
-        for start, pid, duration in results['time_table']:
-            f.write(f"[{start:3}] --- {pid:6} --- [{start+duration:3}]\n")
-        f.write("-" * 50 + "\n\n")
-        
-        metrics = results['metrics']
-        f.write("METRİKLER:\n")
-        f.write("-" * 50 + "\n")
-        f.write(f"Ortalama Bekleme Süresi: {metrics['avg_wait']:.2f}\n")
-        f.write(f"Maksimum Bekleme Süresi: {metrics['max_wait']:.2f}\n")
-        f.write(f"Ortalama Tamamlanma Süresi: {metrics['avg_turnaround']:.2f}\n")
-        f.write(f"Maksimum Tamamlanma Süresi: {metrics['max_turnaround']:.2f}\n")
-        f.write(f"Toplam Bekleme Süresi: {metrics['total_wait']:.2f}\n")
-        f.write(f"Toplam Tamamlanma Süresi: {metrics['total_turnaround']:.2f}\n")
-        f.write("-" * 50 + "\n\n")
-        
-        time_points = [50, 100, 150, 200]
-        throughput = results.get('throughput', {})
-        if not throughput:
-            from scheduler import Scheduler
-            scheduler = Scheduler()
-            throughput = scheduler.calculate_throughput(results['processes'], time_points)
-        
-        f.write("THROUGHPUT:\n")
-        f.write("-" * 50 + "\n")
-        for T in time_points:
-            count = throughput.get(T, 0)
-            f.write(f"T={T}: {count} süreç tamamlandı\n")
-        f.write("-" * 50 + "\n\n")
-        
-        efficiency = results.get('cpu_efficiency', 0)
-        if efficiency == 0:
-            efficiency = scheduler.calculate_cpu_efficiency(
-                results['processes'], 
-                results['total_time']
-            )
-        
-        f.write("CPU VERİMLİLİĞİ:\n")
-        f.write("-" * 50 + "\n")
-        f.write(f"Ortalama CPU Verimliliği: {efficiency:.2f}%\n")
-        f.write(f"Toplam Bağlam Değiştirme Sayısı: {results['context_switches']}\n")
-        f.write("-" * 50 + "\n\n")
-        
-        f.write("SÜREÇ DETAYLARI:\n")
-        f.write("-" * 80 + "\n")
-        f.write("PID | Arrival | Burst | Priority | Start | Completion | Turnaround | Waiting\n")
-        f.write("-" * 80 + "\n")
-        
-        for process in sorted(results['processes'], key=lambda x: x.pid):
-            f.write(f"{process.pid:3} | "
-                   f"{process.arrival:7} | "
-                   f"{process.burst:5} | "
-                   f"{process.priority:8} | "
-                   f"{process.start_time if process.start_time != -1 else 'N/A':5} | "
-                   f"{process.completion_time:10} | "
-                   f"{process.turnaround_time:10} | "
-                   f"{process.waiting_time:7}\n")
-        
-        f.write("-" * 80 + "\n")
+    if cache_key is not None and _output_current(paths, stamp_path, cache_key):
+        print(f"Sonuçlar güncel, yeniden yazılmadı: {file_path}")
+        return file_path
+    
+    write_text(results, algorithm_name, case_name, file_path)
+    export_results(results, output_dir, algorithm_name, export)
+    
+    if cache_key is not None:
+        with open(stamp_path, 'w', encoding='utf-8') as f:
+            f.write(_output_stamp(paths, cache_key))
     
     print(f"Sonuçlar kaydedildi: {file_path}")
     return file_path
\ No newline at end of file